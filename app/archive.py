@@ -0,0 +1,200 @@
+"""
+Move rows from closed academic terms out of the hot tables.
+
+``matches``, ``events`` and ``event_attendees`` only grow, but nearly every
+read is about the current term. ``archive_closed_terms`` moves every match
+and event dated before the end of the latest closed term, and the
+attendees of those events, into ``*_archive`` tables with the same
+columns, ``BATCH_SIZE`` rows per transaction.
+
+Reads go through ``source``, which returns the hot model when a query only
+needs rows newer than anything archived, and otherwise an alias over
+``hot UNION ALL archive`` that filters and orders like the model itself.
+Derived data (standings, engagement, attendance counts) is unaffected by a
+move: it is maintained on flush, and rows are moved with bulk statements
+that don't flush.
+
+Archived rows are read-only: routes that change a row look it up with
+``writable``, which answers 409 for one that has been archived.
+
+Run ``python -m app.archive`` (nightly, say), or ``POST /_internal/archive/run``,
+to archive whatever has closed.
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, event, func, insert, select, union_all
+from sqlalchemy.orm import Session, aliased
+
+from . import models
+
+BATCH_SIZE = 500
+
+ARCHIVES = {
+    models.Match: models.MatchArchive,
+    models.Event: models.EventArchive,
+    models.EventAttendee: models.EventAttendeeArchive,
+}
+
+# attendees move with their event, so the events archive dates them too
+_DATED_BY = {
+    models.Match: models.MatchArchive,
+    models.Event: models.EventArchive,
+    models.EventAttendee: models.EventArchive,
+}
+
+
+def archived_through(db: Session, model) -> Optional[datetime]:
+    """Date of the newest archived ``model`` row, or ``None`` if none are."""
+    # read once per transaction (so about once per request), not per
+    # process: the archive job runs in its own process, so no worker
+    # would see its moves
+    archive = _DATED_BY[model]
+    known = db.info.setdefault("archived_through", {})
+    if archive not in known:
+        known[archive] = db.query(func.max(archive.date_time)).scalar()
+    return known[archive]
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _forget_archived_through(session):
+    session.info.pop("archived_through", None)
+
+
+def source(db: Session, model, since: Optional[datetime] = None):
+    """
+    What to query for ``model`` rows dated ``since`` or later (any date if
+    ``None``): the model itself, or an alias of it over the hot and archive
+    tables if some of those rows may have been archived.
+    """
+    through = archived_through(db, model)
+    if through is None or (since is not None and since > through):
+        return model
+
+    hot, cold = model.__table__, ARCHIVES[model].__table__
+    rows = union_all(
+        select(hot),
+        select(*(cold.c[column.name] for column in hot.columns)),
+    ).subquery(f"{hot.name}_all")
+    return aliased(model, rows)
+
+
+def get(db: Session, model, obj_id):
+    """``model`` row ``obj_id``, from the hot table or else the archive."""
+    return db.get(model, obj_id) or db.get(ARCHIVES[model], obj_id)
+
+
+def writable(db: Session, model, obj_id, name: Optional[str] = None):
+    """
+    ``model`` row ``obj_id`` for a route that changes it. Raises 404 if
+    there is no such row, and 409 if it has been archived.
+    """
+    name = name or model.__name__
+    row = db.get(model, obj_id)
+    if row is None:
+        if db.get(ARCHIVES[model], obj_id) is not None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"{name} is archived"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{name} not found"
+        )
+    return row
+
+
+def newest_first(
+    db: Session,
+    model,
+    criteria: Callable[[object], Iterable],
+    skip: int,
+    limit: int,
+) -> List:
+    """
+    One page of ``model`` rows, newest first. ``criteria(entity)`` returns
+    the filters, written against whichever entity is being queried.
+
+    The page is read from the hot table alone and only re-read with the
+    archive if it runs back past the newest archived row, so recent pages
+    never touch the archive.
+    """
+    pk = model.__mapper__.primary_key[0].name
+
+    def page(entity):
+        # the key breaks date ties, so pages don't skip or repeat rows
+        return db.query(entity).filter(*criteria(entity)).order_by(
+            entity.date_time.desc(), getattr(entity, pk).desc()
+        ).offset(skip).limit(limit).all()
+
+    rows = page(model)
+    through = archived_through(db, model)
+    if through is None or (len(rows) == limit and rows[-1].date_time > through):
+        return rows
+    return page(source(db, model))
+
+
+# --------------------------------------------------------------------------
+# Moving rows
+# --------------------------------------------------------------------------
+def _copy(db: Session, model, criterion) -> None:
+    hot = model.__table__
+    db.execute(insert(ARCHIVES[model]).from_select(
+        [column.name for column in hot.columns], select(hot).where(criterion)
+    ))
+
+
+def _delete(db: Session, model, criterion) -> int:
+    return db.query(model).filter(criterion).delete(synchronize_session=False)
+
+
+def _move(db: Session, model, criterion, batch_size: int, moved: Dict[str, int], dependents=()) -> None:
+    """Move ``model`` rows matching ``criterion``, and their ``dependents``, in batches."""
+    pk = model.__mapper__.primary_key[0]
+    while True:
+        ids = [row_id for row_id, in db.query(pk).filter(criterion).order_by(pk).limit(batch_size)]
+        if not ids:
+            return
+        # parents go into the archive first and come out of the hot table last
+        _copy(db, model, pk.in_(ids))
+        for child, key in dependents:
+            _copy(db, child, key.in_(ids))
+        for child, key in dependents:
+            moved[child.__tablename__] += _delete(db, child, key.in_(ids))
+        moved[model.__tablename__] += _delete(db, model, pk.in_(ids))
+        db.commit()
+
+
+def archive_closed_terms(
+    db: Session, now: Optional[datetime] = None, batch_size: int = BATCH_SIZE
+) -> Dict[str, int]:
+    """Archive everything dated before the end of the latest closed term; returns rows moved per table."""
+    moved = {model.__tablename__: 0 for model in ARCHIVES}
+    # terms are half-open (app.terms): a term ending at ``cutoff`` is over
+    # once ``cutoff`` is reached, and rows dated ``cutoff`` aren't in it
+    cutoff = db.query(func.max(models.AcademicTerm.end_date)).filter(
+        models.AcademicTerm.end_date <= (now or datetime.utcnow())
+    ).scalar()
+    if cutoff is None:
+        return moved
+
+    _move(db, models.Match, models.Match.date_time < cutoff, batch_size, moved)
+    # series stay: their occurrences are expanded from the row (app.recurrence)
+    one_off = models.Event.repeat_every_days.is_(None)
+    _move(db, models.Event, and_(one_off, models.Event.date_time < cutoff), batch_size, moved,
+          dependents=[(models.EventAttendee, models.EventAttendee.event_id)])
+    return moved
+
+
+if __name__ == "__main__":
+    from .database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        for table, count in archive_closed_terms(db).items():
+            print(f"archived {count} {table} rows")
+    finally:
+        db.close()
@@ -0,0 +1,59 @@
+"""
+Denormalised attendee counts.
+
+``events.attendance`` mirrors ``COUNT(*)`` over ``event_attendees`` for the
+event, so listings can show live counts without a per-row subquery. The
+attendee routes adjust it with a single ``UPDATE ... SET attendance =
+attendance + n`` in the same transaction as the insert/delete, which stays
+correct under concurrent sign-ups without reading the current value first.
+
+Run ``python -m app.attendance`` to recompute every counter from
+``event_attendees`` (e.g. after bulk imports or manual SQL edits).
+"""
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from . import models
+
+
+def adjust(db: Session, event_id: int, delta: int) -> None:
+    """Atomically add ``delta`` to one event's counter (not committed)."""
+    db.execute(
+        update(models.Event)
+        .where(models.Event.event_id == event_id)
+        .values(attendance=models.Event.attendance + delta)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def reconcile(db: Session) -> int:
+    """Recompute every counter from ``event_attendees``; returns events corrected."""
+    actual = (
+        select(func.count())
+        .where(models.EventAttendee.event_id == models.Event.event_id)
+        .correlate(models.Event)
+        .scalar_subquery()
+    )
+    drifted = db.query(models.Event.event_id).filter(
+        models.Event.attendance != actual
+    ).count()
+    if drifted:
+        db.execute(
+            update(models.Event)
+            .values(attendance=actual)
+            .execution_options(synchronize_session=False)
+        )
+    db.commit()
+    db.expire_all()
+    return drifted
+
+
+if __name__ == "__main__":
+    from .database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        print(f"reconciled {reconcile(db)} event attendance counters")
+    finally:
+        db.close()
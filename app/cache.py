@@ -0,0 +1,564 @@
+"""
+In-process caches for hot read routes.
+
+Every cache declares the tables its entries are built from. Writes are
+tracked on the SQLAlchemy session and, once the session commits, every cache
+that depends on a written table is invalidated. Caches live per process, so
+each uvicorn worker keeps (and invalidates) its own copy; writes made
+elsewhere (another worker, ``scripts/``, a migration) are only picked up
+when an entry outlives its ``ttl``, which every cache has.
+
+Cached responses carry an ``Age`` header; stale ones (served while a rebuild
+is in flight, or while the database is unreachable) also carry ``Warning``.
+"""
+
+import abc
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from itertools import chain
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, exc, func
+from sqlalchemy.orm import Session
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+# How long the last known good value may be served while the database is
+# unreachable (e.g. during a MySQL restart or failover)
+MAX_STALENESS = timedelta(
+    seconds=float(os.getenv("CACHE_MAX_STALENESS_SECONDS", "21600"))
+)
+
+# Errors that mean "the database is down", not "the query is wrong"
+DB_UNAVAILABLE = (exc.OperationalError, exc.InterfaceError, exc.TimeoutError)
+
+STALE = '110 - "Response is Stale"'
+REVALIDATION_FAILED = '111 - "Revalidation Failed"'
+
+# name -> cache, so writes can find every cache that depends on a table
+_registry: Dict[str, "_Cache"] = {}
+
+
+class CacheStats:
+    """Counters reported by ``GET /_internal/cache``."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.stale_served = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.builds = 0
+        self.build_seconds = 0.0
+
+    @property
+    def avg_build_ms(self) -> Optional[float]:
+        if not self.builds:
+            return None
+        return self.build_seconds / self.builds * 1000
+
+
+class _Cache(abc.ABC):
+    kind = "cache"
+
+    def __init__(self, name: str, tables: Iterable[str], route: Optional[str] = None):
+        self.name = name
+        self.tables = set(tables)
+        self.route = route
+        self.stats = CacheStats()
+        self._generation = 0
+        self._lock = threading.Lock()
+        _registry[name] = self
+
+    def _timed(self, build: Callable[[], Any]) -> Any:
+        started = time.perf_counter()
+        try:
+            return build()
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.stats.builds += 1
+                self.stats.build_seconds += elapsed
+
+    @abc.abstractmethod
+    def entry_count(self) -> int:
+        ...
+
+    @abc.abstractmethod
+    def memory_bytes(self) -> int:
+        ...
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        ...
+
+    def on_write(self) -> None:
+        with self._lock:
+            self.stats.invalidations += 1
+        self.clear()
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "generation", "built_at")
+
+    def __init__(self, value: Any, expires_at: Optional[datetime], generation: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.generation = generation
+        self.built_at = time.monotonic()
+
+    def is_fresh(self, now: datetime, generation: int, ttl: float) -> bool:
+        return (
+            generation == self.generation
+            and (self.expires_at is None or now < self.expires_at)
+            and self.age() < ttl
+        )
+
+    def age(self) -> float:
+        return time.monotonic() - self.built_at
+
+
+class BoundaryCache(_Cache):
+    """
+    Cache for routes whose result only changes at a known point in time.
+
+    ``build`` returns ``(value, expires_at)``. ``expires_at`` is the next
+    timestamp at which the result would change (e.g. the start of the next
+    upcoming match) or ``None`` if only a write can change it. Either way
+    an entry is rebuilt after ``ttl`` seconds, bounding how long a write
+    made by another process goes unseen.
+
+    Expired or invalidated entries are kept as the last known good value:
+    while one request rebuilds a key, concurrent requests for it get the
+    stale copy, and if the rebuild fails because the database is down the
+    stale copy is served for up to ``MAX_STALENESS``.
+    """
+
+    kind = "boundary"
+
+    def __init__(
+        self,
+        name: str,
+        tables: Iterable[str],
+        route: Optional[str] = None,
+        maxsize: int = 256,
+        ttl: float = 300.0,
+    ):
+        super().__init__(name, tables, route)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._building: set = set()
+
+    def get_or_build(
+        self,
+        key: Hashable,
+        now: datetime,
+        build: Callable[[], Tuple[Any, Optional[datetime]]],
+        response: Optional[Response] = None,
+    ) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            generation = self._generation
+            if entry is not None and entry.is_fresh(now, generation, self.ttl):
+                self.stats.hits += 1
+                _annotate(response, entry)
+                return entry.value
+            if entry is not None and key in self._building:
+                # someone is already rebuilding this key; don't pile on
+                self.stats.stale_served += 1
+                _annotate(response, entry, STALE)
+                return entry.value
+            self.stats.misses += 1
+            self._building.add(key)
+
+        try:
+            value, expires_at = self._timed(build)
+        except DB_UNAVAILABLE:
+            if entry is None or entry.age() > MAX_STALENESS.total_seconds():
+                raise
+            logger.warning("database unavailable, serving stale %s", self.name)
+            with self._lock:
+                self.stats.stale_served += 1
+            _annotate(response, entry, REVALIDATION_FAILED)
+            return entry.value
+        finally:
+            with self._lock:
+                self._building.discard(key)
+
+        # a write committed while we were building; don't keep stale data
+        self.put(key, value, expires_at, generation)
+        return value
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: Hashable, now: datetime) -> Any:
+        """Fresh cached value for ``key``, or ``None``; for batch builders."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.is_fresh(now, self._generation, self.ttl):
+                self.stats.hits += 1
+                return entry.value
+            self.stats.misses += 1
+            return None
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        expires_at: Optional[datetime] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Store a value built outside ``get_or_build``.
+
+        Pass the ``generation`` read before building so a value computed
+        across a write is dropped rather than cached.
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries.pop(key, None)
+            self._entries[key] = _Entry(value, expires_at, self._generation)
+            if len(self._entries) > self.maxsize:
+                del self._entries[next(iter(self._entries))]
+                self.stats.evictions += 1
+
+    def entry_count(self) -> int:
+        return len(self._entries)
+
+    def memory_bytes(self) -> int:
+        with self._lock:
+            values = [entry.value for entry in self._entries.values()]
+        return deep_sizeof(values)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.stats.evictions += len(self._entries)
+            self._entries.clear()
+            self._generation += 1
+
+    def on_write(self) -> None:
+        # keep entries around as last known good; the generation bump
+        # marks them stale
+        with self._lock:
+            self.stats.invalidations += 1
+            self._generation += 1
+
+
+class Snapshot(_Cache):
+    """
+    A single precomputed value (e.g. a page bundle) that is built on the
+    first request and, once built, rebuilt in the background whenever a
+    table it reads is written to, so steady-state reads never touch the
+    database.
+
+    ``build(db)`` returns ``(value, expires_at)`` just like
+    :class:`BoundaryCache` builders. The first build runs on the request's
+    session; background rebuilds open sessions from the ``session_factory``
+    the route passes to :meth:`get` (see ``deps.get_session_factory``).
+    Without one, stale values are rebuilt inline instead. Like a write, an
+    entry older than ``ttl`` seconds counts as stale. A stale value
+    keeps being served while the rebuild runs (or keeps failing) for up to
+    ``MAX_STALENESS``.
+    """
+
+    kind = "snapshot"
+
+    def __init__(
+        self,
+        name: str,
+        tables: Iterable[str],
+        build: Callable[[Session], Tuple[Any, Optional[datetime]]],
+        route: Optional[str] = None,
+        ttl: float = 300.0,
+    ):
+        super().__init__(name, tables, route)
+        self._build = build
+        self.ttl = ttl
+        self._session_factory: Optional[Callable[[], Session]] = None
+        self._entry: Optional[_Entry] = None
+        self._rebuilding = False
+
+    def get(
+        self,
+        db: Session,
+        now: datetime,
+        response: Optional[Response] = None,
+        session_factory: Optional[Callable[[], Session]] = None,
+    ) -> Any:
+        with self._lock:
+            self._session_factory = session_factory
+            entry, generation = self._entry, self._generation
+            fresh = entry is not None and entry.is_fresh(now, generation, self.ttl)
+            servable = (
+                session_factory is not None
+                and entry is not None
+                and entry.age() <= MAX_STALENESS.total_seconds()
+            )
+            if fresh:
+                self.stats.hits += 1
+            elif servable:
+                self.stats.stale_served += 1
+            else:
+                self.stats.misses += 1
+
+        if fresh:
+            _annotate(response, entry)
+            return entry.value
+        if servable:
+            self.refresh_in_background()
+            _annotate(response, entry, STALE)
+            return entry.value
+        # nothing (recent enough) to serve, or nothing to rebuild it with
+        # in the background: build inline on the request's session
+        return self._store(db)
+
+    def warm(self) -> bool:
+        """Build synchronously with a fresh session; failures are only logged."""
+        session_factory = self._session_factory
+        if session_factory is None:
+            return False
+        try:
+            db = session_factory()
+            try:
+                self._store(db)
+            finally:
+                db.close()
+        except Exception:
+            logger.exception("failed to build %s", self.name)
+            return False
+        return True
+
+    def refresh_in_background(self) -> None:
+        with self._lock:
+            # only rebuild what a request has built, with its session factory
+            if self._rebuilding or self._entry is None or self._session_factory is None:
+                return
+            self._rebuilding = True
+        threading.Thread(target=self._rebuild_loop, daemon=True).start()
+
+    def entry_count(self) -> int:
+        return 0 if self._entry is None else 1
+
+    def memory_bytes(self) -> int:
+        entry = self._entry
+        return deep_sizeof(entry.value) if entry is not None else 0
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._entry is not None:
+                self.stats.evictions += 1
+            self._entry = None
+            self._generation += 1
+
+    def on_write(self) -> None:
+        with self._lock:
+            self.stats.invalidations += 1
+            self._generation += 1
+        self.refresh_in_background()
+
+    def _store(self, db: Session) -> Any:
+        with self._lock:
+            generation = self._generation
+        value, expires_at = self._timed(lambda: self._build(db))
+        with self._lock:
+            # if a write landed mid-build the entry is born stale and the
+            # rebuild loop goes around again
+            self._entry = _Entry(value, expires_at, generation)
+        return value
+
+    def _rebuild_loop(self) -> None:
+        try:
+            # keep going while writes (or a flush) land mid-build; give up
+            # on errors and let the next read retry
+            while self.warm():
+                with self._lock:
+                    if self._entry is not None and self._entry.generation == self._generation:
+                        return
+        finally:
+            with self._lock:
+                self._rebuilding = False
+
+
+class NegativeCache(_Cache):
+    """
+    Bounded LRU of keys that were recently looked up and not found.
+
+    Any write to one of ``tables`` forgets every recorded miss. Misses also
+    age out after ``ttl`` seconds, bounding how long a row created by another
+    worker process can be reported missing here.
+    """
+
+    kind = "negative"
+
+    def __init__(
+        self,
+        name: str,
+        tables: Iterable[str],
+        maxsize: int = 10_000,
+        ttl: float = 60.0,
+        route: Optional[str] = None,
+    ):
+        super().__init__(name, tables, route)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._misses: "OrderedDict[Hashable, float]" = OrderedDict()
+
+    def lookup(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Return ``fetch()``, or ``None`` straight away for a known miss."""
+        now = time.monotonic()
+        with self._lock:
+            recorded_at = self._misses.get(key)
+            if recorded_at is not None:
+                if now - recorded_at < self.ttl:
+                    self._misses.move_to_end(key)
+                    self.stats.hits += 1
+                    return None
+                del self._misses[key]
+                self.stats.evictions += 1
+            self.stats.misses += 1
+            generation = self._generation
+
+        found = self._timed(fetch)
+        if found is None:
+            with self._lock:
+                if generation == self._generation:
+                    self._misses[key] = now
+                    if len(self._misses) > self.maxsize:
+                        self._misses.popitem(last=False)
+                        self.stats.evictions += 1
+        return found
+
+    def entry_count(self) -> int:
+        return len(self._misses)
+
+    def memory_bytes(self) -> int:
+        with self._lock:
+            keys = list(self._misses)
+        return deep_sizeof(keys) + sys.getsizeof(self._misses)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.stats.evictions += len(self._misses)
+            self._misses.clear()
+            self._generation += 1
+
+
+def all_caches() -> List[_Cache]:
+    return list(_registry.values())
+
+
+def get_cache(name: str) -> Optional[_Cache]:
+    return _registry.get(name)
+
+
+def unregister(name: str) -> None:
+    """Forget the cache registered as ``name``; it is no longer invalidated or reported."""
+    _registry.pop(name, None)
+
+
+def invalidate(tables: Iterable[str]) -> None:
+    """Notify every cache built from any of ``tables`` that they changed."""
+    tables = set(tables)
+    for cache in all_caches():
+        if cache.tables & tables:
+            cache.on_write()
+
+
+def clear_all() -> None:
+    """Clear every registered cache."""
+    for cache in all_caches():
+        cache.clear()
+
+
+def freeze(schema, rows) -> list:
+    """Copy ORM rows into ``schema`` instances that outlive the session."""
+    return [schema.model_validate(row, from_attributes=True) for row in rows]
+
+
+def _annotate(
+    response: Optional[Response], entry: _Entry, warning: Optional[str] = None
+) -> None:
+    """Set ``Age`` (and ``Warning`` when serving stale) on a cached response."""
+    if response is None:
+        return
+    response.headers["Age"] = str(int(entry.age()))
+    if warning is not None:
+        response.headers["Warning"] = warning
+
+
+def deep_sizeof(obj: Any, _seen: Optional[set] = None) -> int:
+    """Rough recursive ``sys.getsizeof`` for cached values."""
+    seen = set() if _seen is None else _seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif hasattr(obj, "__dict__"):
+        size += deep_sizeof(vars(obj), seen)
+    return size
+
+
+def next_boundary(
+    db: Session, column, now: datetime, *, inclusive: bool = False
+) -> Optional[datetime]:
+    """
+    Earliest value of ``column`` after ``now`` (or at ``now`` when
+    ``inclusive``), i.e. the next moment a time-filtered listing changes.
+    """
+    criterion = column >= now if inclusive else column > now
+    return db.query(func.min(column)).filter(criterion).scalar()
+
+
+def earliest(*candidates: Optional[datetime]) -> Optional[datetime]:
+    """The soonest of several boundaries, ignoring missing ones."""
+    present: List[datetime] = [c for c in candidates if c is not None]
+    return min(present) if present else None
+
+
+def after(moment: Optional[datetime]) -> Optional[datetime]:
+    """The first instant strictly after ``moment`` (for inclusive bounds)."""
+    return moment + timedelta(microseconds=1) if moment is not None else None
+
+
+# --------------------------------------------------------------------------
+# Write tracking: collect written tables on flush, invalidate on commit
+# --------------------------------------------------------------------------
+@event.listens_for(Session, "after_flush")
+def _track_flushed_writes(session, flush_context):
+    written = session.info.setdefault("written_tables", set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        written.add(obj.__table__.name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_writes(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None:
+            written = orm_execute_state.session.info.setdefault("written_tables", set())
+            written.add(mapper.local_table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_written_tables(session):
+    written = session.info.pop("written_tables", None)
+    if written:
+        invalidate(written)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_written_tables(session):
+    session.info.pop("written_tables", None)
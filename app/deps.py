@@ -1,5 +1,8 @@
 from .database import SessionLocal
-from typing import Generator
+from sqlalchemy.orm import Session
+from typing import Callable, Generator, Optional
+from datetime import datetime
+from fastapi import HTTPException, status
 
 def get_db() -> Generator:
     """
@@ -11,3 +14,22 @@ def get_db() -> Generator:
         yield db
     finally:
         db.close()
+
+def get_session_factory() -> Callable[[], Session]:
+    """
+    FastAPI dependency for work that outlives the request, such as
+    background cache rebuilds: how to open a session of its own.
+    """
+    return SessionLocal
+
+def point_in_time(as_of: Optional[datetime] = None, current: bool = False) -> Optional[datetime]:
+    """
+    FastAPI dependency for list routes that can show who held a position
+    at a given moment: ``?as_of=2024-03-01`` or ``?current=true`` (now).
+    """
+    if as_of is not None and current:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Pass either as_of or current, not both"
+        )
+    return datetime.utcnow() if current else as_of
@@ -0,0 +1,161 @@
+"""
+Per-user event attendance counts for the member leaderboard.
+
+``user_engagement`` holds one row per user per academic term plus an
+all-time row (``term_id`` 0), indexed on ``(term_id, events_attended
+DESC, user_id)`` so the top k for a scope is an index walk rather than a
+scan of ``event_attendees``. ``user_id`` breaks ties in the leaderboard
+order, so equal counts read straight off the index without a sort. Rows are kept up to date from the session flush hooks
+below:
+
+    - adding or removing an attendee moves the user's counters by one;
+    - moving or deleting an event recounts its attendees' rows.
+
+Editing academic term dates is not tracked; run ``python -m
+app.engagement`` to rebuild everything from scratch.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Set, Tuple
+
+from sqlalchemy import event, func, inspect
+from sqlalchemy.orm import Session
+
+from . import archive, models, terms
+from .standings import ALL_TIME
+
+
+def _scopes(db: Session, moment: datetime) -> List[int]:
+    term = terms.resolver.term_for(db, moment)
+    return [ALL_TIME] if term is None else [ALL_TIME, term.term_id]
+
+
+def recount(db: Session, user_id: int, term_id: int) -> None:
+    """Recount one user's attendance for one scope."""
+    term = db.get(models.AcademicTerm, term_id) if term_id != ALL_TIME else None
+    since = term.start_date if term else None
+    event = archive.source(db, models.Event, since)
+    attendee = archive.source(db, models.EventAttendee, since)
+    query = db.query(func.count()).select_from(attendee).join(
+        event, event.event_id == attendee.event_id
+    ).filter(attendee.user_id == user_id)
+    if term is not None:
+        query = query.filter(terms.within(event.date_time, term))
+    count = query.scalar()
+
+    row = db.get(models.UserEngagement, (user_id, term_id))
+    if row is None:
+        if not count or db.get(models.User, user_id) is None:
+            return
+        row = models.UserEngagement(user_id=user_id, term_id=term_id)
+        db.add(row)
+    row.events_attended = count
+
+
+def rebuild_all(db: Session) -> int:
+    """Recompute every counter with two grouped queries; returns row count."""
+    db.query(models.UserEngagement).delete()
+    event = archive.source(db, models.Event)
+    attendee = archive.source(db, models.EventAttendee)
+    attended = db.query(
+        attendee.user_id, func.count()
+    ).select_from(attendee).join(
+        event, event.event_id == attendee.event_id
+    )
+    rows = [
+        models.UserEngagement(user_id=user_id, term_id=ALL_TIME, events_attended=count)
+        for user_id, count in attended.group_by(attendee.user_id)
+    ]
+    per_term = attended.add_columns(models.AcademicTerm.term_id).join(
+        models.AcademicTerm, terms.within(event.date_time),
+    ).group_by(attendee.user_id, models.AcademicTerm.term_id)
+    rows += [
+        models.UserEngagement(user_id=user_id, term_id=term_id, events_attended=count)
+        for user_id, count, term_id in per_term
+    ]
+    db.add_all(rows)
+    db.commit()
+    return len(rows)
+
+
+# --------------------------------------------------------------------------
+# Flush hooks: note attendee changes before the flush, apply them after
+# --------------------------------------------------------------------------
+def _attendee_ids(session, event_id: int) -> List[int]:
+    return [user_id for user_id, in session.query(models.EventAttendee.user_id).filter(
+        models.EventAttendee.event_id == event_id
+    )]
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_attendance_changes(session, flush_context, instances):
+    deltas: List[Tuple[int, int, int]] = []
+    touched: Set[Tuple[int, datetime]] = set()
+
+    for obj in session.new:
+        if isinstance(obj, models.EventAttendee):
+            deltas.append((obj.user_id, obj.event_id, +1))
+    with session.no_autoflush:
+        for obj in session.deleted:
+            if isinstance(obj, models.EventAttendee):
+                deltas.append((obj.user_id, obj.event_id, -1))
+            elif isinstance(obj, models.Event):
+                # attendee rows go with the event (ON DELETE CASCADE)
+                touched.update((user_id, obj.date_time) for user_id in _attendee_ids(session, obj.event_id))
+        for obj in session.dirty:
+            if not isinstance(obj, models.Event):
+                continue
+            hist = inspect(obj).attrs["date_time"].history
+            if not hist.deleted or hist.deleted[0] == obj.date_time:
+                continue
+            for user_id in _attendee_ids(session, obj.event_id):
+                touched.add((user_id, hist.deleted[0]))
+                touched.add((user_id, obj.date_time))
+
+    if deltas or touched:
+        pending = session.info.setdefault("engagement_pending", ([], set()))
+        pending[0].extend(deltas)
+        pending[1].update(touched)
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _update_engagement(session, flush_context):
+    pending = session.info.pop("engagement_pending", None)
+    if pending is None:
+        return
+    deltas, touched = pending
+
+    with session.no_autoflush:
+        stale: Set[Tuple[int, int]] = set()
+        for user_id, at in touched:
+            stale.update((user_id, term_id) for term_id in _scopes(session, at))
+
+        held: Dict[int, datetime] = {}
+        for user_id, event_id, delta in deltas:
+            if event_id not in held:
+                held[event_id] = session.query(models.Event.date_time).filter(
+                    models.Event.event_id == event_id
+                ).scalar()
+            if held[event_id] is None:      # event deleted in the same flush
+                continue
+            for term_id in _scopes(session, held[event_id]):
+                if (user_id, term_id) in stale:
+                    continue
+                row = session.get(models.UserEngagement, (user_id, term_id))
+                if row is not None:
+                    row.events_attended += delta
+                else:
+                    stale.add((user_id, term_id))
+
+        for user_id, term_id in stale:
+            recount(session, user_id, term_id)
+
+
+if __name__ == "__main__":
+    from .database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        print(f"rebuilt {rebuild_all(db)} engagement rows")
+    finally:
+        db.close()
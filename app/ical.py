@@ -0,0 +1,94 @@
+"""
+Minimal iCalendar (RFC 5545) writer for the schedule feeds.
+
+Only what calendar clients need to show the schedule: one VEVENT per match
+or event occurrence, UTC timestamps, escaped text and folded lines.
+"""
+
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+
+PRODID = "-//Coog Esports//Schedule//EN"
+UID_DOMAIN = "coogesports"
+
+
+def _stamp(moment: datetime) -> str:
+    # stored datetimes are naive UTC
+    return moment.strftime("%Y%m%dT%H%M%SZ")
+
+
+def _duration(span: timedelta) -> str:
+    minutes = int(span.total_seconds() // 60)
+    return f"PT{minutes // 60}H{minutes % 60}M"
+
+
+def _escape(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> List[str]:
+    """Split a content line into 75-octet chunks (continuations start with a space)."""
+    data = line.encode("utf-8")
+    chunks, limit = [], 75
+    while len(data) > limit:
+        cut = limit
+        while cut and (data[cut] & 0xC0) == 0x80:     # don't split a UTF-8 sequence
+            cut -= 1
+        chunks.append(data[:cut].decode("utf-8"))
+        data = data[cut:]
+        limit = 74                                    # room for the leading space
+    chunks.append(data.decode("utf-8"))
+    return [chunks[0]] + [" " + chunk for chunk in chunks[1:]]
+
+
+def vevent(
+    uid: str,
+    summary: str,
+    start: datetime,
+    stamp: datetime,
+    end: Optional[datetime] = None,
+    duration: Optional[timedelta] = None,
+    location: Optional[str] = None,
+    description: Optional[str] = None,
+    url: Optional[str] = None,
+) -> List[str]:
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{uid}@{UID_DOMAIN}",
+        f"DTSTAMP:{_stamp(stamp)}",
+        f"DTSTART:{_stamp(start)}",
+    ]
+    if end is not None:
+        lines.append(f"DTEND:{_stamp(end)}")
+    elif duration is not None:
+        lines.append(f"DURATION:{_duration(duration)}")
+    lines.append(f"SUMMARY:{_escape(summary)}")
+    if location:
+        lines.append(f"LOCATION:{_escape(location)}")
+    if description:
+        lines.append(f"DESCRIPTION:{_escape(description)}")
+    if url:
+        lines.append(f"URL:{url}")
+    lines.append("END:VEVENT")
+    return lines
+
+
+def calendar(name: str, events: Iterable[List[str]]) -> str:
+    """Serialise VEVENT line lists into a VCALENDAR document."""
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{_escape(name)}",
+    ]
+    for event in events:
+        lines.extend(event)
+    lines.append("END:VCALENDAR")
+    return "".join(folded + "\r\n" for line in lines for folded in _fold(line))
@@ -0,0 +1,43 @@
+"""
+Room keys.
+
+``location_key`` is ``models.normalize_location(location)``, kept in step
+on every write through the ORM. Rows written any other way (migration 003's
+SQL backfill, bulk imports, manual edits) may disagree with it in ways SQL
+can't reproduce, e.g. Unicode spacing or case folding.
+
+Run ``python -m app.locations`` to recompute every key, in ``events`` and
+``events_archive``, with the same function the app uses.
+"""
+
+from sqlalchemy.orm import Session
+
+from . import models
+
+
+def rekey(db: Session) -> int:
+    """Recompute every event's ``location_key``; returns rows corrected."""
+    corrected = 0
+    for model in (models.Event, models.EventArchive):
+        rows = db.query(model.event_id, model.location, model.location_key)
+        drifted = [
+            {"event_id": event_id, "location_key": models.normalize_location(location)}
+            for event_id, location, key in rows
+            if key != models.normalize_location(location)
+        ]
+        if drifted:
+            db.bulk_update_mappings(model, drifted)
+        corrected += len(drifted)
+    db.commit()
+    db.expire_all()
+    return corrected
+
+
+if __name__ == "__main__":
+    from .database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        print(f"corrected {rekey(db)} event location keys")
+    finally:
+        db.close()
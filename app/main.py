@@ -2,6 +2,7 @@ import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from . import cache, engagement, standings  # noqa: F401 -- registers the flush hooks
 from .database import engine, Base
 from .routers import api_router
 
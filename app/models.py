@@ -4,12 +4,15 @@ from sqlalchemy import (
     String,
     ForeignKey,
     DateTime,
+    Boolean,
     Enum,
     Text,
     LargeBinary,
     CheckConstraint,
+    Index,
+    desc,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 from .database import Base
 import enum
@@ -37,6 +40,7 @@ class AcademicTerm(Base):
     # constraints
     __table_args__ = (
         CheckConstraint("end_date > start_date", name="chk_end_after_start"),
+        Index("ix_academic_terms_start_end", "start_date", "end_date"),
     )
 
 
@@ -60,6 +64,9 @@ class Coordinator(Base):
             "end_date is null or end_date > start_date",
             name="chk_coord_dates_end_after_start",
         ),
+        # overlap checks; /coordinators/game/{id}
+        Index("ix_coordinators_user_game_start", "user_id", "game_id", "start_date", "end_date"),
+        Index("ix_coordinators_game_start", "game_id", "start_date"),
     )
 
 
@@ -76,6 +83,31 @@ class EventAttendee(Base):
     event = relationship("Event", back_populates="attendees")
     user = relationship("User", back_populates="event_attendees")
 
+    # the primary key covers by-event lookups; this covers by-user ones
+    __table_args__ = (
+        Index("ix_event_attendees_user_event", "user_id", "event_id"),
+    )
+
+
+def normalize_location(location: str) -> str:
+    """Key for comparing rooms: ignores case and spacing."""
+    return " ".join(location.split()).casefold()
+
+
+class EventAttendeeArchive(Base):
+    """``event_attendees`` rows of archived events; see ``app.archive``."""
+    __tablename__ = "event_attendees_archive"
+    event_id = Column(
+        Integer, ForeignKey("events_archive.event_id", ondelete="CASCADE"), primary_key=True
+    )
+    user_id = Column(
+        Integer, ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True
+    )
+
+    __table_args__ = (
+        Index("ix_event_attendees_archive_user_event", "user_id", "event_id"),
+    )
+
 
 class Event(Base):
     __tablename__ = "events"
@@ -83,21 +115,93 @@ class Event(Base):
     title = Column(String(100), nullable=False)
     description = Column(Text, nullable=False)
     location = Column(String(300), nullable=False)
+    location_key = Column(String(300), nullable=False)     # normalize_location(location)
     date_time = Column(DateTime, nullable=False)
     end_time = Column(DateTime, nullable=False)
-    attendance = Column(Integer)
+    attendance = Column(Integer, nullable=False, default=0, server_default="0")
     created_by_officer_id = Column(
         Integer, ForeignKey("officers.officer_id"), nullable=False
     )
+    # set on a series: date_time/end_time are the first occurrence, and it
+    # repeats every N days while an occurrence ends by repeat_until (NULL:
+    # indefinitely). See app.recurrence.
+    repeat_every_days = Column(Integer, nullable=True)
+    repeat_until = Column(DateTime, nullable=True)
 
     # relationships
     created_by_officer = relationship("Officer", back_populates="events_created")
     attendees = relationship("EventAttendee", back_populates="event")
+    overrides = relationship(
+        "EventOverride", back_populates="event", cascade="all, delete-orphan"
+    )
+
+    # for app.overlap: a room can't hold two events at once
+    period_columns = ("date_time", "end_time")
+
+    @validates("location")
+    def _set_location_key(self, key, location):
+        self.location_key = normalize_location(location)
+        return location
 
     # constraints
     __table_args__ = (
         CheckConstraint("end_time > date_time", name="chk_end_after_start"),
         CheckConstraint("attendance >= 0", name="chk_attendance_positive"),
+        CheckConstraint("repeat_every_days > 0", name="chk_repeat_every_days_positive"),
+        # room clash checks and /events/free-slots
+        Index("ix_events_location_date_time", "location_key", "date_time"),
+        # the (few) series, for expanding occurrences
+        Index("ix_events_repeat_every_days", "repeat_every_days"),
+        # /events/upcoming, term filters; /events/past; /events/officer/{id}
+        Index("ix_events_date_time", "date_time"),
+        Index("ix_events_end_time", "end_time"),
+        Index("ix_events_officer_date_time", "created_by_officer_id", "date_time"),
+    )
+
+
+class EventOverride(Base):
+    """One occurrence of a series moved or cancelled; see ``app.recurrence``."""
+    __tablename__ = "event_overrides"
+    event_id = Column(
+        Integer, ForeignKey("events.event_id", ondelete="CASCADE"), primary_key=True
+    )
+    # the start the occurrence was scheduled for
+    occurrence_start = Column(DateTime, primary_key=True)
+    date_time = Column(DateTime, nullable=False)
+    end_time = Column(DateTime, nullable=False)
+    cancelled = Column(Boolean, nullable=False, default=False, server_default="0")
+
+    # relationships
+    event = relationship("Event", back_populates="overrides")
+
+    __table_args__ = (
+        CheckConstraint("end_time > date_time", name="chk_override_end_after_start"),
+    )
+
+
+class EventArchive(Base):
+    """``events`` rows from closed academic terms; see ``app.archive``."""
+    __tablename__ = "events_archive"
+    event_id = Column(Integer, primary_key=True, autoincrement=False)
+    title = Column(String(100), nullable=False)
+    description = Column(Text, nullable=False)
+    location = Column(String(300), nullable=False)
+    location_key = Column(String(300), nullable=False)
+    date_time = Column(DateTime, nullable=False)
+    end_time = Column(DateTime, nullable=False)
+    attendance = Column(Integer, nullable=False, default=0, server_default="0")
+    created_by_officer_id = Column(
+        Integer, ForeignKey("officers.officer_id"), nullable=False
+    )
+    # always NULL: series stay in events
+    repeat_every_days = Column(Integer, nullable=True)
+    repeat_until = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_events_archive_date_time", "date_time"),
+        Index("ix_events_archive_end_time", "end_time"),
+        Index("ix_events_archive_officer_date_time", "created_by_officer_id", "date_time"),
+        Index("ix_events_archive_location_date_time", "location_key", "date_time"),
     )
 
 
@@ -106,6 +210,8 @@ class Game(Base):
     game_id = Column(Integer, primary_key=True, index=True)
     game_name = Column(String(100), unique=True, nullable=False)
     bg_image = Column(LargeBinary, nullable=True)
+    # how long a match usually runs, when one is scheduled without a length
+    match_duration_minutes = Column(Integer, nullable=False, default=60, server_default="60")
 
     # relationships
     teams = relationship("Team", back_populates="game")
@@ -116,6 +222,7 @@ class Game(Base):
     # constraints
     __table_args__ = (
         CheckConstraint("game_name is unique", name="chk_game_name_unique"),
+        CheckConstraint("match_duration_minutes > 0", name="chk_match_duration_positive"),
     )
 
 
@@ -123,6 +230,7 @@ class Match(Base):
     __tablename__ = "matches"
     match_id = Column(Integer, primary_key=True, index=True)
     date_time = Column(DateTime, nullable=False)
+    end_time = Column(DateTime, nullable=False)
     team_id = Column(
         Integer, ForeignKey("teams.team_id", ondelete="CASCADE"), nullable=False
     )
@@ -136,6 +244,40 @@ class Match(Base):
     opponent = relationship("Opponent", back_populates="matches")
     game = relationship("Game", back_populates="matches")
 
+    # for app.overlap: a team can't play two matches at once
+    period_columns = ("date_time", "end_time")
+
+    # every listing filters on one of these and orders by date_time
+    __table_args__ = (
+        CheckConstraint("end_time > date_time", name="chk_match_end_after_start"),
+        Index("ix_matches_date_time", "date_time"),
+        Index("ix_matches_team_date_time", "team_id", "date_time"),
+        Index("ix_matches_opponent_date_time", "opponent_id", "date_time"),
+        Index("ix_matches_game_date_time", "game_id", "date_time"),
+    )
+
+
+class MatchArchive(Base):
+    """``matches`` rows from closed academic terms; see ``app.archive``."""
+    __tablename__ = "matches_archive"
+    match_id = Column(Integer, primary_key=True, autoincrement=False)
+    date_time = Column(DateTime, nullable=False)
+    end_time = Column(DateTime, nullable=False)
+    team_id = Column(
+        Integer, ForeignKey("teams.team_id", ondelete="CASCADE"), nullable=False
+    )
+    game_id = Column(Integer, ForeignKey("games.game_id"), nullable=False)
+    opponent_id = Column(Integer, ForeignKey("opponents.opponent_id"), nullable=False)
+    watch_link = Column(String(255))
+    result = Column(String(20))
+
+    __table_args__ = (
+        Index("ix_matches_archive_date_time", "date_time"),
+        Index("ix_matches_archive_team_date_time", "team_id", "date_time"),
+        Index("ix_matches_archive_opponent_date_time", "opponent_id", "date_time"),
+        Index("ix_matches_archive_game_date_time", "game_id", "date_time"),
+    )
+
 
 class Media(Base):
     __tablename__ = "media"
@@ -153,6 +295,10 @@ class Media(Base):
     academic_term = relationship("AcademicTerm", back_populates="media")
     uploaded_by = relationship("Officer", back_populates="uploaded_media")
 
+    __table_args__ = (
+        Index("ix_media_term_uploaded", "academic_term_id", "date_uploaded"),
+    )
+
 
 class Membership(Base):
     __tablename__ = "memberships"
@@ -172,6 +318,9 @@ class Membership(Base):
     # constraints
     __table_args__ = (
         CheckConstraint("end_date > start_date", name="chk_end_after_start"),
+        # overlap checks and /memberships/user/{id}; term and as_of filters
+        Index("ix_memberships_user_start", "user_id", "start_date", "end_date"),
+        Index("ix_memberships_start_end", "start_date", "end_date"),
     )
 
 
@@ -195,6 +344,9 @@ class Officer(Base):
     # constraints
     __table_args__ = (
         CheckConstraint("end_date is null or end_date > start_date", name="chk_dates"),
+        # overlap checks; /officers/role/{id}
+        Index("ix_officers_user_start", "user_id", "start_date", "end_date"),
+        Index("ix_officers_role_start", "role_id", "start_date"),
     )
 
 
@@ -213,6 +365,7 @@ class Opponent(Base):
     # constraints
     __table_args__ = (
         CheckConstraint("opponent_name is unique", name="chk_opponent_name_unique"),
+        Index("ix_opponents_game", "game_id"),
     )
 
 
@@ -242,6 +395,11 @@ class Sponsor(Base):
     sponsor_logo = Column(LargeBinary)
     sponsor_website = Column(String(255))
 
+    # /sponsors/active
+    __table_args__ = (
+        Index("ix_sponsors_start_end", "start_date", "end_date"),
+    )
+
 
 class TeamMembership(Base):
     __tablename__ = "team_memberships"
@@ -267,6 +425,31 @@ class TeamMembership(Base):
             "end_date is null or end_date > start_date",
             name="chk_team_membership_dates",
         ),
+        # the primary key covers by-team lookups; this covers by-membership ones
+        Index("ix_team_memberships_membership_start", "membership_id", "start_date"),
+    )
+
+
+class TeamStanding(Base):
+    """
+    Win/loss record per team, maintained from ``Match.result`` by
+    ``app.standings``. ``term_id`` 0 holds the all-time record.
+    """
+    __tablename__ = "team_standings"
+    team_id = Column(
+        Integer, ForeignKey("teams.team_id", ondelete="CASCADE"), primary_key=True
+    )
+    term_id = Column(Integer, primary_key=True, default=0)
+    game_id = Column(Integer, ForeignKey("games.game_id"), nullable=False)
+    wins = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+    streak = Column(Integer, nullable=False, default=0)
+    last_results = Column(String(10), nullable=False, default="")
+    last_match_at = Column(DateTime, nullable=True)
+
+    # constraints
+    __table_args__ = (
+        Index("ix_team_standings_term_game", "term_id", "game_id"),
     )
 
 
@@ -291,6 +474,27 @@ class Team(Base):
     __table_args__ = (
         CheckConstraint("wins >= 0", name="chk_wins_positive"),
         CheckConstraint("losses >= 0", name="chk_losses_positive"),
+        Index("ix_teams_game", "game_id"),
+        Index("ix_teams_coordinator", "coordinator_id"),
+    )
+
+
+class UserEngagement(Base):
+    """
+    Events attended per user, maintained from ``event_attendees`` by
+    ``app.engagement``. ``term_id`` 0 holds the all-time count.
+    """
+    __tablename__ = "user_engagement"
+    user_id = Column(
+        Integer, ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True
+    )
+    term_id = Column(Integer, primary_key=True, default=0)
+    events_attended = Column(Integer, nullable=False, default=0)
+
+    # constraints
+    __table_args__ = (
+        # top k per term, ties by user, straight off the index
+        Index("ix_user_engagement_term_count", "term_id", desc("events_attended"), "user_id"),
     )
 
 
@@ -312,4 +516,5 @@ class User(Base):
     # constraints
     __table_args__ = (
         CheckConstraint("email is unique", name="chk_email_unique"),
+        Index("ix_users_signup_date", "signup_date"),
     )
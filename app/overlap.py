@@ -0,0 +1,187 @@
+"""
+Date-range overlap checks shared by every model with a validity period.
+
+Intervals are half-open, ``[start_date, end_date)``, and a NULL
+``end_date`` means open-ended. Models whose period lives in other columns
+name them in ``period_columns`` (matches and events use ``date_time``
+and ``end_time``). Two intervals overlap iff
+
+    existing.start_date < :end AND coalesce(existing.end_date, max) > :start
+
+which is a range probe on ``start_date`` once the equality filters (user,
+game, ...) have narrowed the rows, so it can be answered from an index on
+``(<scope columns>, start_date, end_date)``. Ranges that merely touch
+(one ends exactly when the next starts) do not overlap.
+"""
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, inspect, not_, tuple_
+from sqlalchemy.orm import Session
+
+# stands in for a NULL (open) end date
+FAR_FUTURE = datetime(9999, 12, 31)
+
+
+def _nullable(column) -> bool:
+    return column.property.columns[0].nullable
+
+
+def period_columns(model) -> Tuple[str, str]:
+    """Names of ``model``'s start and end columns."""
+    return getattr(model, "period_columns", ("start_date", "end_date"))
+
+
+def _columns(model):
+    start_name, end_name = period_columns(model)
+    start_column, end_column = getattr(model, start_name), getattr(model, end_name)
+    if _nullable(end_column):
+        end_column = func.coalesce(end_column, FAR_FUTURE)
+    return start_column, end_column
+
+
+def overlaps(model, start: datetime, end: Optional[datetime]):
+    """SQL predicate: ``model``'s period overlaps ``[start, end)``."""
+    start_column, end_column = _columns(model)
+    clauses = [end_column > start]
+    if end is not None:
+        clauses.insert(0, start_column < end)
+    return and_(*clauses)
+
+
+def active_at(model, moment: datetime):
+    """SQL predicate: ``model``'s period contains ``moment``."""
+    start_column, end_column = _columns(model)
+    return and_(start_column <= moment, end_column > moment)
+
+
+def find_overlap(
+    db: Session,
+    model,
+    start: datetime,
+    end: Optional[datetime],
+    exclude: Optional[Dict[str, Any]] = None,
+    **scope: Any,
+):
+    """
+    First ``model`` row in ``scope`` whose period overlaps ``[start, end)``.
+
+    ``scope`` holds equality filters (``user_id=3``); ``exclude`` identifies
+    the row being updated (``{"officer_id": 7}``) so it doesn't clash with
+    itself.
+    """
+    query = db.query(model).filter(
+        *(getattr(model, name) == value for name, value in scope.items()),
+        overlaps(model, start, end),
+    )
+    if exclude:
+        query = query.filter(not_(and_(
+            *(getattr(model, name) == value for name, value in exclude.items())
+        )))
+    return query.first()
+
+
+def batch_conflicts(
+    db: Session,
+    model,
+    rows: Sequence[Any],
+    label: str,
+    scope: Sequence[str] = ("user_id",),
+) -> Dict[int, str]:
+    """
+    Overlap errors for a batch of new ``model`` rows, keyed by row index;
+    ``label`` names an existing row in them (e.g. "membership 12").
+
+    Existing periods for every scope key in the batch are loaded in one
+    query; then each scope key's periods (existing and new) are sorted by
+    start and swept once, tracking the period that reaches furthest so
+    far. Any period starting before that reach overlaps it, so this finds
+    every conflicting row, within the batch or against the table, in
+    O(n log n). ``None`` rows (ones that already failed another check)
+    are skipped but keep their index.
+    """
+    pk = inspect(model).primary_key[0].name
+    start_name, end_name = period_columns(model)
+
+    # (start, end, index in batch or None, existing id or None)
+    periods: Dict[tuple, List[tuple]] = defaultdict(list)
+    for index, row in enumerate(rows):
+        if row is None:
+            continue
+        key = tuple(getattr(row, name) for name in scope)
+        periods[key].append((getattr(row, start_name), getattr(row, end_name) or FAR_FUTURE, index, None))
+    if not periods:
+        return {}
+
+    columns = [getattr(model, name) for name in scope]
+    keys = list(periods)
+    match = columns[0].in_([k[0] for k in keys]) if len(columns) == 1 else tuple_(*columns).in_(keys)
+    # only rows reaching into the batch's overall span can clash with it
+    new = [p for group in periods.values() for p in group]
+    span = overlaps(model, min(p[0] for p in new), max(p[1] for p in new))
+    existing = db.query(
+        *columns, getattr(model, pk), getattr(model, start_name), getattr(model, end_name)
+    ).filter(match, span)
+    for *key, row_id, start, end in existing:
+        periods[tuple(key)].append((start, end or FAR_FUTURE, None, row_id))
+
+    errors: Dict[int, str] = {}
+
+    def describe(period):
+        _, _, index, row_id = period
+        return f"existing {label} {row_id}" if index is None else f"row {index} of this batch"
+
+    for group in periods.values():
+        group.sort(key=lambda p: (p[0], p[1]))
+        reach = None
+        for period in group:
+            if reach is not None and period[0] < reach[1]:
+                for this, other in ((period, reach), (reach, period)):
+                    if this[2] is not None and this[2] not in errors:
+                        errors[this[2]] = f"Overlaps {describe(other)}"
+            if reach is None or period[1] > reach[1]:
+                reach = period
+    return errors
+
+
+def overlapping_pairs(periods: Iterable[Tuple[datetime, datetime, Any]]) -> List[Tuple[Any, Any]]:
+    """
+    Every pair of overlapping ``(start, end, item)`` periods, as item pairs.
+
+    ``periods`` must be sorted by start. One sweep keeps the periods still
+    running at the current start; each new period overlaps exactly those,
+    so this is O(n + pairs) rather than a pairwise self-join.
+    """
+    pairs, running = [], []
+    for start, end, item in periods:
+        running = [p for p in running if p[1] > start]
+        pairs.extend((other, item) for _, _, other in running)
+        running.append((start, end, item))
+    return pairs
+
+
+def free_windows(
+    busy: Iterable[Tuple[datetime, datetime]],
+    start: datetime,
+    end: datetime,
+    minimum: timedelta,
+) -> List[Tuple[datetime, datetime]]:
+    """
+    Gaps of at least ``minimum`` in ``[start, end)`` between ``busy`` periods.
+
+    ``busy`` must be sorted by start. Overlapping and touching periods are
+    merged as they are read, so each gap is the space between the end of
+    one merged run and the start of the next.
+    """
+    windows, cursor = [], start
+    for busy_start, busy_end in busy:
+        if busy_start >= end:
+            break
+        if busy_start - cursor >= minimum:
+            windows.append((cursor, busy_start))
+        cursor = max(cursor, busy_end)
+    if end - cursor >= minimum:
+        windows.append((cursor, end))
+    return windows
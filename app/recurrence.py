@@ -0,0 +1,190 @@
+"""
+Recurring events.
+
+An event with ``repeat_every_days`` set is a series: its ``date_time`` and
+``end_time`` are the first occurrence, and it happens again every
+``repeat_every_days`` days for as long as an occurrence ends by
+``repeat_until`` (indefinitely if that is NULL). Only the series row is
+stored. Occurrences are generated lazily for the window a caller asks
+about, so reading a week or a term costs one row per series however long
+the series has been running.
+
+``event_overrides`` rows move or cancel single occurrences, keyed by the
+start the occurrence was scheduled for.
+
+Series are never archived, and an occurrence may not run into the next
+one (the routes check both), which bounds how far back an override can
+matter.
+"""
+
+import heapq
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from . import archive, models, overlap
+
+Overrides = Dict[datetime, models.EventOverride]
+
+
+class Occurrence(NamedTuple):
+    start: datetime
+    end: datetime
+    event: models.Event
+    # the start it was scheduled for; None for one-off events
+    scheduled: Optional[datetime] = None
+
+
+def _by_start(occurrence: Occurrence) -> datetime:
+    return occurrence.start
+
+
+def is_series(event) -> bool:
+    return event.repeat_every_days is not None
+
+
+def one_off(event) -> Occurrence:
+    return Occurrence(event.date_time, event.end_time, event)
+
+
+def scheduled_starts(event, start: datetime, end: Optional[datetime] = None) -> Iterator[datetime]:
+    """Scheduled starts of ``event``'s occurrences overlapping ``[start, end)``."""
+    step = timedelta(days=event.repeat_every_days)
+    length = event.end_time - event.date_time
+    # jump straight to the first occurrence still running at ``start``
+    behind = (start - event.date_time) - length
+    moment = event.date_time + (behind // step + 1) * step if behind >= timedelta(0) else event.date_time
+    while (end is None or moment < end) and (
+        event.repeat_until is None or moment + length <= event.repeat_until
+    ):
+        yield moment
+        moment += step
+
+
+def is_scheduled(event, moment: datetime) -> bool:
+    """Whether one of ``event``'s occurrences is scheduled to start at ``moment``."""
+    if not is_series(event):
+        return False
+    offset = moment - event.date_time
+    return (
+        offset >= timedelta(0)
+        and offset % timedelta(days=event.repeat_every_days) == timedelta(0)
+        and (event.repeat_until is None
+             or moment + (event.end_time - event.date_time) <= event.repeat_until)
+    )
+
+
+def occurrences(
+    event, overrides: Overrides, start: datetime, end: Optional[datetime] = None
+) -> Iterator[Occurrence]:
+    """``event``'s occurrences overlapping ``[start, end)`` in start order, with ``overrides`` applied."""
+    if not is_series(event):
+        if event.end_time > start and (end is None or event.date_time < end):
+            yield one_off(event)
+        return
+
+    length = event.end_time - event.date_time
+    regular = (
+        Occurrence(moment, moment + length, event, moment)
+        for moment in scheduled_starts(event, start, end)
+        if moment not in overrides
+    )
+    moved = sorted(
+        (
+            Occurrence(o.date_time, o.end_time, event, o.occurrence_start)
+            for o in overrides.values()
+            if not o.cancelled and o.end_time > start and (end is None or o.date_time < end)
+        ),
+        key=_by_start,
+    )
+    yield from heapq.merge(regular, moved, key=_by_start)
+
+
+def series_between(
+    db: Session, start: datetime, end: Optional[datetime] = None, *criteria
+) -> List[models.Event]:
+    """Series that may have an occurrence in ``[start, end)``."""
+    query = db.query(models.Event).filter(
+        # not IS NOT NULL: a range the planner will take from the index
+        models.Event.repeat_every_days > 0,
+        or_(models.Event.repeat_until.is_(None), models.Event.repeat_until > start),
+        *criteria,
+    )
+    if end is not None:
+        query = query.filter(models.Event.date_time < end)
+    return query.all()
+
+
+def overrides_for(
+    db: Session, series: List[models.Event], start: datetime, end: Optional[datetime] = None
+) -> Dict[int, Overrides]:
+    """The overrides that can change ``series`` occurrences in ``[start, end)``, by event."""
+    found: Dict[int, Overrides] = {event.event_id: {} for event in series}
+    if not found:
+        return found
+    # an occurrence running at ``start`` began less than one occurrence,
+    # so less than one repeat interval, before it
+    reach = timedelta(days=max(event.repeat_every_days for event in series))
+    override = models.EventOverride
+    query = db.query(override).filter(
+        override.event_id.in_(found),
+        or_(override.end_time > start,
+            override.occurrence_start > max(start, datetime.min + reach) - reach),
+    )
+    if end is not None:
+        query = query.filter(or_(override.date_time < end, override.occurrence_start < end))
+    for row in query:
+        found[row.event_id][row.occurrence_start] = row
+    return found
+
+
+def expand(
+    db: Session, series: List[models.Event], start: datetime, end: Optional[datetime] = None
+) -> Iterator[Occurrence]:
+    """Every occurrence of ``series`` overlapping ``[start, end)``, merged in start order."""
+    overrides = overrides_for(db, series, start, end)
+    return heapq.merge(
+        *(occurrences(event, overrides[event.event_id], start, end) for event in series),
+        key=_by_start,
+    )
+
+
+def between(
+    db: Session,
+    start: datetime,
+    end: datetime,
+    criteria: Callable[[object], Iterable] = lambda event: [],
+) -> Iterator[Occurrence]:
+    """
+    Every event occurrence overlapping ``[start, end)`` in start order:
+    one-off events, archived ones included, and the expanded series.
+    ``criteria(entity)`` returns extra filters, written against whichever
+    entity is being queried.
+    """
+    event = archive.source(db, models.Event, start)
+    one_offs = db.query(event).filter(
+        event.repeat_every_days.is_(None),
+        overlap.overlaps(event, start, end),
+        *criteria(event),
+    ).order_by(event.date_time)
+    series = series_between(db, start, end, *criteria(models.Event))
+    return heapq.merge(
+        (one_off(e) for e in one_offs), expand(db, series, start, end), key=_by_start
+    )
+
+
+def upcoming(db: Session, moment: datetime, count: int) -> List[Occurrence]:
+    """The first ``count`` occurrences starting after ``moment``."""
+    one_offs = db.query(models.Event).filter(
+        models.Event.repeat_every_days.is_(None),
+        models.Event.date_time > moment,
+    ).order_by(models.Event.date_time).limit(count)
+    series = expand(db, series_between(db, moment), moment)
+    return list(islice(heapq.merge(
+        (one_off(e) for e in one_offs),
+        (o for o in series if o.start > moment),
+        key=_by_start,
+    ), count))
@@ -1,10 +1,38 @@
 from fastapi import APIRouter
 from .users import router as users_router
 from .events import router as events_router
+from .event_attendees import router as event_attendees_router
 from .games import router as games_router
+from .matches import router as matches_router
+from .sponsors import router as sponsors_router
+from .memberships import router as memberships_router
+from .officers import router as officers_router
+from .coordinators import router as coordinators_router
+from .teams import router as teams_router
+from .team_memberships import router as team_memberships_router
+from .opponents import router as opponents_router
+from .academic_terms import router as academic_terms_router
+from .shirt_sizes import router as shirt_sizes_router
+from .calendar import router as calendar_router
+from .bundles import router as bundles_router
+from .internal import router as internal_router
 
 api_router = APIRouter()
 api_router.include_router(users_router, prefix="/users", tags=["Users"])
 api_router.include_router(events_router, prefix="/events", tags=["Events"])
+api_router.include_router(event_attendees_router)
 api_router.include_router(games_router,  prefix="/games",  tags=["Games"])
+api_router.include_router(matches_router, prefix="/matches", tags=["Matches"])
+api_router.include_router(sponsors_router, prefix="/sponsors", tags=["Sponsors"])
+api_router.include_router(memberships_router, prefix="/memberships", tags=["Memberships"])
+api_router.include_router(officers_router, prefix="/officers", tags=["Officers"])
+api_router.include_router(coordinators_router, prefix="/coordinators", tags=["Coordinators"])
+api_router.include_router(teams_router, prefix="/teams", tags=["Teams"])
+api_router.include_router(team_memberships_router, prefix="/team-memberships", tags=["Team Memberships"])
+api_router.include_router(opponents_router, prefix="/opponents", tags=["Opponents"])
+api_router.include_router(academic_terms_router, prefix="/academic-terms", tags=["Academic Terms"])
+api_router.include_router(shirt_sizes_router, prefix="/shirt-sizes", tags=["Shirt Sizes"])
+api_router.include_router(calendar_router, tags=["Calendar"])
+api_router.include_router(bundles_router, prefix="/bundle", tags=["Bundles"])
+api_router.include_router(internal_router, prefix="/_internal", tags=["Internal"])
 # add more include_router() lines as you create more blueprints
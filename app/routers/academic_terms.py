@@ -7,23 +7,45 @@ AcademicTerms:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import and_, func, literal, null, select, union_all
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Dict, List
+from datetime import datetime
+from collections import defaultdict
 
-from .. import schemas, models, crud
+from .. import schemas, models, crud, cache, archive, overlap, recurrence, standings
+from ..terms import active_during, closed, contains, within
 from ..deps import get_db
 
 router = APIRouter()
 
+# Summaries of closed terms never expire. A write to any table they are
+# built from (back-dating data into an old term, say) drops them all, and
+# each is rebuilt on its next read.
+summary_cache = cache.BoundaryCache(
+    "academic_terms.summary",
+    tables={
+        "academic_terms", "users", "memberships", "media",
+        "events", "events_archive", "event_overrides",
+        "event_attendees", "event_attendees_archive",
+        "matches", "matches_archive",
+    },
+    route="/academic-terms/summary",
+)
+
+missing_by_id = cache.NegativeCache(
+    "academic_terms.missing_by_id",
+    tables={"academic_terms"},
+    route="/academic-terms/{term_id}",
+)
+
 @router.post("/", response_model=schemas.AcademicTermRead, status_code=status.HTTP_201_CREATED)
 def create_academic_term(term: schemas.AcademicTermCreate, db: Session = Depends(get_db)):
     """Create a new academic term."""
     # Check if term dates overlap with existing terms
-    overlapping_term = db.query(models.AcademicTerm).filter(
-        ((models.AcademicTerm.start_date <= term.start_date) & (models.AcademicTerm.end_date >= term.start_date)) |
-        ((models.AcademicTerm.start_date <= term.end_date) & (models.AcademicTerm.end_date >= term.end_date)) |
-        ((models.AcademicTerm.start_date >= term.start_date) & (models.AcademicTerm.end_date <= term.end_date))
-    ).first()
+    overlapping_term = overlap.find_overlap(
+        db, models.AcademicTerm, term.start_date, term.end_date
+    )
     
     if overlapping_term:
         raise HTTPException(
@@ -33,10 +55,145 @@ def create_academic_term(term: schemas.AcademicTermCreate, db: Session = Depends
     
     return crud.academic_term.create(db, obj_in=term)
 
+def _per_term(metric: str, count_column, *joins, result=None):
+    """
+    ``(metric, term_id, result, COUNT(count_column))`` rows per term over
+    ``(target, onclause)`` joins; ``result`` splits a metric's count further.
+    """
+    group = [models.AcademicTerm.term_id] + ([result] if result is not None else [])
+    query = select(
+        literal(metric).label("metric"),
+        models.AcademicTerm.term_id,
+        (result if result is not None else null()).label("result"),
+        func.count(count_column).label("count"),
+    ).select_from(models.AcademicTerm)
+    for target, onclause in joins:
+        query = query.join(target, onclause)
+    return query.group_by(*group)
+
+def _summarise(db: Session, terms: List[models.AcademicTerm], now: datetime) -> Dict[int, schemas.TermSummaryRead]:
+    """
+    Roll up every metric for ``terms``: one UNION ALL of grouped counts,
+    plus recurring events, whose occurrences aren't rows and are expanded
+    in Python (see ``app.recurrence``).
+    """
+    ids = [term.term_id for term in terms]
+    if not ids:
+        return {}
+    since = min(term.start_date for term in terms)
+    event = archive.source(db, models.Event, since)
+    attendee = archive.source(db, models.EventAttendee, since)
+    match = archive.source(db, models.Match, since)
+
+    metrics = union_all(*(
+        query.where(models.AcademicTerm.term_id.in_(ids)) for query in (
+            _per_term(
+                "new_users", models.User.user_id,
+                (models.User, within(models.User.signup_date)),
+            ),
+            _per_term(
+                "active_memberships", models.Membership.membership_id,
+                (models.Membership, active_during(models.Membership)),
+            ),
+            _per_term(
+                "events_held", event.event_id,
+                (event, and_(within(event.date_time), event.repeat_every_days.is_(None))),
+            ),
+            _per_term(
+                "total_attendance", attendee.user_id,
+                (event, within(event.date_time)),
+                (attendee, attendee.event_id == event.event_id),
+            ),
+            _per_term(
+                "media_uploaded", models.Media.media_id,
+                (models.Media, models.Media.academic_term_id == models.AcademicTerm.term_id),
+            ),
+            _per_term(
+                "matches_played", match.match_id,
+                (match, within(match.date_time)),
+                result=match.result,
+            ),
+        )
+    ))
+    counts: Dict[str, Dict[int, int]] = defaultdict(dict)
+    won: Dict[int, int] = {}
+    for metric, term_id, result, count in db.execute(metrics):
+        counts[metric][term_id] = counts[metric].get(term_id, 0) + count
+        if metric == "matches_played" and standings.outcome(result) == standings.WIN:
+            won[term_id] = won.get(term_id, 0) + count
+
+    # recurring events count once per occurrence held in the term
+    events_held = counts["events_held"]
+    until = max(term.end_date for term in terms)
+    series = recurrence.series_between(db, since, until)
+    for occurrence in recurrence.expand(db, series, since, until):
+        for term in terms:
+            if contains(term, occurrence.start):
+                events_held[term.term_id] = events_held.get(term.term_id, 0) + 1
+
+    return {
+        term.term_id: schemas.TermSummaryRead(
+            term_id=term.term_id,
+            semester=term.semester,
+            start_date=term.start_date,
+            end_date=term.end_date,
+            closed=closed(term, now),
+            new_users=counts["new_users"].get(term.term_id, 0),
+            active_memberships=counts["active_memberships"].get(term.term_id, 0),
+            events_held=events_held.get(term.term_id, 0),
+            total_attendance=counts["total_attendance"].get(term.term_id, 0),
+            matches_played=counts["matches_played"].get(term.term_id, 0),
+            matches_won=won.get(term.term_id, 0),
+            media_uploaded=counts["media_uploaded"].get(term.term_id, 0),
+        )
+        for term in terms
+    }
+
+def _summaries(db: Session, terms: List[models.AcademicTerm]) -> List[schemas.TermSummaryRead]:
+    """Summaries for ``terms``, serving closed ones from the cache."""
+    now = datetime.utcnow()
+    generation = summary_cache.generation
+    found = {}
+    for term in terms:
+        if closed(term, now):
+            cached = summary_cache.get(term.term_id, now)
+            if cached is not None:
+                found[term.term_id] = cached
+
+    built = _summarise(db, [t for t in terms if t.term_id not in found], now)
+    for term_id, summary in built.items():
+        if summary.closed:
+            summary_cache.put(term_id, summary, generation=generation)
+    found.update(built)
+    return [found[term.term_id] for term in terms]
+
+@router.get("/summary", response_model=List[schemas.TermSummaryRead])
+def list_academic_term_summaries(
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db)
+):
+    """Get activity counts for every academic term."""
+    terms = db.query(models.AcademicTerm).order_by(
+        models.AcademicTerm.start_date
+    ).offset(skip).limit(limit).all()
+    return _summaries(db, terms)
+
+@router.get("/{term_id}/summary", response_model=schemas.TermSummaryRead)
+def read_academic_term_summary(term_id: int, db: Session = Depends(get_db)):
+    """Get activity counts for one academic term."""
+    term = crud.academic_term.get(db, term_id)
+    if not term:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Academic term not found"
+        )
+    return _summaries(db, [term])[0]
+
 @router.get("/{term_id}", response_model=schemas.AcademicTermRead)
 def read_academic_term(term_id: int, db: Session = Depends(get_db)):
     """Get a specific academic term by ID."""
-    term = crud.academic_term.get(db, term_id)
+    term = missing_by_id.lookup(term_id, lambda: crud.academic_term.get(db, term_id))
     if not term:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -68,12 +225,10 @@ def update_academic_term(
         )
     
     # Check for date overlaps with other terms
-    overlapping_term = db.query(models.AcademicTerm).filter(
-        models.AcademicTerm.term_id != term_id,
-        ((models.AcademicTerm.start_date <= term.start_date) & (models.AcademicTerm.end_date >= term.start_date)) |
-        ((models.AcademicTerm.start_date <= term.end_date) & (models.AcademicTerm.end_date >= term.end_date)) |
-        ((models.AcademicTerm.start_date >= term.start_date) & (models.AcademicTerm.end_date <= term.end_date))
-    ).first()
+    overlapping_term = overlap.find_overlap(
+        db, models.AcademicTerm, term.start_date, term.end_date,
+        exclude={"term_id": term_id}
+    )
     
     if overlapping_term:
         raise HTTPException(
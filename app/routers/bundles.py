@@ -0,0 +1,76 @@
+"""
+Bundles:
+    Precomputed multi-resource payloads for the busiest frontend pages.
+    Each bundle is built on its first request and rebuilt in the background
+    when one of its source tables changes, so serving it costs no queries.
+    Images are left out; the bundle would otherwise hold every one in memory.
+"""
+
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.orm import Session, defer
+from typing import Callable
+from datetime import datetime
+
+from .. import schemas, models, cache
+from ..deps import get_db, get_session_factory
+
+router = APIRouter()
+
+# same page size the individual list routes default to
+SECTION_LIMIT = 100
+
+def build_home_bundle(db: Session):
+    """Assemble the landing page and work out when it next goes stale."""
+    current_time = datetime.utcnow()
+    current_date = datetime.now()    # sponsors are dated in local time
+
+    matches = db.query(models.Match).filter(
+        models.Match.date_time > current_time
+    ).order_by(models.Match.date_time).limit(SECTION_LIMIT).all()
+
+    events = db.query(models.Event).filter(
+        models.Event.date_time > current_time
+    ).order_by(models.Event.date_time).limit(SECTION_LIMIT).all()
+
+    sponsors = db.query(models.Sponsor).options(
+        defer(models.Sponsor.sponsor_logo)
+    ).filter(
+        models.Sponsor.start_date <= current_date,
+        (models.Sponsor.end_date >= current_date) | (models.Sponsor.end_date == None)
+    ).limit(SECTION_LIMIT).all()
+
+    bundle = schemas.HomeBundle(
+        upcoming_matches=cache.freeze(schemas.MatchRead, matches),
+        upcoming_events=cache.freeze(schemas.EventRead, events),
+        active_sponsors=cache.freeze(schemas.SponsorSummaryRead, sponsors),
+        teams=cache.freeze(schemas.TeamRead, db.query(models.Team).limit(SECTION_LIMIT).all()),
+        games=cache.freeze(schemas.GameSummaryRead, db.query(models.Game).options(
+            defer(models.Game.bg_image)
+        ).limit(SECTION_LIMIT).all()),
+        generated_at=current_time,
+    )
+    expires_at = cache.earliest(
+        cache.next_boundary(db, models.Match.date_time, current_time),
+        cache.next_boundary(db, models.Event.date_time, current_time),
+        cache.next_boundary(db, models.Sponsor.start_date, current_date),
+        cache.after(cache.next_boundary(
+            db, models.Sponsor.end_date, current_date, inclusive=True
+        )),
+    )
+    return bundle, expires_at
+
+home_bundle = cache.Snapshot(
+    "bundles.home",
+    tables={"matches", "events", "sponsors", "teams", "games"},
+    build=build_home_bundle,
+    route="/bundle/home",
+)
+
+@router.get("/home", response_model=schemas.HomeBundle)
+def read_home_bundle(
+    response: Response,
+    db: Session = Depends(get_db),
+    session_factory: Callable[[], Session] = Depends(get_session_factory)
+):
+    """Get everything the landing page needs in one response."""
+    return home_bundle.get(db, datetime.utcnow(), response=response, session_factory=session_factory)
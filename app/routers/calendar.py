@@ -0,0 +1,133 @@
+"""
+Calendar:
+    iCalendar feeds of the match and event schedule for calendar apps.
+    Feeds are rebuilt only after a write to one of the tables they are
+    built from; clients polling with If-None-Match get a 304.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
+import hashlib
+
+from .. import models, crud, cache, archive, recurrence, ical
+from ..deps import get_db
+
+router = APIRouter()
+
+feed_cache = cache.BoundaryCache(
+    "calendar.feeds",
+    tables={
+        "matches", "matches_archive", "events", "events_archive", "event_overrides",
+        "teams", "opponents", "games",
+    },
+    route="/calendar.ics",
+)
+
+# recurring events are listed this far ahead, so feeds with them are
+# rebuilt daily as the horizon moves
+FEED_HORIZON = timedelta(days=180)
+FEED_REFRESH = timedelta(days=1)
+
+def _match_events(db: Session, stamp: datetime, team_id=None, game_id=None):
+    match = archive.source(db, models.Match)
+    query = db.query(
+        match, models.Team.team_name, models.Opponent.opponent_name
+    ).join(
+        models.Team, models.Team.team_id == match.team_id
+    ).join(
+        models.Opponent, models.Opponent.opponent_id == match.opponent_id
+    )
+    if team_id is not None:
+        query = query.filter(match.team_id == team_id)
+    if game_id is not None:
+        query = query.filter(match.game_id == game_id)
+
+    for match, team_name, opponent_name in query.order_by(match.date_time):
+        yield ical.vevent(
+            uid=f"match-{match.match_id}",
+            summary=f"{team_name} vs {opponent_name}",
+            start=match.date_time,
+            end=match.end_time,
+            stamp=stamp,
+            description=f"Result: {match.result}" if match.result else None,
+            url=match.watch_link,
+        )
+
+def _event_events(db: Session, stamp: datetime):
+    for occurrence in recurrence.between(db, datetime.min, stamp + FEED_HORIZON):
+        event, uid = occurrence.event, f"event-{occurrence.event.event_id}"
+        if occurrence.scheduled is not None:
+            uid += occurrence.scheduled.strftime("-%Y%m%dT%H%M%S")
+        yield ical.vevent(
+            uid=uid,
+            summary=event.title,
+            start=occurrence.start,
+            end=occurrence.end,
+            stamp=stamp,
+            location=event.location,
+            description=event.description,
+        )
+
+def _feed(request: Request, key, build, lifetime=None) -> Response:
+    """Serve a cached feed, or a 304 if the client already has this version."""
+    meta = Response()
+
+    def build_feed():
+        now = datetime.utcnow()
+        body = build(now)
+        etag = '"' + hashlib.sha1(body.encode("utf-8")).hexdigest() + '"'
+        # otherwise only a write changes the feed
+        return (body, etag), (now + lifetime if lifetime else None)
+
+    body, etag = feed_cache.get_or_build(key, datetime.utcnow(), build_feed, response=meta)
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=300"}
+    headers.update({k: v for k, v in meta.headers.items() if k in ("age", "warning")})
+
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="text/calendar; charset=utf-8", headers=headers)
+
+@router.get("/calendar.ics", response_class=Response)
+def read_calendar(request: Request, db: Session = Depends(get_db)):
+    """Get every match and event as an iCalendar feed."""
+    def build(stamp):
+        return ical.calendar("Coog Esports", [
+            *_match_events(db, stamp), *_event_events(db, stamp)
+        ])
+
+    return _feed(request, ("all",), build, lifetime=FEED_REFRESH)
+
+@router.get("/calendar/teams/{team_id}.ics", response_class=Response)
+def read_team_calendar(team_id: int, request: Request, db: Session = Depends(get_db)):
+    """Get a team's matches as an iCalendar feed."""
+    # Check if team exists
+    team = crud.team.get(db, team_id)
+    if not team:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Team not found"
+        )
+    team_name = team.team_name
+
+    def build(stamp):
+        return ical.calendar(team_name, _match_events(db, stamp, team_id=team_id))
+
+    return _feed(request, ("team", team_id), build)
+
+@router.get("/calendar/games/{game_id}.ics", response_class=Response)
+def read_game_calendar(game_id: int, request: Request, db: Session = Depends(get_db)):
+    """Get every match played in a game as an iCalendar feed."""
+    # Check if game exists
+    game = crud.game.get(db, game_id)
+    if not game:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Game not found"
+        )
+    game_name = game.game_name
+
+    def build(stamp):
+        return ical.calendar(game_name, _match_events(db, stamp, game_id=game_id))
+
+    return _feed(request, ("game", game_id), build)
@@ -9,13 +9,20 @@ Coordinators:
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import datetime
 
-from .. import schemas, models, crud
-from ..deps import get_db
+from .. import schemas, models, crud, cache, overlap
+from ..deps import get_db, point_in_time
 
 router = APIRouter()
 
+missing_by_id = cache.NegativeCache(
+    "coordinators.missing_by_id",
+    tables={"coordinators"},
+    route="/coordinators/{coordinator_id}",
+)
+
 @router.post("/", response_model=schemas.CoordinatorRead, status_code=status.HTTP_201_CREATED)
 def create_coordinator(coordinator: schemas.CoordinatorCreate, db: Session = Depends(get_db)):
     """Create a new coordinator."""
@@ -36,16 +43,11 @@ def create_coordinator(coordinator: schemas.CoordinatorCreate, db: Session = Dep
         )
     
     # Check for overlapping coordinator periods
-    overlapping_coordinator = db.query(models.Coordinator).filter(
-        models.Coordinator.user_id == coordinator.user_id,
-        models.Coordinator.game_id == coordinator.game_id,
-        ((models.Coordinator.start_date <= coordinator.start_date) & 
-         (models.Coordinator.end_date >= coordinator.start_date)) |
-        ((models.Coordinator.start_date <= coordinator.end_date) & 
-         (models.Coordinator.end_date >= coordinator.end_date)) |
-        ((models.Coordinator.start_date >= coordinator.start_date) & 
-         (models.Coordinator.end_date <= coordinator.end_date))
-    ).first()
+    overlapping_coordinator = overlap.find_overlap(
+        db, models.Coordinator, coordinator.start_date, coordinator.end_date,
+        user_id=coordinator.user_id,
+        game_id=coordinator.game_id
+    )
     
     if overlapping_coordinator:
         raise HTTPException(
@@ -58,7 +60,7 @@ def create_coordinator(coordinator: schemas.CoordinatorCreate, db: Session = Dep
 @router.get("/{coordinator_id}", response_model=schemas.CoordinatorRead)
 def read_coordinator(coordinator_id: int, db: Session = Depends(get_db)):
     """Get a specific coordinator by ID."""
-    coordinator = crud.coordinator.get(db, coordinator_id)
+    coordinator = missing_by_id.lookup(coordinator_id, lambda: crud.coordinator.get(db, coordinator_id))
     if not coordinator:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -70,19 +72,26 @@ def read_coordinator(coordinator_id: int, db: Session = Depends(get_db)):
 def list_coordinators(
     skip: int = 0,
     limit: int = 100,
+    as_of: Optional[datetime] = Depends(point_in_time),
     db: Session = Depends(get_db)
 ):
-    """Get all coordinators."""
-    return crud.coordinator.get_multi(db, skip=skip, limit=limit)
+    """Get all coordinators, or only those serving at a point in time."""
+    if as_of is None:
+        return crud.coordinator.get_multi(db, skip=skip, limit=limit)
+
+    return db.query(models.Coordinator).filter(
+        overlap.active_at(models.Coordinator, as_of)
+    ).offset(skip).limit(limit).all()
 
 @router.get("/game/{game_id}", response_model=List[schemas.CoordinatorRead])
 def list_game_coordinators(
     game_id: int,
     skip: int = 0,
     limit: int = 100,
+    as_of: Optional[datetime] = Depends(point_in_time),
     db: Session = Depends(get_db)
 ):
-    """Get all coordinators for a specific game."""
+    """Get all coordinators for a specific game, optionally at a point in time."""
     # Check if game exists
     game = crud.game.get(db, game_id)
     if not game:
@@ -91,9 +100,12 @@ def list_game_coordinators(
             detail="Game not found"
         )
     
-    return db.query(models.Coordinator).filter(
+    query = db.query(models.Coordinator).filter(
         models.Coordinator.game_id == game_id
-    ).offset(skip).limit(limit).all()
+    )
+    if as_of is not None:
+        query = query.filter(overlap.active_at(models.Coordinator, as_of))
+    return query.offset(skip).limit(limit).all()
 
 @router.put("/{coordinator_id}", response_model=schemas.CoordinatorRead)
 def update_coordinator(
@@ -110,17 +122,12 @@ def update_coordinator(
         )
     
     # Check for overlapping coordinator periods
-    overlapping_coordinator = db.query(models.Coordinator).filter(
-        models.Coordinator.coordinator_id != coordinator_id,
-        models.Coordinator.user_id == coordinator.user_id,
-        models.Coordinator.game_id == coordinator.game_id,
-        ((models.Coordinator.start_date <= coordinator.start_date) & 
-         (models.Coordinator.end_date >= coordinator.start_date)) |
-        ((models.Coordinator.start_date <= coordinator.end_date) & 
-         (models.Coordinator.end_date >= coordinator.end_date)) |
-        ((models.Coordinator.start_date >= coordinator.start_date) & 
-         (models.Coordinator.end_date <= coordinator.end_date))
-    ).first()
+    overlapping_coordinator = overlap.find_overlap(
+        db, models.Coordinator, coordinator.start_date, coordinator.end_date,
+        exclude={"coordinator_id": coordinator_id},
+        user_id=coordinator.user_id,
+        game_id=coordinator.game_id
+    )
     
     if overlapping_coordinator:
         raise HTTPException(
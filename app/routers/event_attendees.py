@@ -8,7 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
 
-from .. import schemas, models, crud
+from .. import schemas, models, crud, archive, attendance
 from ..deps import get_db
 
 router = APIRouter(
@@ -22,13 +22,8 @@ def create_event_attendee(
     db: Session = Depends(get_db)
 ):
     """Create a new event attendee."""
-    # Check if the event exists
-    event = crud.event.get(db, event_attendee.event_id)
-    if not event:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Event not found"
-        )
+    # Check if the event exists; archived events are read-only
+    event = archive.writable(db, models.Event, event_attendee.event_id)
     
     # Check if the user exists
     user = crud.user.get(db, event_attendee.user_id)
@@ -50,7 +45,12 @@ def create_event_attendee(
             detail="User is already registered for this event"
         )
     
-    return crud.event_attendee.create(db, obj_in=event_attendee)
+    db_attendee = models.EventAttendee(**event_attendee.dict())
+    db.add(db_attendee)
+    attendance.adjust(db, event_attendee.event_id, +1)
+    db.commit()
+    db.refresh(db_attendee)
+    return db_attendee
 
 @router.get("/", response_model=List[schemas.EventAttendeeRead])
 def read_event_attendees(
@@ -59,7 +59,10 @@ def read_event_attendees(
     db: Session = Depends(get_db)
 ):
     """Get all event attendees."""
-    return crud.event_attendee.get_multi(db, skip=skip, limit=limit)
+    attendee = archive.source(db, models.EventAttendee)
+    return db.query(attendee).order_by(
+        attendee.event_id, attendee.user_id
+    ).offset(skip).limit(limit).all()
 
 @router.get("/event/{event_id}", response_model=List[schemas.EventAttendeeRead])
 def read_event_attendees_by_event(
@@ -70,16 +73,18 @@ def read_event_attendees_by_event(
 ):
     """Get all attendees for a specific event."""
     # Check if the event exists
-    event = crud.event.get(db, event_id)
+    event = archive.get(db, models.Event, event_id)
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found"
         )
     
-    return db.query(models.EventAttendee).filter(
-        models.EventAttendee.event_id == event_id
-    ).offset(skip).limit(limit).all()
+    # an archived event's attendees were archived with it
+    attendee = models.EventAttendee if isinstance(event, models.Event) else models.EventAttendeeArchive
+    return db.query(attendee).filter(
+        attendee.event_id == event_id
+    ).order_by(attendee.user_id).offset(skip).limit(limit).all()
 
 @router.get("/user/{user_id}", response_model=List[schemas.EventAttendeeRead])
 def read_event_attendees_by_user(
@@ -97,9 +102,10 @@ def read_event_attendees_by_user(
             detail="User not found"
         )
     
-    return db.query(models.EventAttendee).filter(
-        models.EventAttendee.user_id == user_id
-    ).offset(skip).limit(limit).all()
+    attendee = archive.source(db, models.EventAttendee)
+    return db.query(attendee).filter(
+        attendee.user_id == user_id
+    ).order_by(attendee.event_id).offset(skip).limit(limit).all()
 
 @router.delete("/{event_id}/{user_id}", response_model=schemas.EventAttendeeRead)
 def delete_event_attendee(
@@ -108,17 +114,10 @@ def delete_event_attendee(
     db: Session = Depends(get_db)
 ):
     """Remove a user from an event."""
-    event_attendee = db.query(models.EventAttendee).filter(
-        models.EventAttendee.event_id == event_id,
-        models.EventAttendee.user_id == user_id
-    ).first()
-    
-    if not event_attendee:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Event attendee not found"
-        )
+    # attendees of archived events are read-only
+    event_attendee = archive.writable(db, models.EventAttendee, (event_id, user_id), "Event attendee")
     
     db.delete(event_attendee)
+    attendance.adjust(db, event_id, -1)
     db.commit()
     return event_attendee
\ No newline at end of file
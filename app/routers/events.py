@@ -4,22 +4,161 @@ Events:
     - title | varchar(255) not null
     - description | text not null
     - location | varchar(255) not null
+    - location_key | varchar(255) not null (location, case and spacing folded)
     - date_time | datetime not null
     - end_time | datetime not null
     - attendance | int not null
     - created_by_officer_id | int not null
+    - repeat_every_days | int null (set on a recurring series)
+    - repeat_until | datetime null (occurrences end by then; null: no end)
+
+Event overrides:
+    - event_id | int not null, foreign key to events
+    - occurrence_start | datetime not null (the start it was scheduled for)
+    - date_time | datetime not null
+    - end_time | datetime not null
+    - cancelled | bool not null
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from typing import List
-from datetime import datetime
+from typing import Iterable, List, Optional
+from datetime import datetime, timedelta
+import heapq
+import math
 
-from .. import schemas, models, crud
+from .. import schemas, models, crud, cache, archive, overlap, recurrence, terms
 from ..deps import get_db
 
 router = APIRouter()
 
+upcoming_cache = cache.BoundaryCache(
+    "events.upcoming", tables={"events", "event_overrides"}, route="/events/upcoming"
+)
+past_cache = cache.BoundaryCache("events.past", tables={"events"}, route="/events/past")
+missing_by_id = cache.NegativeCache(
+    "events.missing_by_id", tables={"events"}, route="/events/{event_id}"
+)
+
+def _check_repeat(event: schemas.EventCreate) -> None:
+    """Reject a recurrence rule that can't be expanded."""
+    if event.repeat_every_days is None:
+        if event.repeat_until is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="repeat_until needs repeat_every_days"
+            )
+        return
+    if event.repeat_every_days <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Repeat interval must be positive"
+        )
+    if event.end_time - event.date_time > timedelta(days=event.repeat_every_days):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Each occurrence must end by the time the next one starts"
+        )
+    if event.repeat_until is not None and event.repeat_until < event.end_time:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="repeat_until must be after the first occurrence ends"
+        )
+
+def _room_clash(
+    db: Session,
+    location: str,
+    proposed: Iterable[recurrence.Occurrence],
+    start: datetime,
+    end: datetime,
+    exclude_id: Optional[int] = None,
+    exclude_occurrence: Optional[datetime] = None,
+) -> Optional[str]:
+    """
+    Title of an event already in ``location`` during a ``proposed`` occurrence.
+    ``exclude_id`` leaves out that whole event; with ``exclude_occurrence``
+    only its occurrence scheduled then, so the rest of the series still counts.
+    """
+    key = models.normalize_location(location)
+
+    def criteria(entity):
+        found = [entity.location_key == key]
+        if exclude_id is not None and exclude_occurrence is None:
+            found.append(entity.event_id != exclude_id)
+        return found
+
+    booked = (
+        o for o in recurrence.between(db, start, end, criteria)
+        if exclude_occurrence is None
+        or (o.event.event_id, o.scheduled) != (exclude_id, exclude_occurrence)
+    )
+    # (start, end, title): None marks the proposed occurrences
+    periods = heapq.merge(
+        ((o.start, o.end, None) for o in proposed),
+        ((o.start, o.end, o.event.title) for o in booked),
+        key=lambda period: period[0],
+    )
+    for first, second in overlap.overlapping_pairs(periods):
+        if (first is None) != (second is None):
+            return first or second
+    return None
+
+def _last_clash(db: Session, event: schemas.EventCreate, exclude_id: Optional[int] = None) -> datetime:
+    """
+    A time after which open-ended series ``event`` can't clash with anything
+    not already checked: the end of the last booking in its room, or one
+    full cycle of both schedules past the later start of another open-ended
+    series there, after which the two only repeat.
+    """
+    key = models.normalize_location(event.location)
+    ends = [event.end_time]
+
+    one_off = db.query(func.max(models.Event.end_time)).filter(
+        models.Event.location_key == key, models.Event.repeat_every_days.is_(None)
+    )
+    until = db.query(func.max(models.Event.repeat_until)).filter(
+        models.Event.location_key == key, models.Event.repeat_every_days > 0
+    )
+    moved = db.query(func.max(models.EventOverride.end_time)).join(models.Event).filter(
+        models.Event.location_key == key
+    )
+    open_ended = db.query(models.Event).filter(
+        models.Event.location_key == key,
+        models.Event.repeat_every_days > 0,
+        models.Event.repeat_until.is_(None),
+    )
+    if exclude_id is not None:
+        until = until.filter(models.Event.event_id != exclude_id)
+        moved = moved.filter(models.Event.event_id != exclude_id)
+        open_ended = open_ended.filter(models.Event.event_id != exclude_id)
+    ends += [one_off.scalar(), until.scalar(), moved.scalar()]
+
+    length = event.end_time - event.date_time
+    for other in open_ended:
+        cycle = timedelta(days=math.lcm(event.repeat_every_days, other.repeat_every_days))
+        ends.append(max(event.date_time, other.date_time) + cycle + length)
+    return max(end for end in ends if end is not None)
+
+def _event_clash(db: Session, event: schemas.EventCreate, exclude_id: Optional[int] = None) -> Optional[str]:
+    """Title of an event already in ``event``'s room at one of its times."""
+    start = event.date_time
+    if recurrence.is_series(event):
+        end = event.repeat_until or _last_clash(db, event, exclude_id)
+    else:
+        end = event.end_time
+    proposed = recurrence.occurrences(event, {}, start, end)
+    return _room_clash(db, event.location, proposed, start, end, exclude_id)
+
+def _occurrence_read(occurrence: recurrence.Occurrence) -> schemas.EventRead:
+    """An occurrence, read as its event at the occurrence's times."""
+    read = schemas.EventRead.model_validate(occurrence.event, from_attributes=True)
+    return read.model_copy(update={
+        "date_time": occurrence.start,
+        "end_time": occurrence.end,
+        "occurrence_start": occurrence.scheduled,
+    })
+
 @router.post("/", response_model=schemas.EventRead, status_code=status.HTTP_201_CREATED)
 def create_event(event: schemas.EventCreate, db: Session = Depends(get_db)):
     """Create a new event."""
@@ -37,6 +176,7 @@ def create_event(event: schemas.EventCreate, db: Session = Depends(get_db)):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="End time must be after start time"
         )
+    _check_repeat(event)
     
     # Check for duplicate event title
     existing_event = db.query(models.Event).filter(
@@ -49,12 +189,93 @@ def create_event(event: schemas.EventCreate, db: Session = Depends(get_db)):
             detail="Event with this title already exists"
         )
     
+    # Check if the room is already booked
+    booked = _event_clash(db, event)
+    if booked:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{event.location} is already booked for {booked} during this time"
+        )
+    
     return crud.event.create(db, obj_in=event)
 
+@router.get("/upcoming", response_model=List[schemas.EventRead])
+def list_upcoming_events(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db)
+):
+    """Get all upcoming events, with recurring ones expanded into occurrences."""
+    current_time = datetime.utcnow()
+
+    def build():
+        soonest = recurrence.upcoming(db, current_time, skip + limit)
+        # the listing changes when the next upcoming occurrence starts
+        return (
+            [_occurrence_read(o) for o in soonest[skip:]],
+            soonest[0].start if soonest else None,
+        )
+
+    return upcoming_cache.get_or_build((skip, limit), current_time, build, response=response)
+
+@router.get("/past", response_model=List[schemas.EventRead])
+def list_past_events(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db)
+):
+    """Get all past events."""
+    current_time = datetime.utcnow()
+
+    def build():
+        # later pages run back into the archive
+        events = archive.newest_first(
+            db, models.Event, lambda e: [e.end_time <= current_time], skip, limit
+        )
+        # an event becomes "past" once it has ended
+        return (
+            cache.freeze(schemas.EventRead, events),
+            cache.next_boundary(db, models.Event.end_time, current_time),
+        )
+
+    return past_cache.get_or_build((skip, limit), current_time, build, response=response)
+
+@router.get("/free-slots", response_model=List[schemas.FreeSlotRead])
+def list_free_slots(
+    location: str,
+    start: datetime = Query(..., alias="from"),
+    end: datetime = Query(..., alias="to"),
+    duration: int = 60,
+    db: Session = Depends(get_db)
+):
+    """Get the open windows of at least ``duration`` minutes in a room."""
+    if end <= start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'to' must be after 'from'"
+        )
+    if duration <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Duration must be positive"
+        )
+
+    # the room's bookings in start order, straight off (location_key, date_time)
+    key = models.normalize_location(location)
+    bookings = (
+        (o.start, o.end)
+        for o in recurrence.between(db, start, end, lambda event: [event.location_key == key])
+    )
+
+    windows = overlap.free_windows(bookings, start, end, timedelta(minutes=duration))
+    return [schemas.FreeSlotRead(start=s, end=e) for s, e in windows]
+
 @router.get("/{event_id}", response_model=schemas.EventRead)
 def read_event(event_id: int, db: Session = Depends(get_db)):
     """Get a specific event by ID."""
-    event = crud.event.get(db, event_id)
+    event = missing_by_id.lookup(event_id, lambda: archive.get(db, models.Event, event_id))
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -64,12 +285,21 @@ def read_event(event_id: int, db: Session = Depends(get_db)):
 
 @router.get("/", response_model=List[schemas.EventRead])
 def list_events(
+    term_id: Optional[int] = None,
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db)
 ):
-    """Get all events."""
-    return crud.event.get_multi(db, skip=skip, limit=limit)
+    """Get all events, optionally only those held during an academic term."""
+    if term_id is None:
+        event = archive.source(db, models.Event)
+        return db.query(event).order_by(event.event_id).offset(skip).limit(limit).all()
+
+    term = terms.require(db, term_id)
+    event = archive.source(db, models.Event, term.start_date)
+    return db.query(event).filter(
+        terms.within(event.date_time, term)
+    ).order_by(event.date_time, event.event_id).offset(skip).limit(limit).all()
 
 @router.get("/officer/{officer_id}", response_model=List[schemas.EventRead])
 def list_officer_events(
@@ -87,33 +317,10 @@ def list_officer_events(
             detail="Officer not found"
         )
     
-    return db.query(models.Event).filter(
-        models.Event.created_by_officer_id == officer_id
-    ).offset(skip).limit(limit).all()
-
-@router.get("/upcoming", response_model=List[schemas.EventRead])
-def list_upcoming_events(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
-):
-    """Get all upcoming events."""
-    current_time = datetime.utcnow()
-    return db.query(models.Event).filter(
-        models.Event.date_time > current_time
-    ).order_by(models.Event.date_time).offset(skip).limit(limit).all()
-
-@router.get("/past", response_model=List[schemas.EventRead])
-def list_past_events(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
-):
-    """Get all past events."""
-    current_time = datetime.utcnow()
-    return db.query(models.Event).filter(
-        models.Event.end_time <= current_time
-    ).order_by(models.Event.date_time.desc()).offset(skip).limit(limit).all()
+    event = archive.source(db, models.Event)
+    return db.query(event).filter(
+        event.created_by_officer_id == officer_id
+    ).order_by(event.date_time, event.event_id).offset(skip).limit(limit).all()
 
 @router.put("/{event_id}", response_model=schemas.EventRead)
 def update_event(
@@ -122,12 +329,8 @@ def update_event(
     db: Session = Depends(get_db)
 ):
     """Update an event."""
-    db_event = crud.event.get(db, event_id)
-    if not db_event:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Event not found"
-        )
+    # archived events are read-only
+    db_event = archive.writable(db, models.Event, event_id)
     
     # Check if officer exists
     officer = crud.officer.get(db, event.created_by_officer_id)
@@ -143,6 +346,7 @@ def update_event(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="End time must be after start time"
         )
+    _check_repeat(event)
     
     # Check for duplicate event title
     existing_event = db.query(models.Event).filter(
@@ -156,16 +360,119 @@ def update_event(
             detail="Event with this title already exists"
         )
     
-    return crud.event.update(db, db_obj=db_event, obj_in=event.dict())
+    # Check if the room is already booked
+    booked = _event_clash(db, event, exclude_id=event_id)
+    if booked:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{event.location} is already booked for {booked} during this time"
+        )
+    
+    db_event = crud.event.update(db, db_obj=db_event, obj_in=event.dict())
+
+    # drop overrides of occurrences the new schedule no longer has
+    stale = [
+        o for o in db_event.overrides
+        if not recurrence.is_scheduled(db_event, o.occurrence_start)
+    ]
+    if stale:
+        for override in stale:
+            db.delete(override)
+        db.commit()
+    return db_event
 
 @router.delete("/{event_id}", response_model=schemas.EventRead)
 def delete_event(event_id: int, db: Session = Depends(get_db)):
     """Delete an event."""
-    event = crud.event.get(db, event_id)
+    # archived events are read-only
+    event = archive.writable(db, models.Event, event_id)
+    
+    return crud.event.remove(db, obj_id=event_id)
+
+@router.get("/{event_id}/occurrences", response_model=List[schemas.EventRead])
+def list_event_occurrences(
+    event_id: int,
+    start: datetime = Query(..., alias="from"),
+    end: datetime = Query(..., alias="to"),
+    db: Session = Depends(get_db)
+):
+    """Get the occurrences of an event between two times."""
+    event = archive.get(db, models.Event, event_id)
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found"
         )
-    
-    return crud.event.remove(db, obj_id=event_id)
+    if end <= start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'to' must be after 'from'"
+        )
+
+    if recurrence.is_series(event):
+        occurrences = recurrence.expand(db, [event], start, end)
+    else:
+        occurrences = recurrence.occurrences(event, {}, start, end)
+    return [_occurrence_read(o) for o in occurrences]
+
+@router.put("/{event_id}/occurrences/{occurrence_start}", response_model=schemas.EventOverrideRead)
+def override_occurrence(
+    event_id: int,
+    occurrence_start: datetime,
+    override: schemas.EventOverrideCreate,
+    db: Session = Depends(get_db)
+):
+    """Move or cancel one occurrence of a recurring event."""
+    # archived events are read-only
+    db_event = archive.writable(db, models.Event, event_id)
+    if not recurrence.is_scheduled(db_event, occurrence_start):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Occurrence not found"
+        )
+
+    # unset times keep the occurrence where (and as long as) it was scheduled
+    date_time = override.date_time or occurrence_start
+    end_time = override.end_time or date_time + (db_event.end_time - db_event.date_time)
+    if date_time >= end_time:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="End time must be after start time"
+        )
+
+    # Check if the room is already booked
+    if not override.cancelled:
+        booked = _room_clash(
+            db, db_event.location, [recurrence.Occurrence(date_time, end_time, db_event)],
+            date_time, end_time, exclude_id=event_id, exclude_occurrence=occurrence_start
+        )
+        if booked:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{db_event.location} is already booked for {booked} during this time"
+            )
+
+    db_override = db.get(models.EventOverride, (event_id, occurrence_start))
+    if db_override is None:
+        db_override = models.EventOverride(event_id=event_id, occurrence_start=occurrence_start)
+        db.add(db_override)
+    db_override.date_time = date_time
+    db_override.end_time = end_time
+    db_override.cancelled = override.cancelled
+    db.commit()
+    db.refresh(db_override)
+    return db_override
+
+@router.delete("/{event_id}/occurrences/{occurrence_start}", response_model=schemas.EventOverrideRead)
+def restore_occurrence(event_id: int, occurrence_start: datetime, db: Session = Depends(get_db)):
+    """Put one occurrence of a recurring event back on its schedule."""
+    db_override = db.get(models.EventOverride, (event_id, occurrence_start))
+    if not db_override:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Override not found"
+        )
+
+    db.delete(db_override)
+    db.commit()
+    return db_override
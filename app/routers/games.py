@@ -3,20 +3,37 @@ Games:
     - game_id | int auto-increment primary key
     - game_name | varchar(255) not null
     - bg_image | mediumblob not null
+    - match_duration_minutes | int not null default 60
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer, noload, selectinload
 from typing import List
 
-from .. import schemas, models, crud
+from .. import schemas, models, crud, cache, archive, standings
 from ..deps import get_db
 
 router = APIRouter()
 
+missing_by_id = cache.NegativeCache(
+    "games.missing_by_id", tables={"games"}, route="/games/{game_id}"
+)
+missing_by_name = cache.NegativeCache(
+    "games.missing_by_name", tables={"games"}, route="/games/name/{game_name}"
+)
+
+def _check_duration(game: schemas.GameCreate):
+    if game.match_duration_minutes <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Match duration must be positive"
+        )
+
 @router.post("/", response_model=schemas.GameRead, status_code=status.HTTP_201_CREATED)
 def create_game(game: schemas.GameCreate, db: Session = Depends(get_db)):
     """Create a new game."""
+    _check_duration(game)
+
     # Check for duplicate game name
     existing_game = db.query(models.Game).filter(
         models.Game.game_name == game.game_name
@@ -33,7 +50,7 @@ def create_game(game: schemas.GameCreate, db: Session = Depends(get_db)):
 @router.get("/{game_id}", response_model=schemas.GameRead)
 def read_game(game_id: int, db: Session = Depends(get_db)):
     """Get a specific game by ID."""
-    game = crud.game.get(db, game_id)
+    game = missing_by_id.lookup(game_id, lambda: crud.game.get(db, game_id))
     if not game:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -53,9 +70,9 @@ def list_games(
 @router.get("/name/{game_name}", response_model=schemas.GameRead)
 def read_game_by_name(game_name: str, db: Session = Depends(get_db)):
     """Get a specific game by name."""
-    game = db.query(models.Game).filter(
+    game = missing_by_name.lookup(game_name, lambda: db.query(models.Game).filter(
         models.Game.game_name == game_name
-    ).first()
+    ).first())
     
     if not game:
         raise HTTPException(
@@ -64,6 +81,52 @@ def read_game_by_name(game_name: str, db: Session = Depends(get_db)):
         )
     return game
 
+@router.get("/{game_id}/standings", response_model=List[schemas.TeamStandingRead])
+def list_game_standings(
+    game_id: int,
+    term_id: int = standings.ALL_TIME,
+    db: Session = Depends(get_db)
+):
+    """Get the standings of every team playing a game."""
+    # Check if game exists
+    game = crud.game.get(db, game_id)
+    if not game:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Game not found"
+        )
+
+    return db.query(models.TeamStanding).filter(
+        models.TeamStanding.term_id == term_id,
+        models.TeamStanding.game_id == game_id
+    ).order_by(
+        models.TeamStanding.wins.desc(), models.TeamStanding.losses
+    ).all()
+
+@router.get("/{game_id}/dashboard", response_model=schemas.GameDashboard)
+def read_game_dashboard(game_id: int, db: Session = Depends(get_db)):
+    """Get a game with its teams, coordinators, opponents and matches."""
+    # one query per collection, however many rows each holds; images stay in the db
+    game = db.query(models.Game).options(
+        defer(models.Game.bg_image),
+        selectinload(models.Game.teams),
+        selectinload(models.Game.coordinators),
+        selectinload(models.Game.opponents).defer(models.Opponent.logo),
+        noload(models.Game.matches),        # loaded below, with archived ones
+    ).filter(models.Game.game_id == game_id).first()
+    if not game:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Game not found"
+        )
+
+    match = archive.source(db, models.Match)
+    matches = db.query(match).filter(match.game_id == game_id).order_by(match.date_time)
+
+    dashboard = schemas.GameDashboard.model_validate(game, from_attributes=True)
+    dashboard.matches = cache.freeze(schemas.MatchRead, matches)
+    return dashboard
+
 @router.put("/{game_id}", response_model=schemas.GameRead)
 def update_game(
     game_id: int,
@@ -77,6 +140,7 @@ def update_game(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Game not found"
         )
+    _check_duration(game)
     
     # Check for duplicate game name
     existing_game = db.query(models.Game).filter(
@@ -0,0 +1,108 @@
+"""
+Internal:
+    Operational endpoints for sizing and debugging the in-process caches
+    (numbers are per worker process) and for repairing derived tables.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from .. import schemas, cache, standings, attendance, engagement, archive, locations
+from ..deps import get_db
+
+router = APIRouter()
+
+def _cache_stats(c) -> schemas.CacheStatsRead:
+    return schemas.CacheStatsRead(
+        name=c.name,
+        kind=c.kind,
+        route=c.route,
+        tables=sorted(c.tables),
+        hits=c.stats.hits,
+        misses=c.stats.misses,
+        stale_served=c.stats.stale_served,
+        evictions=c.stats.evictions,
+        invalidations=c.stats.invalidations,
+        entries=c.entry_count(),
+        memory_bytes=c.memory_bytes(),
+        builds=c.stats.builds,
+        avg_build_ms=c.stats.avg_build_ms,
+    )
+
+@router.get("/cache", response_model=schemas.CacheReport)
+def read_cache_stats():
+    """Get hit/miss/eviction counters and sizes for every cache, and per route."""
+    caches = sorted(cache.all_caches(), key=lambda c: c.name)
+
+    routes = {}
+    build_seconds = {}
+    for c in caches:
+        if c.route is None:
+            continue
+        route = routes.setdefault(
+            c.route, schemas.RouteCacheStatsRead(route=c.route, caches=[])
+        )
+        route.caches.append(c.name)
+        route.hits += c.stats.hits
+        route.misses += c.stats.misses
+        route.evictions += c.stats.evictions
+        route.entries += c.entry_count()
+        route.memory_bytes += c.memory_bytes()
+        route.builds += c.stats.builds
+        build_seconds[c.route] = build_seconds.get(c.route, 0.0) + c.stats.build_seconds
+    for route in routes.values():
+        lookups = route.hits + route.misses
+        route.hit_ratio = route.hits / lookups if lookups else None
+        if route.builds:
+            route.avg_build_ms = build_seconds[route.route] / route.builds * 1000
+
+    return schemas.CacheReport(
+        caches=[_cache_stats(c) for c in caches],
+        routes=sorted(routes.values(), key=lambda r: r.route),
+    )
+
+@router.delete("/cache", response_model=List[schemas.CacheStatsRead])
+def flush_caches(name: Optional[str] = None, table: Optional[str] = None):
+    """Flush one cache by name, every cache built from a table, or everything."""
+    if name is not None:
+        target = cache.get_cache(name)
+        if target is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Cache not found"
+            )
+        targets = [target]
+    elif table is not None:
+        targets = [c for c in cache.all_caches() if table in c.tables]
+    else:
+        targets = cache.all_caches()
+
+    for c in targets:
+        c.clear()
+    return [_cache_stats(c) for c in targets]
+
+@router.post("/standings/rebuild")
+def rebuild_standings(db: Session = Depends(get_db)):
+    """Recompute every team standing from the match history."""
+    return {"rows": standings.rebuild_all(db)}
+
+@router.post("/engagement/rebuild")
+def rebuild_engagement(db: Session = Depends(get_db)):
+    """Recompute every member's attendance counters for the leaderboard."""
+    return {"rows": engagement.rebuild_all(db)}
+
+@router.post("/attendance/reconcile")
+def reconcile_attendance(db: Session = Depends(get_db)):
+    """Recompute every event's attendance counter from its attendees."""
+    return {"corrected": attendance.reconcile(db)}
+
+@router.post("/locations/rekey")
+def rekey_locations(db: Session = Depends(get_db)):
+    """Recompute every event's room key from its location."""
+    return {"corrected": locations.rekey(db)}
+
+@router.post("/archive/run")
+def run_archive(db: Session = Depends(get_db)):
+    """Move matches and events from closed terms into the archive tables."""
+    return {"moved": archive.archive_closed_terms(db)}
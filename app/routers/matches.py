@@ -2,6 +2,7 @@
 Matches:
     - match_id | int auto-increment primary key
     - date_time | datetime not null
+    - end_time | datetime not null (date_time + duration, default the game's)
     - team_id | int not null
     - opponent_id | int not null
     - watch_link | varchar(255)
@@ -9,16 +10,44 @@ Matches:
     - game_id | int not null
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.orm import Session, defer
+from typing import List, Optional
+from datetime import datetime, timedelta
+from itertools import groupby
 
-from .. import schemas, models, crud
+from .. import schemas, models, crud, cache, archive, overlap, terms
 from ..deps import get_db
 
 router = APIRouter()
 
+upcoming_cache = cache.BoundaryCache(
+    "matches.upcoming", tables={"matches"}, route="/matches/upcoming"
+)
+past_cache = cache.BoundaryCache(
+    "matches.past", tables={"matches"}, route="/matches/past"
+)
+missing_by_id = cache.NegativeCache(
+    "matches.missing_by_id", tables={"matches"}, route="/matches/{match_id}"
+)
+
+def _end_time(match: schemas.MatchCreate, game, db_match=None) -> datetime:
+    """When ``match`` ends: its own duration, else its current one, else the game's."""
+    if match.duration_minutes is not None:
+        duration = timedelta(minutes=match.duration_minutes)
+    elif db_match is not None:
+        duration = db_match.end_time - db_match.date_time
+    else:
+        duration = timedelta(minutes=game.match_duration_minutes)
+    return match.date_time + duration
+
+def _check_duration(match: schemas.MatchCreate):
+    if match.duration_minutes is not None and match.duration_minutes <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Match duration must be positive"
+        )
+
 @router.post("/", response_model=schemas.MatchRead, status_code=status.HTTP_201_CREATED)
 def create_match(match: schemas.MatchCreate, db: Session = Depends(get_db)):
     """Create a new match."""
@@ -62,12 +91,164 @@ def create_match(match: schemas.MatchCreate, db: Session = Depends(get_db)):
             detail="Opponent's game does not match the specified game"
         )
     
-    return crud.match.create(db, obj_in=match)
+    # Check for a match the team is already playing at that time
+    _check_duration(match)
+    end_time = _end_time(match, game)
+    if overlap.find_overlap(db, models.Match, match.date_time, end_time, team_id=match.team_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Team already has a match during this time"
+        )
+    
+    db_match = models.Match(**match.dict(exclude={"duration_minutes"}), end_time=end_time)
+    db.add(db_match)
+    db.commit()
+    db.refresh(db_match)
+    return db_match
+
+@router.post("/batch", response_model=List[schemas.MatchRead], status_code=status.HTTP_201_CREATED)
+def create_matches(matches: List[schemas.MatchCreate], db: Session = Depends(get_db)):
+    """Create many matches at once; nothing is saved if any row is invalid."""
+    # Look up the teams, opponents and games, one query each
+    team_games = dict(db.query(models.Team.team_id, models.Team.game_id).filter(
+        models.Team.team_id.in_({m.team_id for m in matches})
+    ))
+    opponent_games = dict(db.query(models.Opponent.opponent_id, models.Opponent.game_id).filter(
+        models.Opponent.opponent_id.in_({m.opponent_id for m in matches})
+    ))
+    games = {game.game_id: game for game in db.query(models.Game).options(
+        defer(models.Game.bg_image)
+    ).filter(models.Game.game_id.in_({m.game_id for m in matches}))}
+
+    errors, rows = {}, []
+    for index, match in enumerate(matches):
+        rows.append(None)
+        if match.team_id not in team_games:
+            errors[index] = "Team not found"
+        elif match.opponent_id not in opponent_games:
+            errors[index] = "Opponent not found"
+        elif match.game_id not in games:
+            errors[index] = "Game not found"
+        elif team_games[match.team_id] != match.game_id:
+            errors[index] = "Team's game does not match the specified game"
+        elif opponent_games[match.opponent_id] != match.game_id:
+            errors[index] = "Opponent's game does not match the specified game"
+        elif match.duration_minutes is not None and match.duration_minutes <= 0:
+            errors[index] = "Match duration must be positive"
+        else:
+            rows[index] = models.Match(
+                **match.dict(exclude={"duration_minutes"}),
+                end_time=_end_time(match, games[match.game_id]),
+            )
+
+    for index, message in overlap.batch_conflicts(
+        db, models.Match, rows, "match", scope=("team_id",)
+    ).items():
+        errors.setdefault(index, message)
+
+    if errors:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=[{"index": index, "detail": errors[index]} for index in sorted(errors)]
+        )
+
+    db.add_all(rows)
+    db.flush()
+    ids = [row.match_id for row in rows]
+    db.commit()
+    # one query for all of them, returned in the order they were sent
+    saved = {m.match_id: m for m in db.query(models.Match).filter(models.Match.match_id.in_(ids))}
+    return [saved[match_id] for match_id in ids]
+
+@router.get("/upcoming", response_model=List[schemas.MatchRead])
+def list_upcoming_matches(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db)
+):
+    """Get all upcoming matches."""
+    current_time = datetime.utcnow()
+
+    def build():
+        matches = db.query(models.Match).filter(
+            models.Match.date_time > current_time
+        ).order_by(models.Match.date_time).offset(skip).limit(limit).all()
+        # the listing changes when the next upcoming match starts
+        return (
+            cache.freeze(schemas.MatchRead, matches),
+            cache.next_boundary(db, models.Match.date_time, current_time),
+        )
+
+    return upcoming_cache.get_or_build((skip, limit), current_time, build, response=response)
+
+@router.get("/past", response_model=List[schemas.MatchRead])
+def list_past_matches(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db)
+):
+    """Get all past matches."""
+    current_time = datetime.utcnow()
+
+    def build():
+        # later pages run back into the archive
+        matches = archive.newest_first(
+            db, models.Match, lambda m: [m.date_time <= current_time], skip, limit
+        )
+        return (
+            cache.freeze(schemas.MatchRead, matches),
+            cache.next_boundary(db, models.Match.date_time, current_time),
+        )
+
+    return past_cache.get_or_build((skip, limit), current_time, build, response=response)
+
+@router.get("/conflicts", response_model=List[schemas.MatchConflictRead])
+def list_match_conflicts(
+    team_id: Optional[int] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    db: Session = Depends(get_db)
+):
+    """Get every pair of overlapping matches for the same team."""
+    if team_id is not None:
+        # Check if team exists
+        team = crud.team.get(db, team_id)
+        if not team:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Team not found"
+            )
+
+    # each team's schedule in start order, straight off (team_id, date_time)
+    match = archive.source(db, models.Match, start)
+    query = db.query(match.team_id, match.match_id, match.date_time, match.end_time)
+    if team_id is not None:
+        query = query.filter(match.team_id == team_id)
+    if start is not None:
+        query = query.filter(match.end_time > start)
+    if end is not None:
+        query = query.filter(match.date_time < end)
+    rows = query.order_by(match.team_id, match.date_time)
+
+    conflicts = []
+    for team_id, schedule in groupby(rows, key=lambda row: row.team_id):
+        periods = ((row.date_time, row.end_time, row) for row in schedule)
+        for first, second in overlap.overlapping_pairs(periods):
+            conflicts.append(schemas.MatchConflictRead(
+                team_id=team_id,
+                match_id=first.match_id,
+                conflicting_match_id=second.match_id,
+                overlap_start=second.date_time,
+                overlap_end=min(first.end_time, second.end_time),
+            ))
+    return conflicts
 
 @router.get("/{match_id}", response_model=schemas.MatchRead)
 def read_match(match_id: int, db: Session = Depends(get_db)):
     """Get a specific match by ID."""
-    match = crud.match.get(db, match_id)
+    match = missing_by_id.lookup(match_id, lambda: archive.get(db, models.Match, match_id))
     if not match:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -77,12 +258,21 @@ def read_match(match_id: int, db: Session = Depends(get_db)):
 
 @router.get("/", response_model=List[schemas.MatchRead])
 def list_matches(
+    term_id: Optional[int] = None,
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db)
 ):
-    """Get all matches."""
-    return crud.match.get_multi(db, skip=skip, limit=limit)
+    """Get all matches, optionally only those played during an academic term."""
+    if term_id is None:
+        match = archive.source(db, models.Match)
+        return db.query(match).order_by(match.match_id).offset(skip).limit(limit).all()
+
+    term = terms.require(db, term_id)
+    match = archive.source(db, models.Match, term.start_date)
+    return db.query(match).filter(
+        terms.within(match.date_time, term)
+    ).order_by(match.date_time, match.match_id).offset(skip).limit(limit).all()
 
 @router.get("/team/{team_id}", response_model=List[schemas.MatchRead])
 def list_team_matches(
@@ -100,9 +290,10 @@ def list_team_matches(
             detail="Team not found"
         )
     
-    return db.query(models.Match).filter(
-        models.Match.team_id == team_id
-    ).offset(skip).limit(limit).all()
+    match = archive.source(db, models.Match)
+    return db.query(match).filter(
+        match.team_id == team_id
+    ).order_by(match.date_time, match.match_id).offset(skip).limit(limit).all()
 
 @router.get("/opponent/{opponent_id}", response_model=List[schemas.MatchRead])
 def list_opponent_matches(
@@ -120,9 +311,10 @@ def list_opponent_matches(
             detail="Opponent not found"
         )
     
-    return db.query(models.Match).filter(
-        models.Match.opponent_id == opponent_id
-    ).offset(skip).limit(limit).all()
+    match = archive.source(db, models.Match)
+    return db.query(match).filter(
+        match.opponent_id == opponent_id
+    ).order_by(match.date_time, match.match_id).offset(skip).limit(limit).all()
 
 @router.get("/game/{game_id}", response_model=List[schemas.MatchRead])
 def list_game_matches(
@@ -140,33 +332,10 @@ def list_game_matches(
             detail="Game not found"
         )
     
-    return db.query(models.Match).filter(
-        models.Match.game_id == game_id
-    ).offset(skip).limit(limit).all()
-
-@router.get("/upcoming", response_model=List[schemas.MatchRead])
-def list_upcoming_matches(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
-):
-    """Get all upcoming matches."""
-    current_time = datetime.utcnow()
-    return db.query(models.Match).filter(
-        models.Match.date_time > current_time
-    ).order_by(models.Match.date_time).offset(skip).limit(limit).all()
-
-@router.get("/past", response_model=List[schemas.MatchRead])
-def list_past_matches(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
-):
-    """Get all past matches."""
-    current_time = datetime.utcnow()
-    return db.query(models.Match).filter(
-        models.Match.date_time <= current_time
-    ).order_by(models.Match.date_time.desc()).offset(skip).limit(limit).all()
+    match = archive.source(db, models.Match)
+    return db.query(match).filter(
+        match.game_id == game_id
+    ).order_by(match.date_time, match.match_id).offset(skip).limit(limit).all()
 
 @router.put("/{match_id}", response_model=schemas.MatchRead)
 def update_match(
@@ -175,12 +344,8 @@ def update_match(
     db: Session = Depends(get_db)
 ):
     """Update a match."""
-    db_match = crud.match.get(db, match_id)
-    if not db_match:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Match not found"
-        )
+    # archived matches are read-only
+    db_match = archive.writable(db, models.Match, match_id)
     
     # Check if team exists
     team = crud.team.get(db, match.team_id)
@@ -222,16 +387,26 @@ def update_match(
             detail="Opponent's game does not match the specified game"
         )
     
-    return crud.match.update(db, db_obj=db_match, obj_in=match.dict())
+    # Check for another match the team is playing at that time
+    _check_duration(match)
+    end_time = _end_time(match, game, db_match)
+    clash = overlap.find_overlap(
+        db, models.Match, match.date_time, end_time,
+        exclude={"match_id": match_id},
+        team_id=match.team_id
+    )
+    if clash:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Team already has a match during this time"
+        )
+    
+    return crud.match.update(db, db_obj=db_match, obj_in={**match.dict(), "end_time": end_time})
 
 @router.delete("/{match_id}", response_model=schemas.MatchRead)
 def delete_match(match_id: int, db: Session = Depends(get_db)):
     """Delete a match."""
-    match = crud.match.get(db, match_id)
-    if not match:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Match not found"
-        )
+    # archived matches are read-only
+    match = archive.writable(db, models.Match, match_id)
     
     return crud.match.remove(db, obj_id=match_id)
\ No newline at end of file
@@ -75,7 +75,7 @@ def list_term_media(
     
     return db.query(models.Media).filter(
         models.Media.academic_term_id == term_id
-    ).offset(skip).limit(limit).all()
+    ).order_by(models.Media.date_uploaded).offset(skip).limit(limit).all()
 
 @router.delete("/{media_id}", response_model=schemas.MediaRead)
 def delete_media(media_id: int, db: Session = Depends(get_db)):
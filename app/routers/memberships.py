@@ -9,13 +9,26 @@ Memberships:
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import datetime
 
-from .. import schemas, models, crud
-from ..deps import get_db
+from .. import schemas, models, crud, cache, overlap, terms
+from ..deps import get_db, point_in_time
 
 router = APIRouter()
 
+missing_by_id = cache.NegativeCache(
+    "memberships.missing_by_id",
+    tables={"memberships"},
+    route="/memberships/{membership_id}",
+)
+
+def _starting(membership: schemas.MembershipCreate, now: datetime) -> schemas.MembershipCreate:
+    """``membership`` with its start date filled in: given, or else ``now``."""
+    if membership.start_date is not None:
+        return membership
+    return membership.copy(update={"start_date": now})
+
 @router.post("/", response_model=schemas.MembershipRead, status_code=status.HTTP_201_CREATED)
 def create_membership(membership: schemas.MembershipCreate, db: Session = Depends(get_db)):
     """Create a new membership."""
@@ -36,16 +49,12 @@ def create_membership(membership: schemas.MembershipCreate, db: Session = Depend
                 detail="Shirt size not found"
             )
     
-    # Check for overlapping memberships
-    overlapping_membership = db.query(models.Membership).filter(
-        models.Membership.user_id == membership.user_id,
-        ((models.Membership.start_date <= membership.start_date) & 
-         (models.Membership.end_date >= membership.start_date)) |
-        ((models.Membership.start_date <= membership.end_date) & 
-         (models.Membership.end_date >= membership.end_date)) |
-        ((models.Membership.start_date >= membership.start_date) & 
-         (models.Membership.end_date <= membership.end_date))
-    ).first()
+    # Check for overlapping memberships (start_date defaults to now)
+    membership = _starting(membership, datetime.utcnow())
+    overlapping_membership = overlap.find_overlap(
+        db, models.Membership, membership.start_date, membership.end_date,
+        user_id=membership.user_id
+    )
     
     if overlapping_membership:
         raise HTTPException(
@@ -55,10 +64,46 @@ def create_membership(membership: schemas.MembershipCreate, db: Session = Depend
     
     return crud.membership.create(db, obj_in=membership)
 
+@router.post("/batch", response_model=List[schemas.MembershipRead], status_code=status.HTTP_201_CREATED)
+def create_memberships(memberships: List[schemas.MembershipCreate], db: Session = Depends(get_db)):
+    """Create many memberships at once; nothing is saved if any row is invalid."""
+    # start_date defaults to now: one now, used for the check and the row
+    now = datetime.utcnow()
+    memberships = [_starting(membership, now) for membership in memberships]
+    errors = overlap.batch_conflicts(db, models.Membership, memberships, "membership")
+
+    # Check that the users and shirt sizes exist, one query each
+    user_ids = {user_id for user_id, in db.query(models.User.user_id).filter(
+        models.User.user_id.in_({m.user_id for m in memberships})
+    )}
+    size_ids = {size_id for size_id, in db.query(models.ShirtSize.size_id).filter(
+        models.ShirtSize.size_id.in_({m.shirt_size_id for m in memberships if m.shirt_size_id})
+    )}
+    for index, membership in enumerate(memberships):
+        if membership.user_id not in user_ids:
+            errors[index] = "User not found"
+        elif membership.shirt_size_id and membership.shirt_size_id not in size_ids:
+            errors[index] = "Shirt size not found"
+
+    if errors:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=[{"index": index, "detail": errors[index]} for index in sorted(errors)]
+        )
+
+    rows = [models.Membership(**membership.dict()) for membership in memberships]
+    db.add_all(rows)
+    db.flush()
+    ids = [row.membership_id for row in rows]
+    db.commit()
+    return db.query(models.Membership).filter(
+        models.Membership.membership_id.in_(ids)
+    ).order_by(models.Membership.membership_id).all()
+
 @router.get("/{membership_id}", response_model=schemas.MembershipRead)
 def read_membership(membership_id: int, db: Session = Depends(get_db)):
     """Get a specific membership by ID."""
-    membership = crud.membership.get(db, membership_id)
+    membership = missing_by_id.lookup(membership_id, lambda: crud.membership.get(db, membership_id))
     if not membership:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -68,12 +113,23 @@ def read_membership(membership_id: int, db: Session = Depends(get_db)):
 
 @router.get("/", response_model=List[schemas.MembershipRead])
 def list_memberships(
+    term_id: Optional[int] = None,
     skip: int = 0,
     limit: int = 100,
+    as_of: Optional[datetime] = Depends(point_in_time),
     db: Session = Depends(get_db)
 ):
-    """Get all memberships."""
-    return crud.membership.get_multi(db, skip=skip, limit=limit)
+    """Get all memberships, optionally only those active during a term or at a point in time."""
+    if term_id is None and as_of is None:
+        return crud.membership.get_multi(db, skip=skip, limit=limit)
+
+    query = db.query(models.Membership)
+    if term_id is not None:
+        term = terms.require(db, term_id)
+        query = query.filter(terms.active_during(models.Membership, term))
+    if as_of is not None:
+        query = query.filter(overlap.active_at(models.Membership, as_of))
+    return query.order_by(models.Membership.start_date).offset(skip).limit(limit).all()
 
 @router.get("/user/{user_id}", response_model=List[schemas.MembershipRead])
 def list_user_memberships(
@@ -93,7 +149,7 @@ def list_user_memberships(
     
     return db.query(models.Membership).filter(
         models.Membership.user_id == user_id
-    ).offset(skip).limit(limit).all()
+    ).order_by(models.Membership.start_date).offset(skip).limit(limit).all()
 
 @router.put("/{membership_id}", response_model=schemas.MembershipRead)
 def update_membership(
@@ -119,16 +175,12 @@ def update_membership(
             )
     
     # Check for overlapping memberships
-    overlapping_membership = db.query(models.Membership).filter(
-        models.Membership.membership_id != membership_id,
-        models.Membership.user_id == membership.user_id,
-        ((models.Membership.start_date <= membership.start_date) & 
-         (models.Membership.end_date >= membership.start_date)) |
-        ((models.Membership.start_date <= membership.end_date) & 
-         (models.Membership.end_date >= membership.end_date)) |
-        ((models.Membership.start_date >= membership.start_date) & 
-         (models.Membership.end_date <= membership.end_date))
-    ).first()
+    overlapping_membership = overlap.find_overlap(
+        db, models.Membership,
+        membership.start_date or db_membership.start_date, membership.end_date,
+        exclude={"membership_id": membership_id},
+        user_id=membership.user_id
+    )
     
     if overlapping_membership:
         raise HTTPException(
@@ -10,13 +10,18 @@ Officers:
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import datetime
 
-from .. import schemas, models, crud
-from ..deps import get_db
+from .. import schemas, models, crud, cache, overlap
+from ..deps import get_db, point_in_time
 
 router = APIRouter()
 
+missing_by_id = cache.NegativeCache(
+    "officers.missing_by_id", tables={"officers"}, route="/officers/{officer_id}"
+)
+
 @router.post("/", response_model=schemas.OfficerRead, status_code=status.HTTP_201_CREATED)
 def create_officer(officer: schemas.OfficerCreate, db: Session = Depends(get_db)):
     """Create a new officer."""
@@ -37,15 +42,10 @@ def create_officer(officer: schemas.OfficerCreate, db: Session = Depends(get_db)
         )
     
     # Check for overlapping officer periods
-    overlapping_officer = db.query(models.Officer).filter(
-        models.Officer.user_id == officer.user_id,
-        ((models.Officer.start_date <= officer.start_date) & 
-         (models.Officer.end_date >= officer.start_date)) |
-        ((models.Officer.start_date <= officer.end_date) & 
-         (models.Officer.end_date >= officer.end_date)) |
-        ((models.Officer.start_date >= officer.start_date) & 
-         (models.Officer.end_date <= officer.end_date))
-    ).first()
+    overlapping_officer = overlap.find_overlap(
+        db, models.Officer, officer.start_date, officer.end_date,
+        user_id=officer.user_id
+    )
     
     if overlapping_officer:
         raise HTTPException(
@@ -55,10 +55,43 @@ def create_officer(officer: schemas.OfficerCreate, db: Session = Depends(get_db)
     
     return crud.officer.create(db, obj_in=officer)
 
+@router.post("/batch", response_model=List[schemas.OfficerRead], status_code=status.HTTP_201_CREATED)
+def create_officers(officers: List[schemas.OfficerCreate], db: Session = Depends(get_db)):
+    """Create many officer terms at once; nothing is saved if any row is invalid."""
+    errors = overlap.batch_conflicts(db, models.Officer, officers, "officer")
+
+    # Check that the users and roles exist, one query each
+    user_ids = {user_id for user_id, in db.query(models.User.user_id).filter(
+        models.User.user_id.in_({o.user_id for o in officers})
+    )}
+    role_ids = {role_id for role_id, in db.query(models.Role.role_id).filter(
+        models.Role.role_id.in_({o.role_id for o in officers})
+    )}
+    for index, officer in enumerate(officers):
+        if officer.user_id not in user_ids:
+            errors[index] = "User not found"
+        elif officer.role_id not in role_ids:
+            errors[index] = "Role not found"
+
+    if errors:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=[{"index": index, "detail": errors[index]} for index in sorted(errors)]
+        )
+
+    rows = [models.Officer(**officer.dict()) for officer in officers]
+    db.add_all(rows)
+    db.flush()
+    ids = [row.officer_id for row in rows]
+    db.commit()
+    return db.query(models.Officer).filter(
+        models.Officer.officer_id.in_(ids)
+    ).order_by(models.Officer.officer_id).all()
+
 @router.get("/{officer_id}", response_model=schemas.OfficerRead)
 def read_officer(officer_id: int, db: Session = Depends(get_db)):
     """Get a specific officer by ID."""
-    officer = crud.officer.get(db, officer_id)
+    officer = missing_by_id.lookup(officer_id, lambda: crud.officer.get(db, officer_id))
     if not officer:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -70,19 +103,26 @@ def read_officer(officer_id: int, db: Session = Depends(get_db)):
 def list_officers(
     skip: int = 0,
     limit: int = 100,
+    as_of: Optional[datetime] = Depends(point_in_time),
     db: Session = Depends(get_db)
 ):
-    """Get all officers."""
-    return crud.officer.get_multi(db, skip=skip, limit=limit)
+    """Get all officers, or only those in office at a point in time."""
+    if as_of is None:
+        return crud.officer.get_multi(db, skip=skip, limit=limit)
+
+    return db.query(models.Officer).filter(
+        overlap.active_at(models.Officer, as_of)
+    ).offset(skip).limit(limit).all()
 
 @router.get("/role/{role_id}", response_model=List[schemas.OfficerRead])
 def list_role_officers(
     role_id: int,
     skip: int = 0,
     limit: int = 100,
+    as_of: Optional[datetime] = Depends(point_in_time),
     db: Session = Depends(get_db)
 ):
-    """Get all officers with a specific role."""
+    """Get all officers with a specific role, optionally at a point in time."""
     # Check if role exists
     role = crud.role.get(db, role_id)
     if not role:
@@ -91,9 +131,12 @@ def list_role_officers(
             detail="Role not found"
         )
     
-    return db.query(models.Officer).filter(
+    query = db.query(models.Officer).filter(
         models.Officer.role_id == role_id
-    ).offset(skip).limit(limit).all()
+    )
+    if as_of is not None:
+        query = query.filter(overlap.active_at(models.Officer, as_of))
+    return query.offset(skip).limit(limit).all()
 
 @router.put("/{officer_id}", response_model=schemas.OfficerRead)
 def update_officer(
@@ -110,16 +153,11 @@ def update_officer(
         )
     
     # Check for overlapping officer periods
-    overlapping_officer = db.query(models.Officer).filter(
-        models.Officer.officer_id != officer_id,
-        models.Officer.user_id == officer.user_id,
-        ((models.Officer.start_date <= officer.start_date) & 
-         (models.Officer.end_date >= officer.start_date)) |
-        ((models.Officer.start_date <= officer.end_date) & 
-         (models.Officer.end_date >= officer.end_date)) |
-        ((models.Officer.start_date >= officer.start_date) & 
-         (models.Officer.end_date <= officer.end_date))
-    ).first()
+    overlapping_officer = overlap.find_overlap(
+        db, models.Officer, officer.start_date, officer.end_date,
+        exclude={"officer_id": officer_id},
+        user_id=officer.user_id
+    )
     
     if overlapping_officer:
         raise HTTPException(
@@ -8,14 +8,20 @@ Opponents:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import datetime
 
-from .. import schemas, models, crud
+from .. import schemas, models, crud, cache, archive, standings, terms
 from ..deps import get_db
 
 router = APIRouter()
 
+missing_by_id = cache.NegativeCache(
+    "opponents.missing_by_id", tables={"opponents"}, route="/opponents/{opponent_id}"
+)
+
 @router.post("/", response_model=schemas.OpponentRead, status_code=status.HTTP_201_CREATED)
 def create_opponent(opponent: schemas.OpponentCreate, db: Session = Depends(get_db)):
     """Create a new opponent."""
@@ -44,7 +50,7 @@ def create_opponent(opponent: schemas.OpponentCreate, db: Session = Depends(get_
 @router.get("/{opponent_id}", response_model=schemas.OpponentRead)
 def read_opponent(opponent_id: int, db: Session = Depends(get_db)):
     """Get a specific opponent by ID."""
-    opponent = crud.opponent.get(db, opponent_id)
+    opponent = missing_by_id.lookup(opponent_id, lambda: crud.opponent.get(db, opponent_id))
     if not opponent:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -81,6 +87,103 @@ def list_game_opponents(
         models.Opponent.game_id == game_id
     ).offset(skip).limit(limit).all()
 
+@router.get("/{opponent_id}/head-to-head", response_model=schemas.HeadToHeadRead)
+def read_head_to_head(
+    opponent_id: int,
+    team_id: Optional[int] = None,
+    game_id: Optional[int] = None,
+    db: Session = Depends(get_db)
+):
+    """Get our aggregated record against an opponent, split per academic term."""
+    # Check if opponent exists
+    opponent = crud.opponent.get(db, opponent_id)
+    if not opponent:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Opponent not found"
+        )
+
+    match = archive.source(db, models.Match)
+    criteria = [match.opponent_id == opponent_id]
+    if team_id is not None:
+        criteria.append(match.team_id == team_id)
+    if game_id is not None:
+        criteria.append(match.game_id == game_id)
+    # the record covers matches already played; fixtures are counted apart
+    now = datetime.utcnow()
+    played = criteria + [match.date_time <= now]
+
+    # One row per (term, distinct result string): bounded by the number of
+    # terms, not by the number of matches played
+    grouped = db.query(
+        models.AcademicTerm.term_id,
+        models.AcademicTerm.semester,
+        models.AcademicTerm.start_date,
+        match.result,
+        func.count(match.match_id),
+    ).select_from(match).outerjoin(
+        models.AcademicTerm, terms.within(match.date_time),
+    ).filter(*played).group_by(
+        models.AcademicTerm.term_id,
+        models.AcademicTerm.semester,
+        models.AcademicTerm.start_date,
+        match.result,
+    ).all()
+
+    splits, split_starts = {}, {}
+    for term_id, semester, start_date, result, count in grouped:
+        split = splits.get(term_id)
+        if split is None:
+            split = splits[term_id] = schemas.HeadToHeadTermRead(
+                term_id=term_id, semester=semester, matches=0, wins=0, losses=0, undecided=0
+            )
+            split_starts[term_id] = start_date
+        split.matches += count
+        decided = standings.outcome(result)
+        if decided == standings.WIN:
+            split.wins += count
+        elif decided == standings.LOSS:
+            split.losses += count
+        else:
+            split.undecided += count
+    # chronological, with matches outside any term last
+    per_term = sorted(
+        splits.values(),
+        key=lambda t: (t.term_id is None, split_starts[t.term_id] or datetime.min),
+    )
+
+    recent = db.query(match).filter(*played).order_by(match.date_time.desc())
+    last_meeting = recent.first()
+    upcoming = db.query(match).filter(*criteria, match.date_time > now)
+    scheduled = upcoming.count()
+    next_meeting = upcoming.order_by(match.date_time).first() if scheduled else None
+
+    # walk back from the latest meeting until the run of results breaks
+    streak = 0
+    for (result,) in recent.with_entities(match.result).yield_per(20):
+        decided = standings.outcome(result)
+        if decided is None:
+            continue
+        step = 1 if decided == standings.WIN else -1
+        if streak and (streak > 0) != (step > 0):
+            break
+        streak += step
+
+    return schemas.HeadToHeadRead(
+        opponent_id=opponent_id,
+        team_id=team_id,
+        game_id=game_id,
+        matches=sum(t.matches for t in per_term),
+        wins=sum(t.wins for t in per_term),
+        losses=sum(t.losses for t in per_term),
+        undecided=sum(t.undecided for t in per_term),
+        streak=streak,
+        last_meeting=cache.freeze(schemas.MatchRead, [last_meeting])[0] if last_meeting else None,
+        scheduled=scheduled,
+        next_meeting=cache.freeze(schemas.MatchRead, [next_meeting])[0] if next_meeting else None,
+        terms=per_term,
+    )
+
 @router.put("/{opponent_id}", response_model=schemas.OpponentRead)
 def update_opponent(
     opponent_id: int,
@@ -4,15 +4,30 @@ ShirtSizes:
     - size_name | enum('XS', 'S', 'M', 'L', 'XL', 'XXL') nullable
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import List
+from datetime import datetime
+import csv
+import io
 
-from .. import schemas, models, crud
+from .. import schemas, models, crud, cache, terms
 from ..deps import get_db
 
 router = APIRouter()
 
+missing_by_id = cache.NegativeCache(
+    "shirt_sizes.missing_by_id", tables={"shirt_sizes"}, route="/shirt-sizes/{size_id}"
+)
+# Reports for closed terms never expire. A membership or size write drops
+# them all, and each is rebuilt on its next read.
+report_cache = cache.BoundaryCache(
+    "shirt_sizes.report",
+    tables={"academic_terms", "shirt_sizes", "memberships"},
+    route="/shirt-sizes/report",
+)
+
 @router.post("/", response_model=schemas.ShirtSizeRead, status_code=status.HTTP_201_CREATED)
 def create_shirt_size(shirt_size: schemas.ShirtSizeCreate, db: Session = Depends(get_db)):
     """Create a new shirt size."""
@@ -30,10 +45,75 @@ def create_shirt_size(shirt_size: schemas.ShirtSizeCreate, db: Session = Depends
     
     return crud.shirt_size.create(db, obj_in=shirt_size)
 
+def _size_report(db: Session, term_id: int) -> schemas.ShirtSizeReport:
+    """Count shirt sizes among memberships active at any point in a term."""
+    term = crud.academic_term.get(db, term_id)
+    if not term:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Academic term not found"
+        )
+
+    now = datetime.utcnow()
+    closed = terms.closed(term, now)
+    if closed:
+        generation = report_cache.generation
+        report = report_cache.get(term_id, now)
+        if report is not None:
+            return report
+
+    counts = dict(db.query(
+        models.ShirtSize.size_name, func.count(models.Membership.membership_id)
+    ).select_from(models.Membership).outerjoin(
+        models.ShirtSize, models.ShirtSize.size_id == models.Membership.shirt_size_id
+    ).filter(
+        terms.active_during(models.Membership, term)
+    ).group_by(models.ShirtSize.size_name).all())
+
+    sizes = [
+        schemas.ShirtSizeCountRead(size_name=size.value, count=counts.get(size, 0))
+        for size in models.ShirtSizeEnum
+    ]
+    if counts.get(None):
+        sizes.append(schemas.ShirtSizeCountRead(size_name=None, count=counts[None]))
+    report = schemas.ShirtSizeReport(
+        term_id=term.term_id,
+        semester=term.semester,
+        closed=closed,
+        total=sum(counts.values()),
+        sizes=sizes,
+    )
+    if closed:
+        report_cache.put(term_id, report, generation=generation)
+    return report
+
+@router.get("/report", response_model=schemas.ShirtSizeReport)
+def read_shirt_size_report(term_id: int, db: Session = Depends(get_db)):
+    """Get how many shirts of each size members active in a term need."""
+    return _size_report(db, term_id)
+
+@router.get("/report.csv")
+def read_shirt_size_report_csv(term_id: int, db: Session = Depends(get_db)):
+    """Get the shirt size report for a term as CSV."""
+    report = _size_report(db, term_id)
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(["size", "count"])
+    for size in report.sizes:
+        writer.writerow([size.size_name or "unspecified", size.count])
+    writer.writerow(["total", report.total])
+
+    filename = f"shirt-sizes-{report.semester}.csv".replace(" ", "-").lower()
+    return Response(
+        content=out.getvalue(),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 @router.get("/{size_id}", response_model=schemas.ShirtSizeRead)
 def read_shirt_size(size_id: int, db: Session = Depends(get_db)):
     """Get a specific shirt size by ID."""
-    shirt_size = crud.shirt_size.get(db, size_id)
+    shirt_size = missing_by_id.lookup(size_id, lambda: crud.shirt_size.get(db, size_id))
     if not shirt_size:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -8,15 +8,23 @@ Sponsors:
     - sponsor_website | varchar(255) nullable
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from typing import List
+from datetime import datetime
 
-from .. import schemas, models, crud
+from .. import schemas, models, crud, cache
 from ..deps import get_db
 
 router = APIRouter()
 
+active_cache = cache.BoundaryCache(
+    "sponsors.active", tables={"sponsors"}, route="/sponsors/active"
+)
+missing_by_id = cache.NegativeCache(
+    "sponsors.missing_by_id", tables={"sponsors"}, route="/sponsors/{sponsor_id}"
+)
+
 @router.post("/", response_model=schemas.SponsorRead, status_code=status.HTTP_201_CREATED)
 def create_sponsor(sponsor: schemas.SponsorCreate, db: Session = Depends(get_db)):
     """Create a new sponsor."""
@@ -33,10 +41,38 @@ def create_sponsor(sponsor: schemas.SponsorCreate, db: Session = Depends(get_db)
     
     return crud.sponsor.create(db, obj_in=sponsor)
 
+@router.get("/active", response_model=List[schemas.SponsorRead])
+def list_active_sponsors(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db)
+):
+    """Get all active sponsors."""
+    current_date = datetime.now()
+
+    def build():
+        sponsors = db.query(models.Sponsor).filter(
+            models.Sponsor.start_date <= current_date,
+            (models.Sponsor.end_date >= current_date) | (models.Sponsor.end_date == None)
+        ).offset(skip).limit(limit).all()
+        # changes when a sponsorship starts, or right after one ends
+        return (
+            cache.freeze(schemas.SponsorRead, sponsors),
+            cache.earliest(
+                cache.next_boundary(db, models.Sponsor.start_date, current_date),
+                cache.after(cache.next_boundary(
+                    db, models.Sponsor.end_date, current_date, inclusive=True
+                )),
+            ),
+        )
+
+    return active_cache.get_or_build((skip, limit), current_date, build, response=response)
+
 @router.get("/{sponsor_id}", response_model=schemas.SponsorRead)
 def read_sponsor(sponsor_id: int, db: Session = Depends(get_db)):
     """Get a specific sponsor by ID."""
-    sponsor = crud.sponsor.get(db, sponsor_id)
+    sponsor = missing_by_id.lookup(sponsor_id, lambda: crud.sponsor.get(db, sponsor_id))
     if not sponsor:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -53,21 +89,6 @@ def list_sponsors(
     """Get all sponsors."""
     return crud.sponsor.get_multi(db, skip=skip, limit=limit)
 
-@router.get("/active", response_model=List[schemas.SponsorRead])
-def list_active_sponsors(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
-):
-    """Get all active sponsors."""
-    from datetime import datetime
-    current_date = datetime.now()
-    
-    return db.query(models.Sponsor).filter(
-        models.Sponsor.start_date <= current_date,
-        (models.Sponsor.end_date >= current_date) | (models.Sponsor.end_date == None)
-    ).offset(skip).limit(limit).all()
-
 @router.put("/{sponsor_id}", response_model=schemas.SponsorRead)
 def update_sponsor(
     sponsor_id: int,
@@ -9,10 +9,11 @@ TeamMemberships:
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import datetime
 
-from .. import schemas, models, crud
-from ..deps import get_db
+from .. import schemas, models, crud, images, overlap
+from ..deps import get_db, point_in_time
 
 router = APIRouter()
 
@@ -36,12 +37,11 @@ def create_team_membership(team_membership: schemas.TeamMembershipCreate, db: Se
         )
     
     # Check for overlapping team memberships
-    existing_membership = db.query(models.TeamMembership).filter(
-        models.TeamMembership.team_id == team_membership.team_id,
-        models.TeamMembership.membership_id == team_membership.membership_id,
-        models.TeamMembership.start_date <= team_membership.end_date,
-        models.TeamMembership.end_date >= team_membership.start_date
-    ).first()
+    existing_membership = overlap.find_overlap(
+        db, models.TeamMembership, team_membership.start_date, team_membership.end_date,
+        team_id=team_membership.team_id,
+        membership_id=team_membership.membership_id
+    )
     
     if existing_membership:
         raise HTTPException(
@@ -56,9 +56,10 @@ def list_team_members(
     team_id: int,
     skip: int = 0,
     limit: int = 100,
+    as_of: Optional[datetime] = Depends(point_in_time),
     db: Session = Depends(get_db)
 ):
-    """Get all members of a specific team."""
+    """Get all members of a specific team, optionally at a point in time."""
     # Check if team exists
     team = crud.team.get(db, team_id)
     if not team:
@@ -67,18 +68,22 @@ def list_team_members(
             detail="Team not found"
         )
     
-    return db.query(models.TeamMembership).filter(
+    query = db.query(models.TeamMembership).filter(
         models.TeamMembership.team_id == team_id
-    ).offset(skip).limit(limit).all()
+    )
+    if as_of is not None:
+        query = query.filter(overlap.active_at(models.TeamMembership, as_of))
+    return query.offset(skip).limit(limit).all()
 
 @router.get("/membership/{membership_id}", response_model=List[schemas.TeamMembershipRead])
 def list_membership_teams(
     membership_id: int,
     skip: int = 0,
     limit: int = 100,
+    as_of: Optional[datetime] = Depends(point_in_time),
     db: Session = Depends(get_db)
 ):
-    """Get all teams for a specific membership."""
+    """Get all teams for a specific membership, optionally at a point in time."""
     # Check if membership exists
     membership = crud.membership.get(db, membership_id)
     if not membership:
@@ -87,9 +92,27 @@ def list_membership_teams(
             detail="Membership not found"
         )
     
-    return db.query(models.TeamMembership).filter(
+    query = db.query(models.TeamMembership).filter(
+        models.TeamMembership.membership_id == membership_id
+    )
+    if as_of is not None:
+        query = query.filter(overlap.active_at(models.TeamMembership, as_of))
+    return query.offset(skip).limit(limit).all()
+
+@router.get("/{team_id}/{membership_id}/image")
+def read_player_image(team_id: int, membership_id: int, db: Session = Depends(get_db)):
+    """Get a player's team photo."""
+    image = db.query(models.TeamMembership.player_image).filter(
+        models.TeamMembership.team_id == team_id,
         models.TeamMembership.membership_id == membership_id
-    ).offset(skip).limit(limit).all()
+    ).scalar()
+
+    if image is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Player image not found"
+        )
+    return images.image_response(image)
 
 @router.put("/{team_id}/{membership_id}", response_model=schemas.TeamMembershipRead)
 def update_team_membership(
@@ -111,14 +134,12 @@ def update_team_membership(
         )
     
     # Check for overlapping team memberships
-    existing_membership = db.query(models.TeamMembership).filter(
-        models.TeamMembership.team_id == team_membership.team_id,
-        models.TeamMembership.membership_id == team_membership.membership_id,
-        models.TeamMembership.team_id != team_id,
-        models.TeamMembership.membership_id != membership_id,
-        models.TeamMembership.start_date <= team_membership.end_date,
-        models.TeamMembership.end_date >= team_membership.start_date
-    ).first()
+    existing_membership = overlap.find_overlap(
+        db, models.TeamMembership, team_membership.start_date, team_membership.end_date,
+        exclude={"team_id": team_id, "membership_id": membership_id},
+        team_id=team_membership.team_id,
+        membership_id=team_membership.membership_id
+    )
     
     if existing_membership:
         raise HTTPException(
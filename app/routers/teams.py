@@ -12,12 +12,17 @@ Teams:
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
+from datetime import datetime
 
-from .. import schemas, models, crud
+from .. import schemas, models, crud, cache, overlap, standings
 from ..deps import get_db
 
 router = APIRouter()
 
+missing_by_id = cache.NegativeCache(
+    "teams.missing_by_id", tables={"teams"}, route="/teams/{team_id}"
+)
+
 @router.post("/", response_model=schemas.TeamRead, status_code=status.HTTP_201_CREATED)
 def create_team(team: schemas.TeamCreate, db: Session = Depends(get_db)):
     """Create a new team."""
@@ -50,10 +55,24 @@ def create_team(team: schemas.TeamCreate, db: Session = Depends(get_db)):
     
     return crud.team.create(db, obj_in=team)
 
+@router.get("/standings", response_model=List[schemas.TeamStandingRead])
+def list_team_standings(
+    term_id: int = standings.ALL_TIME,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db)
+):
+    """Get team standings for an academic term (all time by default)."""
+    return db.query(models.TeamStanding).filter(
+        models.TeamStanding.term_id == term_id
+    ).order_by(
+        models.TeamStanding.wins.desc(), models.TeamStanding.losses
+    ).offset(skip).limit(limit).all()
+
 @router.get("/{team_id}", response_model=schemas.TeamRead)
 def read_team(team_id: int, db: Session = Depends(get_db)):
     """Get a specific team by ID."""
-    team = crud.team.get(db, team_id)
+    team = missing_by_id.lookup(team_id, lambda: crud.team.get(db, team_id))
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -61,6 +80,64 @@ def read_team(team_id: int, db: Session = Depends(get_db)):
         )
     return team
 
+@router.get("/{team_id}/roster", response_model=List[schemas.RosterMemberRead])
+def read_team_roster(
+    team_id: int,
+    active_only: bool = True,
+    db: Session = Depends(get_db)
+):
+    """Get a team's players with their names, shirt sizes and photo links."""
+    # Check if team exists
+    team = crud.team.get(db, team_id)
+    if not team:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Team not found"
+        )
+
+    tm = models.TeamMembership
+    # one joined query; the photo itself is served separately
+    query = db.query(
+        tm.membership_id,
+        tm.start_date,
+        tm.end_date,
+        tm.player_image.isnot(None).label("has_image"),
+        models.User.user_id,
+        models.User.first_name,
+        models.User.last_name,
+        models.ShirtSize.size_name,
+    ).join(
+        models.Membership, models.Membership.membership_id == tm.membership_id
+    ).join(
+        models.User, models.User.user_id == models.Membership.user_id
+    ).outerjoin(
+        models.ShirtSize, models.ShirtSize.size_id == models.Membership.shirt_size_id
+    ).filter(tm.team_id == team_id)
+
+    if active_only:
+        now = datetime.utcnow()
+        query = query.filter(
+            overlap.active_at(tm, now),
+            overlap.active_at(models.Membership, now)
+        )
+
+    return [
+        schemas.RosterMemberRead(
+            membership_id=row.membership_id,
+            user_id=row.user_id,
+            first_name=row.first_name,
+            last_name=row.last_name,
+            shirt_size=row.size_name.value if row.size_name else None,
+            start_date=row.start_date,
+            end_date=row.end_date,
+            image_url=(
+                f"/team-memberships/{team_id}/{row.membership_id}/image"
+                if row.has_image else None
+            ),
+        )
+        for row in query.order_by(models.User.last_name, models.User.first_name)
+    ]
+
 @router.get("/", response_model=List[schemas.TeamRead])
 def list_teams(
     skip: int = 0,
@@ -9,16 +9,33 @@ Users:
     - signup_date date not null
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func
+from sqlalchemy.orm import Session, defer, selectinload
+from typing import List, Optional
 from datetime import date, datetime
 
-from .. import schemas, models, crud
+from .. import schemas, models, crud, cache, archive, terms
+from ..standings import ALL_TIME
 from ..deps import get_db
 
 router = APIRouter()
 
+PROFILE_SECTIONS = (
+    "memberships",
+    "officer_terms",
+    "coordinator_assignments",
+    "team_memberships",
+    "events_attended",
+)
+
+missing_by_id = cache.NegativeCache(
+    "users.missing_by_id", tables={"users"}, route="/users/{user_id}"
+)
+missing_by_email = cache.NegativeCache(
+    "users.missing_by_email", tables={"users"}, route="/users/email/{email}"
+)
+
 @router.post("/", response_model=schemas.UserRead, status_code=status.HTTP_201_CREATED)
 def create_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
     """Create a new user."""
@@ -39,10 +56,72 @@ def create_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
     
     return crud.user.create(db, obj_in=schemas.UserCreate(**user_data))
 
+@router.get("/leaderboard", response_model=List[schemas.LeaderboardEntryRead])
+def read_leaderboard(
+    term_id: int = ALL_TIME,
+    k: int = Query(10, ge=1, le=100),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    db: Session = Depends(get_db)
+):
+    """Get the k members who attended the most events."""
+    if term_id != ALL_TIME:
+        term = crud.academic_term.get(db, term_id)
+        if not term:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Academic term not found"
+            )
+
+    if start is None and end is None:
+        # top k straight off the (term_id, events_attended DESC, user_id) index
+        count = models.UserEngagement.events_attended
+        tiebreak = models.UserEngagement.user_id
+        query = db.query(models.User, count).join(
+            models.UserEngagement, models.UserEngagement.user_id == models.User.user_id
+        ).filter(
+            models.UserEngagement.term_id == term_id,
+            count > 0
+        )
+    else:
+        # arbitrary windows have no counter rows; aggregate the attendees
+        starts = [d for d in (start, term.start_date if term_id != ALL_TIME else None) if d is not None]
+        since = max(starts) if starts else None
+        event = archive.source(db, models.Event, since)
+        attendee = archive.source(db, models.EventAttendee, since)
+        count = func.count(attendee.event_id)
+        query = db.query(models.User, count).join(
+            attendee, attendee.user_id == models.User.user_id
+        ).join(
+            event, event.event_id == attendee.event_id
+        )
+        if term_id != ALL_TIME:
+            query = query.filter(terms.within(event.date_time, term))
+        if start is not None:
+            query = query.filter(event.date_time >= start)
+        if end is not None:
+            query = query.filter(event.date_time < end)
+        query = query.group_by(models.User.user_id)
+        tiebreak = models.User.user_id
+
+    leaders = []
+    for position, (user, attended) in enumerate(
+        query.order_by(count.desc(), tiebreak).limit(k), start=1
+    ):
+        tied = leaders and leaders[-1].events_attended == attended
+        leaders.append(schemas.LeaderboardEntryRead(
+            rank=leaders[-1].rank if tied else position,
+            user_id=user.user_id,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            events_attended=attended,
+        ))
+    return leaders
+
 @router.get("/{user_id}", response_model=schemas.UserRead)
 def read_user(user_id: int, db: Session = Depends(get_db)):
     """Get a specific user by ID."""
-    user = crud.user.get(db, user_id)
+    user = missing_by_id.lookup(user_id, lambda: crud.user.get(db, user_id))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -50,6 +129,73 @@ def read_user(user_id: int, db: Session = Depends(get_db)):
         )
     return user
 
+@router.get("/{user_id}/profile", response_model=schemas.UserProfile)
+def read_user_profile(
+    user_id: int,
+    include: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """Get a user with their memberships, officer and coordinator terms, teams and events."""
+    sections = PROFILE_SECTIONS if include is None else [
+        name.strip() for name in include.split(",") if name.strip()
+    ]
+    unknown = sorted(set(sections) - set(PROFILE_SECTIONS))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown profile sections: {', '.join(unknown)}"
+        )
+
+    # one extra query per requested section; image columns are never loaded
+    loaders = {
+        "memberships": [selectinload(models.User.memberships)],
+        "officer_terms": [
+            selectinload(models.User.officers).defer(models.Officer.officer_image)
+        ],
+        "coordinator_assignments": [selectinload(models.User.coordinators)],
+        "team_memberships": [
+            selectinload(models.User.memberships)
+            .selectinload(models.Membership.team_memberships)
+            .defer(models.TeamMembership.player_image)
+        ],
+        "events_attended": [
+            selectinload(models.User.event_attendees).selectinload(models.EventAttendee.event)
+        ],
+    }
+    options = [option for name in set(sections) for option in loaders[name]]
+    user = db.query(models.User).options(*options).filter(
+        models.User.user_id == user_id
+    ).first()
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+
+    profile = schemas.UserProfile(
+        user_id=user.user_id,
+        email=user.email,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        signup_date=user.signup_date,
+    )
+    if "memberships" in sections:
+        profile.memberships = cache.freeze(schemas.MembershipRead, user.memberships)
+    if "officer_terms" in sections:
+        profile.officer_terms = cache.freeze(schemas.OfficerTermRead, user.officers)
+    if "coordinator_assignments" in sections:
+        profile.coordinator_assignments = cache.freeze(schemas.CoordinatorRead, user.coordinators)
+    if "team_memberships" in sections:
+        profile.team_memberships = cache.freeze(schemas.PlayerTermRead, [
+            tm for membership in user.memberships for tm in membership.team_memberships
+        ])
+    if "events_attended" in sections:
+        profile.events_attended = sorted(
+            cache.freeze(schemas.EventRead, [a.event for a in user.event_attendees]),
+            key=lambda e: e.date_time
+        )
+    return profile
+
 @router.get("/", response_model=List[schemas.UserRead])
 def list_users(
     skip: int = 0,
@@ -62,9 +208,9 @@ def list_users(
 @router.get("/email/{email}", response_model=schemas.UserRead)
 def read_user_by_email(email: str, db: Session = Depends(get_db)):
     """Get a specific user by email."""
-    user = db.query(models.User).filter(
+    user = missing_by_email.lookup(email, lambda: db.query(models.User).filter(
         models.User.email == email
-    ).first()
+    ).first())
     
     if not user:
         raise HTTPException(
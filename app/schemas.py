@@ -20,6 +20,21 @@ class AcademicTermRead(AcademicTermBase):
         orm_mode = True
 
 
+class TermSummaryRead(BaseModel):
+    term_id: int
+    semester: str
+    start_date: datetime
+    end_date: datetime
+    closed: bool
+    new_users: int
+    active_memberships: int
+    events_held: int
+    total_attendance: int
+    matches_played: int
+    matches_won: int
+    media_uploaded: int
+
+
 class CoordinatorBase(BaseModel):
     user_id: int
     game_id: int
@@ -61,8 +76,10 @@ class EventBase(BaseModel):
     location: str
     date_time: datetime
     end_time: datetime
-    attendence: Optional[int] = None
     created_by_officer_id: int
+    # a series repeats every N days while an occurrence ends by repeat_until
+    repeat_every_days: Optional[int] = None
+    repeat_until: Optional[datetime] = None
 
 
 class EventCreate(EventBase):
@@ -71,14 +88,43 @@ class EventCreate(EventBase):
 
 class EventRead(EventBase):
     event_id: int
+    attendance: int = 0     # maintained from event_attendees, not writable
+    # set on one occurrence of a series: the start it was scheduled for
+    occurrence_start: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
+
+
+class EventOverrideBase(BaseModel):
+    date_time: Optional[datetime] = None    # defaults to the scheduled times
+    end_time: Optional[datetime] = None
+    cancelled: bool = False
+
+
+class EventOverrideCreate(EventOverrideBase):
+    pass
+
+
+class EventOverrideRead(EventOverrideBase):
+    event_id: int
+    occurrence_start: datetime
+    date_time: datetime
+    end_time: datetime
 
     class Config:
         orm_mode = True
 
 
+class FreeSlotRead(BaseModel):
+    start: datetime
+    end: datetime
+
+
 class GameBase(BaseModel):
     game_name: str
     bg_image: Optional[bytes] = None
+    match_duration_minutes: int = 60
 
 
 class GameCreate(GameBase):
@@ -102,16 +148,25 @@ class MatchBase(BaseModel):
 
 
 class MatchCreate(MatchBase):
-    pass
+    duration_minutes: Optional[int] = None      # defaults to the game's
 
 
 class MatchRead(MatchBase):
     match_id: int
+    end_time: datetime
 
     class Config:
         orm_mode = True
 
 
+class MatchConflictRead(BaseModel):
+    team_id: int
+    match_id: int
+    conflicting_match_id: int       # starts later (or at the same time)
+    overlap_start: datetime
+    overlap_end: datetime
+
+
 class MediaBase(BaseModel):
     media_image: Optional[bytes] = None
     academic_term_id: int
@@ -185,6 +240,30 @@ class OpponentRead(OpponentBase):
         orm_mode = True
 
 
+class HeadToHeadTermRead(BaseModel):
+    term_id: Optional[int] = None       # None = not inside any academic term
+    semester: Optional[str] = None
+    matches: int
+    wins: int
+    losses: int
+    undecided: int
+
+
+class HeadToHeadRead(BaseModel):
+    opponent_id: int
+    team_id: Optional[int] = None
+    game_id: Optional[int] = None
+    matches: int
+    wins: int
+    losses: int
+    undecided: int
+    streak: int                         # +n = n straight wins, -n = n straight losses
+    last_meeting: Optional[MatchRead] = None
+    scheduled: int = 0                  # fixtures not yet played, left out of the record
+    next_meeting: Optional[MatchRead] = None
+    terms: List[HeadToHeadTermRead]
+
+
 class RoleBase(BaseModel):
     role_name: str
 
@@ -215,6 +294,19 @@ class ShirtSizeRead(ShirtSizeBase):
         orm_mode = True
 
 
+class ShirtSizeCountRead(BaseModel):
+    size_name: Optional[str] = None     # None = membership without a size
+    count: int
+
+
+class ShirtSizeReport(BaseModel):
+    term_id: int
+    semester: str
+    closed: bool
+    total: int
+    sizes: List[ShirtSizeCountRead]
+
+
 class SponsorBase(BaseModel):
     sponsor_name: str
     start_date: datetime
@@ -274,6 +366,31 @@ class TeamRead(TeamBase):
         orm_mode = True
 
 
+class RosterMemberRead(BaseModel):
+    membership_id: int
+    user_id: int
+    first_name: str
+    last_name: str
+    shirt_size: Optional[str] = None
+    start_date: datetime
+    end_date: Optional[datetime] = None
+    image_url: Optional[str] = None
+
+
+class TeamStandingRead(BaseModel):
+    team_id: int
+    term_id: int        # 0 = all time
+    game_id: int
+    wins: int
+    losses: int
+    streak: int         # +n = n straight wins, -n = n straight losses
+    last_results: str   # oldest first, e.g. "WWLW"
+    last_match_at: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
+
+
 class UserBase(BaseModel):
     email: str
     password_hash: str
@@ -291,3 +408,111 @@ class UserRead(UserBase):
 
     class Config:
         orm_mode = True
+
+
+class OfficerTermRead(BaseModel):
+    officer_id: int
+    role_id: int
+    start_date: datetime
+    end_date: Optional[datetime] = None
+
+
+class PlayerTermRead(BaseModel):
+    team_id: int
+    membership_id: int
+    start_date: datetime
+    end_date: Optional[datetime] = None
+
+
+class UserProfile(BaseModel):
+    user_id: int
+    email: str
+    first_name: str
+    last_name: str
+    signup_date: datetime
+    # sections left out through ?include= are null
+    memberships: Optional[List[MembershipRead]] = None
+    officer_terms: Optional[List[OfficerTermRead]] = None
+    coordinator_assignments: Optional[List[CoordinatorRead]] = None
+    team_memberships: Optional[List[PlayerTermRead]] = None
+    events_attended: Optional[List[EventRead]] = None
+
+
+class LeaderboardEntryRead(BaseModel):
+    rank: int           # ties share a rank: 1, 2, 2, 4
+    user_id: int
+    first_name: str
+    last_name: str
+    events_attended: int
+
+
+class OpponentSummaryRead(BaseModel):
+    opponent_id: int
+    opponent_name: str
+    school: Optional[str] = None
+
+
+class GameSummaryRead(BaseModel):
+    game_id: int
+    game_name: str
+    match_duration_minutes: int
+
+
+class SponsorSummaryRead(BaseModel):
+    sponsor_id: int
+    sponsor_name: str
+    start_date: datetime
+    end_date: Optional[datetime] = None
+    sponsor_website: Optional[str] = None
+
+
+class GameDashboard(BaseModel):
+    game_id: int
+    game_name: str
+    teams: List[TeamRead]
+    coordinators: List[CoordinatorRead]
+    opponents: List[OpponentSummaryRead]
+    matches: List[MatchRead]        # oldest first
+
+
+class HomeBundle(BaseModel):
+    upcoming_matches: List[MatchRead]
+    upcoming_events: List[EventRead]
+    active_sponsors: List[SponsorSummaryRead]
+    teams: List[TeamRead]
+    games: List[GameSummaryRead]
+    generated_at: datetime
+
+
+class CacheStatsRead(BaseModel):
+    name: str
+    kind: str
+    route: Optional[str] = None
+    tables: List[str]
+    hits: int
+    misses: int
+    stale_served: int
+    evictions: int
+    invalidations: int
+    entries: int
+    memory_bytes: int
+    builds: int
+    avg_build_ms: Optional[float] = None
+
+
+class RouteCacheStatsRead(BaseModel):
+    route: str
+    caches: List[str]
+    hits: int = 0
+    misses: int = 0
+    hit_ratio: Optional[float] = None
+    evictions: int = 0
+    entries: int = 0
+    memory_bytes: int = 0
+    builds: int = 0
+    avg_build_ms: Optional[float] = None
+
+
+class CacheReport(BaseModel):
+    caches: List[CacheStatsRead]
+    routes: List[RouteCacheStatsRead]
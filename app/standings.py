@@ -0,0 +1,224 @@
+"""
+Team standings materialised from match results.
+
+``team_standings`` holds one row per team per academic term plus an
+all-time row (``term_id`` 0). Rows are kept up to date from the session
+flush hooks below, so any code path that writes a ``Match`` updates the
+standings in the same transaction:
+
+    - a new result later than anything the team already has is applied in
+      O(1) (counts, streak and last-N are all derivable from the old row);
+    - anything else (edits, deletes, back-dated results) recomputes just
+      the affected team's row for that scope.
+
+Run ``python -m app.standings`` to rebuild everything from scratch.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from . import archive, models, terms
+
+ALL_TIME = 0
+LAST_N = 10
+
+WIN, LOSS = "W", "L"
+_OUTCOMES = {
+    "w": WIN, "win": WIN, "won": WIN, "victory": WIN,
+    "l": LOSS, "loss": LOSS, "lose": LOSS, "lost": LOSS, "defeat": LOSS,
+}
+
+
+def outcome(result: Optional[str]) -> Optional[str]:
+    """Map a free-form ``Match.result`` to ``"W"``/``"L"``, or ``None``."""
+    if not result:
+        return None
+    text = result.strip().lower()
+    if text in _OUTCOMES:
+        return _OUTCOMES[text]
+    # scores such as "2-1" / "13 - 11", ours first
+    parts = text.replace(" ", "").split("-")
+    if len(parts) == 2 and all(p.isdigit() for p in parts):
+        ours, theirs = int(parts[0]), int(parts[1])
+        if ours != theirs:
+            return WIN if ours > theirs else LOSS
+    return None
+
+
+def _apply(standing: models.TeamStanding, result: str, played_at: datetime) -> None:
+    """Append one result to a standing whose history ends before it."""
+    if result == WIN:
+        standing.wins += 1
+        standing.streak = standing.streak + 1 if standing.streak > 0 else 1
+    else:
+        standing.losses += 1
+        standing.streak = standing.streak - 1 if standing.streak < 0 else -1
+    standing.last_results = (standing.last_results + result)[-LAST_N:]
+    standing.last_match_at = played_at
+
+
+def _reset(standing: models.TeamStanding) -> None:
+    standing.wins = 0
+    standing.losses = 0
+    standing.streak = 0
+    standing.last_results = ""
+    standing.last_match_at = None
+
+
+def _scopes(db: Session, moment: datetime) -> List[int]:
+    term = terms.resolver.term_for(db, moment)
+    return [ALL_TIME] if term is None else [ALL_TIME, term.term_id]
+
+
+def recompute(db: Session, team_id: int, term_id: int) -> None:
+    """Rebuild one team's standing for one scope from its matches."""
+    term = None
+    if term_id != ALL_TIME:
+        term = terms.resolver.get(db, term_id)
+        if term is None:                # term is gone; so is its standing
+            db.query(models.TeamStanding).filter(
+                models.TeamStanding.team_id == team_id,
+                models.TeamStanding.term_id == term_id,
+            ).delete(synchronize_session="fetch")
+            return
+    match = archive.source(db, models.Match, term.start_date if term else None)
+    query = db.query(
+        match.game_id, match.date_time, match.result
+    ).filter(match.team_id == team_id)
+    if term is not None:
+        query = query.filter(terms.within(match.date_time, term))
+    rows = query.order_by(match.date_time).all()
+
+    game_id = rows[0].game_id if rows else db.query(models.Team.game_id).filter(
+        models.Team.team_id == team_id
+    ).scalar()
+    if game_id is None:                 # team is gone; cascade drops its rows
+        return
+    standing = db.get(models.TeamStanding, (team_id, term_id))
+    if standing is None:
+        standing = models.TeamStanding(team_id=team_id, term_id=term_id)
+        db.add(standing)
+    _reset(standing)
+    standing.game_id = game_id
+    for row in rows:
+        result = outcome(row.result)
+        if result is not None:
+            _apply(standing, result, row.date_time)
+
+
+def rebuild_all(db: Session) -> int:
+    """Recompute every standing in one pass over ``matches``; returns row count."""
+    db.query(models.TeamStanding).delete()
+    standings: Dict[Tuple[int, int], models.TeamStanding] = {}
+
+    for team_id, game_id in db.query(models.Team.team_id, models.Team.game_id):
+        standings[(team_id, ALL_TIME)] = models.TeamStanding(
+            team_id=team_id, term_id=ALL_TIME, game_id=game_id
+        )
+    for standing in standings.values():
+        _reset(standing)
+
+    source = archive.source(db, models.Match)
+    matches = db.query(
+        source.team_id, source.game_id, source.date_time, source.result
+    ).order_by(source.team_id, source.date_time)
+    for match in matches:
+        result = outcome(match.result)
+        if result is None:
+            continue
+        # the same term assignment as the flush hooks
+        for term_id in _scopes(db, match.date_time):
+            standing = standings.get((match.team_id, term_id))
+            if standing is None:
+                standing = models.TeamStanding(
+                    team_id=match.team_id, term_id=term_id, game_id=match.game_id
+                )
+                _reset(standing)
+                standings[(match.team_id, term_id)] = standing
+            _apply(standing, result, match.date_time)
+
+    db.add_all(standings.values())
+    db.commit()
+    return len(standings)
+
+
+# --------------------------------------------------------------------------
+# Flush hooks: note which team results changed, then update their rows
+# --------------------------------------------------------------------------
+def _history(match: models.Match, attr: str):
+    """(old, new) value of an attribute on a flushed ``Match``."""
+    hist = inspect(match).attrs[attr].history
+    new = getattr(match, attr)
+    old = hist.deleted[0] if hist.deleted else new
+    return old, new
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_match_changes(session, flush_context):
+    appended: List[Tuple[int, int, datetime, str]] = []
+    touched: Set[Tuple[int, datetime]] = set()
+
+    for obj in session.new:
+        if isinstance(obj, models.Match):
+            result = outcome(obj.result)
+            if result is not None:
+                appended.append((obj.team_id, obj.game_id, obj.date_time, result))
+    for obj in session.deleted:
+        if isinstance(obj, models.Match) and outcome(obj.result) is not None:
+            touched.add((obj.team_id, obj.date_time))
+    for obj in session.dirty:
+        if not isinstance(obj, models.Match):
+            continue
+        changes = [_history(obj, attr) for attr in ("team_id", "date_time", "result")]
+        if all(old == new for old, new in changes):
+            continue
+        (old_team, new_team), (old_at, new_at), _ = changes
+        touched.add((old_team, old_at))
+        touched.add((new_team, new_at))
+
+    if appended or touched:
+        pending = session.info.setdefault("standings_pending", ([], set()))
+        pending[0].extend(appended)
+        pending[1].update(touched)
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _update_standings(session, flush_context):
+    pending = session.info.pop("standings_pending", None)
+    if pending is None:
+        return
+    appended, touched = pending
+
+    with session.no_autoflush:
+        stale: Set[Tuple[int, int]] = set()
+        for team_id, at in touched:
+            stale.update((team_id, term_id) for term_id in _scopes(session, at))
+
+        for team_id, game_id, played_at, result in sorted(appended, key=lambda a: a[2]):
+            for term_id in _scopes(session, played_at):
+                if (team_id, term_id) in stale:
+                    continue
+                standing = session.get(models.TeamStanding, (team_id, term_id))
+                if standing is not None and (
+                    standing.last_match_at is None or played_at >= standing.last_match_at
+                ):
+                    _apply(standing, result, played_at)
+                else:
+                    # first row for this scope, or a back-dated result
+                    stale.add((team_id, term_id))
+
+        for team_id, term_id in stale:
+            recompute(session, team_id, term_id)
+
+
+if __name__ == "__main__":
+    from .database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        print(f"rebuilt {rebuild_all(db)} standings rows")
+    finally:
+        db.close()
@@ -0,0 +1,145 @@
+"""
+Map dates to academic terms without a query per lookup.
+
+Events, matches and memberships are tied to terms only by their dates.
+``resolver`` keeps every term's range in memory, sorted by start date, so
+``term_for`` is a bisect and ``get`` a dict lookup. The ranges are reloaded
+after a write to ``academic_terms`` (and at least every ``RELOAD_SECONDS``,
+to pick up writes made by other worker processes).
+
+A term covers ``[start_date, end_date)``, like every period in
+``app.overlap``: terms may touch, and a moment on the shared boundary
+belongs to the later term. Count and filter by term only through
+``within``/``contains`` and ``resolver.term_for`` so every path agrees.
+"""
+
+import bisect
+import time
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
+
+from . import cache, models, overlap
+
+RELOAD_SECONDS = 300.0
+
+
+class Term(NamedTuple):
+    term_id: int
+    semester: str
+    start_date: datetime
+    end_date: datetime
+
+
+class TermResolver(cache._Cache):
+    kind = "resolver"
+
+    def __init__(self):
+        super().__init__("academic_terms.resolver", tables={"academic_terms"})
+        self._terms: List[Term] = []
+        self._starts: List[datetime] = []
+        self._by_id: Dict[int, Term] = {}
+        self._loaded_at: Optional[float] = None
+
+    def _load(self, db: Session) -> List[Term]:
+        rows = db.query(
+            models.AcademicTerm.term_id,
+            models.AcademicTerm.semester,
+            models.AcademicTerm.start_date,
+            models.AcademicTerm.end_date,
+        ).order_by(models.AcademicTerm.start_date).all()
+        return [Term(*row) for row in rows]
+
+    def _snapshot(self, db: Session):
+        """(terms, starts, by_id), reloading first if they may be out of date."""
+        if "academic_terms" in db.info.get("written_tables", ()):
+            # uncommitted term edits in this session: use them, don't keep them
+            return self._index(self._load(db))
+
+        with self._lock:
+            if self._loaded_at is not None and time.monotonic() - self._loaded_at < RELOAD_SECONDS:
+                self.stats.hits += 1
+                return self._terms, self._starts, self._by_id
+            self.stats.misses += 1
+            generation = self._generation
+
+        terms, starts, by_id = self._index(self._timed(lambda: self._load(db)))
+        with self._lock:
+            # a write committed mid-load; the next lookup reloads
+            if generation == self._generation:
+                self._terms, self._starts, self._by_id = terms, starts, by_id
+                self._loaded_at = time.monotonic()
+        return terms, starts, by_id
+
+    @staticmethod
+    def _index(terms: List[Term]):
+        return terms, [t.start_date for t in terms], {t.term_id: t for t in terms}
+
+    def get(self, db: Session, term_id: int) -> Optional[Term]:
+        return self._snapshot(db)[2].get(term_id)
+
+    def term_for(self, db: Session, moment: datetime) -> Optional[Term]:
+        """The term whose range contains ``moment``, if any."""
+        terms, starts, _ = self._snapshot(db)
+        index = bisect.bisect_right(starts, moment) - 1
+        if index >= 0 and contains(terms[index], moment):
+            return terms[index]
+        return None
+
+    def entry_count(self) -> int:
+        return len(self._terms)
+
+    def memory_bytes(self) -> int:
+        with self._lock:
+            return cache.deep_sizeof(self._terms)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.stats.evictions += len(self._terms)
+            self._terms, self._starts, self._by_id = [], [], {}
+            self._loaded_at = None
+            self._generation += 1
+
+
+resolver = TermResolver()
+
+
+def require(db: Session, term_id: int) -> Term:
+    """The term with ``term_id``, or a 404."""
+    term = resolver.get(db, term_id)
+    if term is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Academic term not found"
+        )
+    return term
+
+
+def within(column, term=models.AcademicTerm):
+    """
+    SQL predicate: ``column`` falls inside ``term`` (a range probe). Pass
+    ``models.AcademicTerm`` itself (the default) to join on term dates.
+    """
+    return and_(column >= term.start_date, column < term.end_date)
+
+
+def active_during(model, term=models.AcademicTerm):
+    """
+    SQL predicate: a ``model`` row's own period (a membership, say)
+    overlaps ``term``. Like ``within``, ``term`` may be
+    ``models.AcademicTerm`` itself, to join on term dates.
+    """
+    return overlap.overlaps(model, term.start_date, term.end_date)
+
+
+def contains(term, moment: datetime) -> bool:
+    """Python twin of ``within``."""
+    return term.start_date <= moment < term.end_date
+
+
+def closed(term, now: datetime) -> bool:
+    """Whether ``term`` is over: nothing dated ``now`` or later falls in it."""
+    return term.end_date <= now
@@ -0,0 +1,54 @@
+-- Composite indexes for the filtered and ordered list routes.
+--
+-- New databases get these from Base.metadata.create_all (they are declared
+-- in app/models.py); run this once against an existing database. Each index
+-- leads with the equality filter and ends with the column the route orders
+-- or range-filters on, so the query reads rows in order instead of sorting.
+
+-- ACADEMIC TERMS: term lookups by date
+CREATE INDEX ix_academic_terms_start_end ON academic_terms (start_date, end_date);
+
+-- COORDINATORS: overlap checks; /coordinators/game/{id}
+CREATE INDEX ix_coordinators_user_game_start ON coordinators (user_id, game_id, start_date, end_date);
+CREATE INDEX ix_coordinators_game_start ON coordinators (game_id, start_date);
+
+-- EVENT ATTENDEES: /event-attendees/user/{id}, leaderboard recounts
+CREATE INDEX ix_event_attendees_user_event ON event_attendees (user_id, event_id);
+
+-- EVENTS: /events/upcoming, /events/past, term filters, /events/officer/{id}
+CREATE INDEX ix_events_date_time ON events (date_time);
+CREATE INDEX ix_events_end_time ON events (end_time);
+CREATE INDEX ix_events_officer_date_time ON events (created_by_officer_id, date_time);
+
+-- MATCHES: every listing filters on one of these and orders by date_time
+CREATE INDEX ix_matches_date_time ON matches (date_time);
+CREATE INDEX ix_matches_team_date_time ON matches (team_id, date_time);
+CREATE INDEX ix_matches_opponent_date_time ON matches (opponent_id, date_time);
+CREATE INDEX ix_matches_game_date_time ON matches (game_id, date_time);
+
+-- MEDIA: /media/term/{id}
+CREATE INDEX ix_media_term_uploaded ON media (academic_term_id, date_uploaded);
+
+-- MEMBERSHIPS: overlap checks, /memberships/user/{id}; term and as_of filters
+CREATE INDEX ix_memberships_user_start ON memberships (user_id, start_date, end_date);
+CREATE INDEX ix_memberships_start_end ON memberships (start_date, end_date);
+
+-- OFFICERS: overlap checks; /officers/role/{id}
+CREATE INDEX ix_officers_user_start ON officers (user_id, start_date, end_date);
+CREATE INDEX ix_officers_role_start ON officers (role_id, start_date);
+
+-- OPPONENTS
+CREATE INDEX ix_opponents_game ON opponents (game_id);
+
+-- SPONSORS: /sponsors/active
+CREATE INDEX ix_sponsors_start_end ON sponsors (start_date, end_date);
+
+-- TEAM MEMBERSHIPS: /team-memberships/membership/{id}
+CREATE INDEX ix_team_memberships_membership_start ON team_memberships (membership_id, start_date);
+
+-- TEAMS
+CREATE INDEX ix_teams_game ON teams (game_id);
+CREATE INDEX ix_teams_coordinator ON teams (coordinator_id);
+
+-- USERS: term summaries count sign-ups by date
+CREATE INDEX ix_users_signup_date ON users (signup_date);
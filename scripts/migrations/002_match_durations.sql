@@ -0,0 +1,14 @@
+-- Match durations: games get a default match length, matches an end time.
+--
+-- Existing matches are given their game's default length. Run
+-- GET /matches/conflicts afterwards to find double bookings that predate
+-- the overlap check.
+
+ALTER TABLE games ADD COLUMN match_duration_minutes INT NOT NULL DEFAULT 60;
+ALTER TABLE games ADD CONSTRAINT chk_match_duration_positive CHECK (match_duration_minutes > 0);
+
+ALTER TABLE matches ADD COLUMN end_time DATETIME NULL AFTER date_time;
+UPDATE matches m JOIN games g ON g.game_id = m.game_id
+SET m.end_time = m.date_time + INTERVAL g.match_duration_minutes MINUTE;
+ALTER TABLE matches MODIFY end_time DATETIME NOT NULL;
+ALTER TABLE matches ADD CONSTRAINT chk_match_end_after_start CHECK (end_time > date_time);
@@ -0,0 +1,13 @@
+-- Room clash checks: events get a normalised copy of their location
+-- (lower case, runs of whitespace collapsed) and an index on it.
+--
+-- The app keeps location_key in step with location on every write. Run
+-- this once against an existing database, then `python -m app.locations`
+-- (or POST /_internal/locations/rekey): the UPDATE below only approximates
+-- models.normalize_location, which also folds Unicode spacing and case,
+-- and the script recomputes every key with it.
+
+ALTER TABLE events ADD COLUMN location_key VARCHAR(300) NULL AFTER location;
+UPDATE events SET location_key = LOWER(TRIM(REGEXP_REPLACE(location, '[[:space:]]+', ' ')));
+ALTER TABLE events MODIFY location_key VARCHAR(300) NOT NULL;
+CREATE INDEX ix_events_location_date_time ON events (location_key, date_time);
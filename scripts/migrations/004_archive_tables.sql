@@ -0,0 +1,49 @@
+-- Archive tables for matches and events from closed academic terms.
+--
+-- Same columns as the hot tables, without auto-increment: rows keep the
+-- ids they were given there. app.archive moves rows across; run it with
+-- `python -m app.archive` or POST /_internal/archive/run.
+
+CREATE TABLE matches_archive (
+    match_id INT NOT NULL PRIMARY KEY,
+    date_time DATETIME NOT NULL,
+    end_time DATETIME NOT NULL,
+    team_id INT NOT NULL,
+    game_id INT NOT NULL,
+    opponent_id INT NOT NULL,
+    watch_link VARCHAR(255) NULL,
+    result VARCHAR(20) NULL,
+    FOREIGN KEY (team_id) REFERENCES teams (team_id) ON DELETE CASCADE,
+    FOREIGN KEY (game_id) REFERENCES games (game_id),
+    FOREIGN KEY (opponent_id) REFERENCES opponents (opponent_id),
+    INDEX ix_matches_archive_date_time (date_time),
+    INDEX ix_matches_archive_team_date_time (team_id, date_time),
+    INDEX ix_matches_archive_opponent_date_time (opponent_id, date_time),
+    INDEX ix_matches_archive_game_date_time (game_id, date_time)
+);
+
+CREATE TABLE events_archive (
+    event_id INT NOT NULL PRIMARY KEY,
+    title VARCHAR(100) NOT NULL,
+    description TEXT NOT NULL,
+    location VARCHAR(300) NOT NULL,
+    location_key VARCHAR(300) NOT NULL,
+    date_time DATETIME NOT NULL,
+    end_time DATETIME NOT NULL,
+    attendance INT NOT NULL DEFAULT 0,
+    created_by_officer_id INT NOT NULL,
+    FOREIGN KEY (created_by_officer_id) REFERENCES officers (officer_id),
+    INDEX ix_events_archive_date_time (date_time),
+    INDEX ix_events_archive_end_time (end_time),
+    INDEX ix_events_archive_officer_date_time (created_by_officer_id, date_time),
+    INDEX ix_events_archive_location_date_time (location_key, date_time)
+);
+
+CREATE TABLE event_attendees_archive (
+    event_id INT NOT NULL,
+    user_id INT NOT NULL,
+    PRIMARY KEY (event_id, user_id),
+    FOREIGN KEY (event_id) REFERENCES events_archive (event_id) ON DELETE CASCADE,
+    FOREIGN KEY (user_id) REFERENCES users (user_id) ON DELETE CASCADE,
+    INDEX ix_event_attendees_archive_user_event (user_id, event_id)
+);
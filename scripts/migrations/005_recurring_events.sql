@@ -0,0 +1,27 @@
+-- Recurring events: a series is one events row with a repeat rule, and
+-- event_overrides moves or cancels single occurrences. See app.recurrence.
+--
+-- Existing events are all one-offs (repeat_every_days NULL). Run this once
+-- against an existing database.
+
+ALTER TABLE events
+    ADD COLUMN repeat_every_days INT NULL AFTER created_by_officer_id,
+    ADD COLUMN repeat_until DATETIME NULL AFTER repeat_every_days,
+    ADD CONSTRAINT chk_repeat_every_days_positive CHECK (repeat_every_days > 0);
+CREATE INDEX ix_events_repeat_every_days ON events (repeat_every_days);
+
+-- kept column-for-column with events; series are never archived
+ALTER TABLE events_archive
+    ADD COLUMN repeat_every_days INT NULL AFTER created_by_officer_id,
+    ADD COLUMN repeat_until DATETIME NULL AFTER repeat_every_days;
+
+CREATE TABLE event_overrides (
+    event_id INT NOT NULL,
+    occurrence_start DATETIME NOT NULL,
+    date_time DATETIME NOT NULL,
+    end_time DATETIME NOT NULL,
+    cancelled BOOLEAN NOT NULL DEFAULT FALSE,
+    PRIMARY KEY (event_id, occurrence_start),
+    FOREIGN KEY (event_id) REFERENCES events (event_id) ON DELETE CASCADE,
+    CONSTRAINT chk_override_end_after_start CHECK (end_time > date_time)
+);
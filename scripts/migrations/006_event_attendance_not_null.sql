@@ -0,0 +1,14 @@
+-- events.attendance: backfill the counter and make it NOT NULL.
+--
+-- The column used to be nullable and nothing wrote it, so existing rows
+-- hold NULL, which the API can't read and events_archive won't accept.
+-- This counts every event's attendees once; from then on the attendee
+-- routes keep the counter in step (see app.attendance). Run it once
+-- against an existing database, before the first archive run.
+
+UPDATE events
+SET attendance = (
+    SELECT COUNT(*) FROM event_attendees
+    WHERE event_attendees.event_id = events.event_id
+);
+ALTER TABLE events MODIFY attendance INT NOT NULL DEFAULT 0;
@@ -0,0 +1,11 @@
+-- Leaderboard: extend the user_engagement index with user_id.
+--
+-- /users/leaderboard orders by events_attended DESC, then user_id, so
+-- equal counts come back in the same order on every request. With
+-- user_id as the last index column (and events_attended descending) the
+-- top k is read straight off the index with no sort. New databases get
+-- this from Base.metadata.create_all; run it once against an existing one.
+
+DROP INDEX ix_user_engagement_term_count ON user_engagement;
+CREATE INDEX ix_user_engagement_term_count
+    ON user_engagement (term_id, events_attended DESC, user_id);
@@ -12,18 +12,18 @@ INSERT INTO event_attendees (event_id, user_id) VALUES
 (1, 1), (1, 2), (2, 2), (2, 3);
 
 -- EVENTS
-INSERT INTO events (title, description, location, date_time, end_time, attendance, created_by_officer_id) VALUES
-('Fall Kickoff', 'Welcome to the Fall semester!', 'Student Center', '2024-09-01 17:00:00', '2024-09-01 19:00:00', 50, 1),
-('Valorant Tournament', '1v1 Valorant Bracket', 'Esports Arena', '2024-11-15 15:00:00', '2024-11-15 20:00:00', 32, 2);
+INSERT INTO events (title, description, location, location_key, date_time, end_time, attendance, created_by_officer_id) VALUES
+('Fall Kickoff', 'Welcome to the Fall semester!', 'Student Center', 'student center', '2024-09-01 17:00:00', '2024-09-01 19:00:00', 50, 1),
+('Valorant Tournament', '1v1 Valorant Bracket', 'Esports Arena', 'esports arena', '2024-11-15 15:00:00', '2024-11-15 20:00:00', 32, 2);
 
 -- GAMES
 INSERT INTO games (game_name, bg_image) VALUES
 ('Overwatch', NULL), ('Valorant', NULL), ('Rocket League', NULL);
 
 -- MATCHES
-INSERT INTO matches (team_id, opponent_id, game_id, date_time, watch_link, result) VALUES
-(1, 1, 1, '2024-10-01 19:00:00', 'https://twitch.tv/uh-overwatch', 'win'),
-(2, 2, 2, '2024-10-10 18:00:00', 'https://twitch.tv/uh-valorant', 'lose');
+INSERT INTO matches (team_id, opponent_id, game_id, date_time, end_time, watch_link, result) VALUES
+(1, 1, 1, '2024-10-01 19:00:00', '2024-10-01 20:00:00', 'https://twitch.tv/uh-overwatch', 'win'),
+(2, 2, 2, '2024-10-10 18:00:00', '2024-10-10 19:00:00', 'https://twitch.tv/uh-valorant', 'lose');
 
 -- MEDIA
 INSERT INTO media (media_image, academic_term_id, uploaded_by_officer_id, date_uploaded) VALUES
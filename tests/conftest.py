@@ -1,10 +1,12 @@
 import pytest
+from datetime import datetime, timedelta
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
 
+from app import cache, models
 from app.database import Base
-from app.deps import get_db
+from app.deps import get_db, get_session_factory
 from app.main import app
 
 # ---------------------------------------------------------------------
@@ -36,6 +38,7 @@ def db_session():
         session.close()
         transaction.rollback()
         connection.close()
+        cache.clear_all()                   # cached rows were rolled back too
 
 # ---------------------------------------------------------------------
 # 3. Override FastAPI’s get_db dependency to plug in our test session
@@ -49,6 +52,66 @@ def client(db_session):
             pass
 
     app.dependency_overrides[get_db] = _get_test_db
+    # no background rebuilds: snapshots rebuild inline, on the test session
+    app.dependency_overrides[get_session_factory] = lambda: None
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
+
+# ---------------------------------------------------------------------
+# 4. A team with an opponent to play against (and everything they need)
+# ---------------------------------------------------------------------
+@pytest.fixture
+def team_and_opponent(db_session):
+    user = models.User(email="coach@uh.edu", password_hash="x", first_name="C",
+                       last_name="Oach", signup_date=datetime(2024, 1, 1))
+    game = models.Game(game_name="Valorant")
+    db_session.add_all([user, game])
+    db_session.flush()
+    coordinator = models.Coordinator(user_id=user.user_id, game_id=game.game_id,
+                                     start_date=datetime(2024, 1, 1))
+    opponent = models.Opponent(opponent_name="Baylor", game_id=game.game_id, school="Baylor")
+    db_session.add_all([coordinator, opponent])
+    db_session.flush()
+    team = models.Team(team_name="UH Valorant", game_id=game.game_id,
+                       coordinator_id=coordinator.coordinator_id, wins=0, losses=0)
+    db_session.add(team)
+    db_session.commit()
+    return team, opponent
+
+@pytest.fixture
+def match_payload():
+    """Build a POST /matches/ body for a day in October 2024."""
+    def _payload(team, opponent, day, result=None):
+        return {"team_id": team.team_id, "opponent_id": opponent.opponent_id,
+                "game_id": team.game_id, "date_time": datetime(2024, 10, day).isoformat(),
+                "result": result}
+    return _payload
+
+# ---------------------------------------------------------------------
+# 5. An officer to create events, and a factory for the events
+# ---------------------------------------------------------------------
+@pytest.fixture
+def officer(db_session):
+    user = models.User(email="officer@uh.edu", password_hash="x", first_name="O",
+                       last_name="Fficer", signup_date=datetime(2024, 1, 1))
+    role = models.Role(role_name="President")
+    db_session.add_all([user, role])
+    db_session.flush()
+    officer = models.Officer(user_id=user.user_id, role_id=role.role_id,
+                             start_date=datetime(2024, 1, 1))
+    db_session.add(officer)
+    db_session.commit()
+    return officer
+
+@pytest.fixture
+def make_event(db_session, officer):
+    """Create a two-hour event starting at ``start``."""
+    def _make(title, start, location="Student Center"):
+        event = models.Event(title=title, description="", location=location, date_time=start,
+                             end_time=start + timedelta(hours=2),
+                             created_by_officer_id=officer.officer_id)
+        db_session.add(event)
+        db_session.commit()
+        return event
+    return _make
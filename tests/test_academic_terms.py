@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta
+
+from app import models
+
+
+def test_term_summary(client, db_session, team_and_opponent, match_payload):
+    team, opponent = team_and_opponent
+    fall = models.AcademicTerm(semester="Fall 2024", start_date=datetime(2024, 8, 1),
+                               end_date=datetime(2024, 12, 15))
+    spring = models.AcademicTerm(semester="Spring 2024", start_date=datetime(2024, 1, 10),
+                                 end_date=datetime(2024, 5, 10))
+    db_session.add_all([fall, spring])
+    db_session.commit()
+    for day, result in [(1, "win"), (2, "loss"), (3, "3-1")]:
+        client.post("/matches/", json=match_payload(team, opponent, day, result))
+
+    r = client.get(f"/academic-terms/{fall.term_id}/summary")
+    assert r.status_code == 200
+    data = r.json()
+    assert (data["matches_played"], data["matches_won"]) == (3, 2)
+    assert data["closed"] is True
+
+    r = client.get("/academic-terms/summary")
+    assert [s["semester"] for s in r.json()] == ["Spring 2024", "Fall 2024"]
+    assert r.json()[0]["matches_played"] == 0
+
+    # a back-dated match reaches the cached summary of the closed term
+    client.post("/matches/", json=match_payload(team, opponent, 4, "win"))
+    data = client.get(f"/academic-terms/{fall.term_id}/summary").json()
+    assert (data["matches_played"], data["matches_won"]) == (4, 3)
+
+
+def test_term_summary_unknown_term(client):
+    assert client.get("/academic-terms/999/summary").status_code == 404
+
+
+def test_term_summary_counts_occurrences(client, db_session, officer, make_event):
+    fall = models.AcademicTerm(semester="Fall 2024", start_date=datetime(2024, 8, 1),
+                               end_date=datetime(2024, 12, 15))
+    spring = models.AcademicTerm(semester="Spring 2025", start_date=datetime(2025, 1, 10),
+                                 end_date=datetime(2025, 5, 10))
+    db_session.add_all([fall, spring])
+    make_event("Kickoff", datetime(2024, 8, 20, 17))
+    # weekly from Dec 2 into spring: two fall weeks, one cancelled
+    practice = make_event("Practice night", datetime(2024, 12, 2, 18), location="Gaming Lab")
+    practice.repeat_every_days = 7
+    practice.repeat_until = datetime(2025, 1, 31)
+    db_session.add(models.EventOverride(event_id=practice.event_id, occurrence_start=datetime(2024, 12, 9, 18),
+                                        date_time=datetime(2024, 12, 9, 18),
+                                        end_time=datetime(2024, 12, 9, 18) + timedelta(hours=2),
+                                        cancelled=True))
+    db_session.commit()
+
+    summaries = {s["semester"]: s for s in client.get("/academic-terms/summary").json()}
+    assert summaries["Fall 2024"]["events_held"] == 2
+    # Jan 13, 20 and 27
+    assert summaries["Spring 2025"]["events_held"] == 3
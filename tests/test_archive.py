@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta
+
+from app import archive, engagement, models, standings
+
+
+def _snapshot(db_session, model, *key):
+    return sorted(
+        tuple(getattr(row, column) for column in key)
+        for row in db_session.query(model)
+    )
+
+def test_archive_moves_closed_terms(client, db_session, team_and_opponent, officer, make_event):
+    team, opponent = team_and_opponent
+    spring = models.AcademicTerm(semester="Spring 2024", start_date=datetime(2024, 1, 10),
+                                 end_date=datetime(2024, 5, 10))
+    fall = models.AcademicTerm(semester="Fall 2024", start_date=datetime(2024, 8, 20),
+                               end_date=datetime(2024, 12, 15))
+    db_session.add_all([spring, fall])
+    matches = [
+        models.Match(team_id=team.team_id, opponent_id=opponent.opponent_id, game_id=team.game_id,
+                     date_time=day, end_time=day + timedelta(hours=1), result=result)
+        for day, result in [(datetime(2024, 2, d), "win") for d in range(1, 6)]
+        + [(datetime(2024, 9, 1), "loss")]
+    ]
+    db_session.add_all(matches)
+    db_session.commit()
+    old_event = make_event("Spring social", datetime(2024, 3, 1, 18))
+    new_event = make_event("Fall kickoff", datetime(2024, 9, 1, 18))
+    db_session.add_all([models.EventAttendee(event_id=e.event_id, user_id=officer.user_id)
+                        for e in (old_event, new_event)])
+    db_session.commit()
+    old_match_id, old_event_id = matches[0].match_id, old_event.event_id
+    match_ids = [m.match_id for m in matches]
+    counters = _snapshot(db_session, models.TeamStanding, "team_id", "term_id", "wins", "losses")
+    attended = _snapshot(db_session, models.UserEngagement, "user_id", "term_id", "events_attended")
+
+    moved = archive.archive_closed_terms(db_session, now=datetime(2024, 10, 1), batch_size=2)
+    assert moved == {"matches": 5, "events": 1, "event_attendees": 1}
+    assert db_session.query(models.Match).count() == 1
+    assert db_session.query(models.MatchArchive).count() == 5
+    # nothing else has closed since
+    assert archive.archive_closed_terms(db_session, now=datetime(2024, 10, 1))["matches"] == 0
+
+    # reads find archived rows where they used to
+    assert client.get(f"/matches/{old_match_id}").json()["result"] == "win"
+    assert len(client.get("/matches/", params={"term_id": spring.term_id}).json()) == 5
+    assert len(client.get("/matches/", params={"term_id": fall.term_id}).json()) == 1
+    # paging over hot and archived rows visits each match once, in id order
+    pages = [client.get("/matches/", params={"skip": skip, "limit": 2}).json() for skip in (0, 2, 4)]
+    assert [m["match_id"] for page in pages for m in page] == sorted(match_ids)
+    past = client.get("/matches/past", params={"limit": 4}).json()
+    assert [m["date_time"][:10] for m in past] == ["2024-09-01", "2024-02-05", "2024-02-04", "2024-02-03"]
+    r = client.get(f"/event-attendees/event/{old_event_id}")
+    assert [a["user_id"] for a in r.json()] == [officer.user_id]
+
+    # ...but won't change them
+    assert client.delete(f"/matches/{old_match_id}").status_code == 409
+    assert client.delete(f"/events/{old_event_id}").status_code == 409
+    assert client.delete(f"/event-attendees/{old_event_id}/{officer.user_id}").status_code == 409
+    r = client.post("/event-attendees/", json={"event_id": old_event_id, "user_id": officer.user_id})
+    assert (r.status_code, r.json()["detail"]) == (409, "Event is archived")
+    assert client.delete("/matches/999999").status_code == 404
+
+    # derived tables rebuild to what they were before the move
+    standings.rebuild_all(db_session)
+    engagement.rebuild_all(db_session)
+    assert _snapshot(db_session, models.TeamStanding, "team_id", "term_id", "wins", "losses") == counters
+    assert _snapshot(db_session, models.UserEngagement, "user_id", "term_id", "events_attended") == attended
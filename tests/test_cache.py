@@ -0,0 +1,160 @@
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from starlette.responses import Response
+
+from app import cache
+
+
+@pytest.fixture(autouse=True)
+def forget_test_caches():
+    yield
+    for c in cache.all_caches():
+        if c.name.startswith("test."):
+            cache.unregister(c.name)
+
+def _sponsor(name, start, end=None):
+    return {
+        "sponsor_name": name,
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat() if end else None,
+    }
+
+def test_boundary_cache_expires_at_boundary():
+    c = cache.BoundaryCache("test.boundary", tables={"nothing"})
+    now = datetime(2025, 1, 1, 12, 0)
+    calls = []
+
+    def build():
+        calls.append(now)
+        return len(calls), now + timedelta(hours=1)
+
+    assert c.get_or_build("k", now, build) == 1
+    assert c.get_or_build("k", now + timedelta(minutes=59), build) == 1
+    assert c.get_or_build("k", now + timedelta(hours=1), build) == 2
+
+def test_boundary_cache_entries_expire_after_ttl():
+    # writes from other processes never reach this one; only age does
+    c = cache.BoundaryCache("test.ttl", tables={"nothing"}, ttl=0.05)
+    now = datetime(2025, 1, 1, 12, 0)
+    calls = []
+
+    def build():
+        calls.append(now)
+        return len(calls), None
+
+    assert c.get_or_build("k", now, build) == 1
+    assert c.get_or_build("k", now, build) == 1
+    time.sleep(0.06)
+    assert c.get_or_build("k", now, build) == 2
+
+def test_boundary_cache_serves_stale_when_db_down():
+    c = cache.BoundaryCache("test.outage", tables={"nothing"})
+    now = datetime(2025, 1, 1, 12, 0)
+    assert c.get_or_build("k", now, lambda: ("good", None)) == "good"
+    c.on_write()
+
+    def db_down():
+        raise OperationalError("SELECT 1", {}, Exception("gone away"))
+
+    response = Response()
+    assert c.get_or_build("k", now, db_down, response=response) == "good"
+    assert response.headers["Warning"] == cache.REVALIDATION_FAILED
+    assert "Age" in response.headers
+
+    c.clear()                          # nothing left to fall back on
+    with pytest.raises(OperationalError):
+        c.get_or_build("k", now, db_down)
+
+def test_active_sponsors_invalidated_on_write(client):
+    now = datetime.now()
+    client.post("/sponsors/", json=_sponsor("AMD", now - timedelta(days=1)))
+    assert len(client.get("/sponsors/active").json()) == 1
+
+    client.post("/sponsors/", json=_sponsor("Corsair", now - timedelta(days=1)))
+    assert len(client.get("/sponsors/active").json()) == 2
+
+def test_active_sponsors_respects_end_date(client):
+    now = datetime.now()
+    client.post("/sponsors/", json=_sponsor("Ended", now - timedelta(days=2), now - timedelta(days=1)))
+    client.post("/sponsors/", json=_sponsor("Future", now + timedelta(days=1)))
+    assert client.get("/sponsors/active").json() == []
+
+def test_home_bundle(client):
+    client.post("/games/", json={"game_name": "Valorant"})
+    client.post("/sponsors/", json=_sponsor("AMD", datetime.now() - timedelta(days=1)))
+    r = client.get("/bundle/home")
+    assert r.status_code == 200
+    data = r.json()
+    assert [g["game_name"] for g in data["games"]] == ["Valorant"]
+    assert [s["sponsor_name"] for s in data["active_sponsors"]] == ["AMD"]
+    assert data["upcoming_matches"] == [] and data["upcoming_events"] == []
+    assert "bg_image" not in data["games"][0] and "sponsor_logo" not in data["active_sponsors"][0]
+
+    client.post("/games/", json={"game_name": "Rocket League"})
+    games = [g["game_name"] for g in client.get("/bundle/home").json()["games"]]
+    assert sorted(games) == ["Rocket League", "Valorant"]
+
+def test_negative_cache_forgets_misses_on_create(client):
+    assert client.get("/games/name/Valorant").status_code == 404
+    assert client.get("/games/name/Valorant").status_code == 404
+    client.post("/games/", json={"game_name": "Valorant"})
+    assert client.get("/games/name/Valorant").status_code == 200
+
+def test_negative_cache_is_bounded():
+    c = cache.NegativeCache("test.negative", tables={"nothing"}, maxsize=2)
+    fetched = []
+
+    def fetch(key):
+        return lambda: fetched.append(key)
+
+    for key in ("a", "b", "c"):
+        c.lookup(key, fetch(key))
+    c.lookup("c", fetch("c"))          # known miss, not fetched again
+    c.lookup("a", fetch("a"))          # evicted, fetched again
+    assert fetched == ["a", "b", "c", "a"]
+
+def test_cache_stats_and_flush(client):
+    client.get("/sponsors/active")
+    client.get("/sponsors/active")
+    stats = {c["name"]: c for c in client.get("/_internal/cache").json()["caches"]}
+    assert stats["sponsors.active"]["entries"] == 1
+    assert stats["sponsors.active"]["hits"] >= 1
+
+    r = client.delete("/_internal/cache", params={"name": "sponsors.active"})
+    assert r.status_code == 200
+    assert r.json()[0]["entries"] == 0
+    assert client.delete("/_internal/cache", params={"name": "nope"}).status_code == 404
+
+def test_route_stats_aggregate_caches(client):
+    client.get("/sponsors/active")
+    client.get("/sponsors/active")
+    routes = {r["route"]: r for r in client.get("/_internal/cache").json()["routes"]}
+    route = routes["/sponsors/active"]
+    assert route["caches"] == ["sponsors.active"]
+    assert route["entries"] == 1 and route["builds"] >= 1
+    assert route["memory_bytes"] > 0 and route["avg_build_ms"] is not None
+    assert route["evictions"] >= 0
+
+def test_snapshot_rebuild_survives_flush_mid_build():
+    builds = []
+
+    def build(db):
+        builds.append(db)
+        if len(builds) == 2:
+            c.clear()                  # DELETE /_internal/cache while rebuilding
+        return len(builds), None
+
+    c = cache.Snapshot("test.snapshot", tables={"nothing"}, build=build)
+    now = datetime(2025, 1, 1)
+    assert c.get(None, now, session_factory=Session) == 1     # first build: inline
+    c.on_write()                       # starts the background rebuild
+    for _ in range(100):
+        if len(builds) == 3 and not c._rebuilding:
+            break
+        time.sleep(0.01)
+    assert len(builds) == 3
+    assert c.get(None, now, session_factory=Session) == 3
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from app import ical
+
+
+def test_fold_and_escape():
+    line = ical.calendar("x", [ical.vevent("a", "é" * 60 + ", done", datetime(2024, 1, 1),
+                                          datetime(2024, 1, 1))])
+    assert all(len(l.encode()) <= 75 for l in line.split("\r\n"))
+    assert "\\, done" in line.replace("\r\n ", "")
+
+def test_calendar_feed(client, team_and_opponent, match_payload):
+    team, opponent = team_and_opponent
+    team_id, game_id = team.team_id, team.game_id
+    client.post("/matches/", json=match_payload(team, opponent, 1, "win"))
+
+    r = client.get("/calendar.ics")
+    assert r.status_code == 200 and r.headers["content-type"].startswith("text/calendar")
+    assert "SUMMARY:UH Valorant vs Baylor" in r.text
+    etag = r.headers["etag"]
+
+    again = client.get("/calendar.ics", headers={"If-None-Match": etag})
+    assert again.status_code == 304 and again.headers["etag"] == etag
+
+    client.post("/matches/", json=match_payload(team, opponent, 2))
+    changed = client.get("/calendar.ics", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.text.count("BEGIN:VEVENT") == 2
+
+    assert client.get(f"/calendar/teams/{team_id}.ics").text.count("BEGIN:VEVENT") == 2
+    assert client.get(f"/calendar/games/{game_id}.ics").status_code == 200
+    assert client.get("/calendar/teams/999.ics").status_code == 404
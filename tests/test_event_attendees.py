@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from app import models
+
+
+def test_attendance_counter_follows_attendees(client, officer, make_event):
+    event = make_event("Kickoff", datetime(2024, 9, 1, 17))
+    user_id = officer.user_id
+    assert client.get(f"/events/{event.event_id}").json()["attendance"] == 0
+
+    body = {"event_id": event.event_id, "user_id": user_id}
+    assert client.post("/event-attendees/", json=body).status_code == 200
+    assert client.post("/event-attendees/", json=body).status_code == 400
+    assert client.get(f"/events/{event.event_id}").json()["attendance"] == 1
+
+    client.delete(f"/event-attendees/{event.event_id}/{user_id}")
+    assert client.get(f"/events/{event.event_id}").json()["attendance"] == 0
+
+def test_reconcile_attendance(client, db_session, officer, make_event):
+    event = make_event("Kickoff", datetime(2024, 9, 1, 17))
+    db_session.add(models.EventAttendee(event_id=event.event_id, user_id=officer.user_id))
+    event.attendance = 50
+    db_session.commit()
+
+    assert client.post("/_internal/attendance/reconcile").json() == {"corrected": 1}
+    assert client.get(f"/events/{event.event_id}").json()["attendance"] == 1
+    assert client.post("/_internal/attendance/reconcile").json() == {"corrected": 0}
@@ -0,0 +1,148 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+
+from app import models, overlap
+
+
+def _event(officer, title, location, start, hours=2):
+    start = datetime.fromisoformat(start)
+    return {"title": title, "description": "", "location": location,
+            "date_time": start.isoformat(), "end_time": (start + timedelta(hours=hours)).isoformat(),
+            "created_by_officer_id": officer.officer_id}
+
+def test_room_double_booking(client, officer):
+    r = client.post("/events/", json=_event(officer, "Kickoff", "Student Center", "2024-09-01T17:00:00"))
+    assert r.status_code == 201
+    kickoff = r.json()
+
+    # same room however it's typed
+    r = client.post("/events/", json=_event(officer, "Scrims", "  student   CENTER", "2024-09-01T18:00:00"))
+    assert r.status_code == 400
+    assert "Kickoff" in r.json()["detail"]
+    # another room, or back to back, is fine
+    assert client.post("/events/", json=_event(officer, "Scrims", "Arena", "2024-09-01T18:00:00")).status_code == 201
+    assert client.post("/events/", json=_event(officer, "Social", "Student Center", "2024-09-01T19:00:00")).status_code == 201
+
+    # moving the kickoff into the social's slot clashes; moving it earlier doesn't
+    r = client.put(f"/events/{kickoff['event_id']}", json=_event(officer, "Kickoff", "Student Center", "2024-09-01T18:00:00"))
+    assert r.status_code == 400
+    r = client.put(f"/events/{kickoff['event_id']}", json=_event(officer, "Kickoff", "Student Center", "2024-09-01T15:00:00"))
+    assert r.status_code == 200
+
+def test_rekey_locations(client, db_session, officer, make_event):
+    event = make_event("Kickoff", datetime(2024, 9, 1, 17), location="Student\u00a0CENTER")
+    # as migration 003's SQL would have left it: no-break space kept
+    db_session.execute(update(models.Event).values(location_key="student\u00a0center"))
+    db_session.commit()
+
+    assert client.post("/_internal/locations/rekey").json() == {"corrected": 1}
+    db_session.refresh(event)
+    assert event.location_key == "student center"
+    assert client.post("/_internal/locations/rekey").json() == {"corrected": 0}
+
+def test_free_slots(client, officer, make_event):
+    make_event("Morning", datetime(2024, 9, 1, 9))          # 9-11
+    make_event("Lunch", datetime(2024, 9, 1, 10, 30))       # 10:30-12:30, overlaps
+    make_event("Afternoon", datetime(2024, 9, 1, 13))       # 13-15
+    make_event("Elsewhere", datetime(2024, 9, 1, 15), location="Arena")
+
+    params = {"location": "student center", "from": "2024-09-01T08:00:00", "to": "2024-09-01T18:00:00"}
+    slots = client.get("/events/free-slots", params={**params, "duration": 30}).json()
+    assert slots == [
+        {"start": "2024-09-01T08:00:00", "end": "2024-09-01T09:00:00"},
+        {"start": "2024-09-01T12:30:00", "end": "2024-09-01T13:00:00"},
+        {"start": "2024-09-01T15:00:00", "end": "2024-09-01T18:00:00"},
+    ]
+    slots = client.get("/events/free-slots", params={**params, "duration": 90}).json()
+    assert [s["start"] for s in slots] == ["2024-09-01T15:00:00"]
+
+    r = client.get("/events/free-slots", params={**params, "to": "2024-09-01T07:00:00"})
+    assert r.status_code == 400
+
+def test_free_windows_clips_to_range():
+    d = lambda h: datetime(2024, 1, 1, h)
+    busy = [(d(6), d(9)), (d(10), d(11)), (d(20), d(23))]
+    assert overlap.free_windows(busy, d(8), d(21), timedelta(hours=1)) == [(d(9), d(10)), (d(11), d(20))]
+
+def _weekly(officer, title, start, **extra):
+    return {**_event(officer, title, "Gaming Lab", start), "repeat_every_days": 7, **extra}
+
+def test_recurring_event_expands_in_window(client, officer):
+    r = client.post("/events/", json=_weekly(officer, "Practice night", "2024-09-02T18:00:00",
+                                             repeat_until="2024-10-01T00:00:00"))
+    assert r.status_code == 201
+    series = r.json()
+    occurrences = f"/events/{series['event_id']}/occurrences"
+
+    window = {"from": "2024-09-08T00:00:00", "to": "2024-09-24T00:00:00"}
+    r = client.get(occurrences, params=window)
+    assert [o["date_time"] for o in r.json()] == [
+        "2024-09-09T18:00:00", "2024-09-16T18:00:00", "2024-09-23T18:00:00",
+    ]
+    # the last occurrence has to end by repeat_until
+    r = client.get(occurrences, params={"from": "2024-09-01T00:00:00", "to": "2025-01-01T00:00:00"})
+    assert len(r.json()) == 5
+
+    # move one week, cancel the next
+    r = client.put(f"{occurrences}/2024-09-16T18:00:00", json={"date_time": "2024-09-17T19:00:00"})
+    assert r.status_code == 200
+    assert r.json()["end_time"] == "2024-09-17T21:00:00"
+    client.put(f"{occurrences}/2024-09-23T18:00:00", json={"cancelled": True})
+    r = client.get(occurrences, params=window)
+    assert [(o["date_time"], o["occurrence_start"]) for o in r.json()] == [
+        ("2024-09-09T18:00:00", "2024-09-09T18:00:00"),
+        ("2024-09-17T19:00:00", "2024-09-16T18:00:00"),
+    ]
+    assert client.put(f"{occurrences}/2024-09-18T18:00:00", json={"cancelled": True}).status_code == 404
+
+    assert client.delete(f"{occurrences}/2024-09-23T18:00:00").status_code == 200
+    assert len(client.get(occurrences, params=window).json()) == 3
+
+def test_recurring_event_room_clashes(client, officer):
+    client.post("/events/", json=_weekly(officer, "Practice night", "2024-09-02T18:00:00"))
+
+    # a one-off on a later week clashes with that week's occurrence
+    r = client.post("/events/", json=_event(officer, "Tournament", "gaming lab", "2024-11-04T19:00:00"))
+    assert r.status_code == 400
+    assert "Practice night" in r.json()["detail"]
+    assert client.post("/events/", json=_event(officer, "Tournament", "Gaming Lab", "2024-11-05T19:00:00")).status_code == 201
+
+    # a second series landing on that one-off
+    r = client.post("/events/", json=_weekly(officer, "Club meeting", "2024-09-03T20:00:00"))
+    assert "Tournament" in r.json()["detail"]
+    r = client.post("/events/", json=_weekly(officer, "Club meeting", "2024-09-01T18:00:00", repeat_every_days=0))
+    assert r.status_code == 400
+
+def test_override_clashes_with_its_own_series(client, officer):
+    series = client.post("/events/", json=_weekly(officer, "Practice night", "2024-09-02T18:00:00")).json()
+    occurrences = f"/events/{series['event_id']}/occurrences"
+
+    # onto next week's occurrence of the same series
+    r = client.put(f"{occurrences}/2024-09-16T18:00:00", json={"date_time": "2024-09-23T17:00:00"})
+    assert r.status_code == 400
+    # overlapping only the slot it is moving out of
+    assert client.put(f"{occurrences}/2024-09-16T18:00:00", json={"date_time": "2024-09-16T19:00:00"}).status_code == 200
+
+def test_open_ended_series_checked_past_a_year(client, officer):
+    # a one-off on the hundredth week, and a series meeting every 400 days
+    client.post("/events/", json=_event(officer, "Finals", "Gaming Lab", "2026-08-03T18:00:00"))
+    r = client.post("/events/", json=_weekly(officer, "Practice night", "2024-09-02T18:00:00"))
+    assert "Finals" in r.json()["detail"]
+
+    client.post("/events/", json=_weekly(officer, "Reunion", "2024-09-03T21:00:00", repeat_every_days=400))
+    # first lands on a Monday 2401 days in
+    r = client.post("/events/", json=_weekly(officer, "Club meeting", "2024-09-02T21:00:00"))
+    assert "Reunion" in r.json()["detail"]
+    # even days from the start never meet the reunion, on odd ones
+    assert client.post("/events/", json=_weekly(officer, "Club meeting", "2024-09-04T21:00:00",
+                                                repeat_every_days=14)).status_code == 201
+
+def test_upcoming_interleaves_occurrences(client, db_session, officer, make_event):
+    start = datetime.utcnow().replace(microsecond=0) + timedelta(days=1)
+    r = client.post("/events/", json=_weekly(officer, "Practice night", start.isoformat()))
+    make_event("Kickoff", start + timedelta(days=8))
+
+    upcoming = client.get("/events/upcoming", params={"limit": 4}).json()
+    assert [e["title"] for e in upcoming] == ["Practice night", "Practice night", "Kickoff", "Practice night"]
+    assert [e["occurrence_start"] is None for e in upcoming] == [False, False, True, False]
@@ -0,0 +1,46 @@
+from sqlalchemy import event
+
+
+def test_dashboard_query_count(client, db_session, team_and_opponent, match_payload):
+    team, opponent = team_and_opponent
+    game_id = team.game_id
+    later = [match_payload(team, opponent, day, "loss") for day in (1, 3, 4)]
+    client.post("/matches/", json=match_payload(team, opponent, 2, "win"))
+    statements = []
+
+    def _count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    def dashboard():
+        db_session.expunge_all()
+        statements.clear()
+        event.listen(db_session.connection(), "before_cursor_execute", _count)
+        try:
+            r = client.get(f"/games/{game_id}/dashboard")
+        finally:
+            event.remove(db_session.connection(), "before_cursor_execute", _count)
+        assert r.status_code == 200
+        return r.json(), len(statements)
+
+    data, few = dashboard()
+    assert [t["team_name"] for t in data["teams"]] == ["UH Valorant"]
+    assert [o["opponent_name"] for o in data["opponents"]] == ["Baylor"]
+    assert "logo" not in data["opponents"][0] and "bg_image" not in data
+    assert few == 6          # game, 3 collections, archive boundary, matches
+    assert not any("bg_image" in s or "logo" in s for s in statements)
+
+    for payload in later:
+        client.post("/matches/", json=payload)
+    data, many = dashboard()
+    assert [m["date_time"][:10] for m in data["matches"]] == [
+        "2024-10-01", "2024-10-02", "2024-10-03", "2024-10-04"]
+    assert many == few
+
+def test_dashboard_unknown_game(client):
+    assert client.get("/games/999/dashboard").status_code == 404
+
+def test_match_duration_must_be_positive(client):
+    assert client.post("/games/", json={"game_name": "Valorant", "match_duration_minutes": 0}).status_code == 400
+    game = client.post("/games/", json={"game_name": "Valorant"}).json()
+    r = client.put(f"/games/{game['game_id']}", json={"game_name": "Valorant", "match_duration_minutes": -5})
+    assert r.status_code == 400
@@ -0,0 +1,86 @@
+from datetime import datetime
+
+from app import models, overlap
+
+
+def _at(payload, hour, minute=0, **extra):
+    day = datetime.fromisoformat(payload["date_time"])
+    return {**payload, "date_time": day.replace(hour=hour, minute=minute).isoformat(), **extra}
+
+def test_match_defaults_to_game_duration(client, db_session, team_and_opponent, match_payload):
+    team, opponent = team_and_opponent
+    team.game.match_duration_minutes = 90
+    db_session.commit()
+
+    r = client.post("/matches/", json=_at(match_payload(team, opponent, 1), 18))
+    assert r.status_code == 201
+    assert r.json()["end_time"] == "2024-10-01T19:30:00"
+
+    r = client.post("/matches/", json=_at(match_payload(team, opponent, 2), 18, duration_minutes=45))
+    assert r.json()["end_time"] == "2024-10-02T18:45:00"
+
+def test_team_cannot_double_book(client, team_and_opponent, match_payload):
+    team, opponent = team_and_opponent
+    base = match_payload(team, opponent, 1)
+    first = client.post("/matches/", json=_at(base, 18)).json()
+
+    r = client.post("/matches/", json=_at(base, 18, 30))
+    assert r.status_code == 400
+    # back to back is fine
+    second = client.post("/matches/", json=_at(base, 19))
+    assert second.status_code == 201
+
+    # moving the first match keeps its length and may not run into the second
+    r = client.put(f"/matches/{first['match_id']}", json=_at(base, 18, 30))
+    assert r.status_code == 400
+    r = client.put(f"/matches/{first['match_id']}", json=_at(base, 17, 30))
+    assert r.status_code == 200
+    assert r.json()["end_time"] == "2024-10-01T18:30:00"
+
+def test_batch_reports_conflicts_by_index(client, db_session, team_and_opponent, match_payload):
+    team, opponent = team_and_opponent
+    base = match_payload(team, opponent, 1)
+    existing = client.post("/matches/", json=_at(base, 12)).json()
+
+    r = client.post("/matches/batch", json=[
+        _at(base, 15), _at(base, 12, 30), _at(base, 15, 30), {**_at(base, 20), "team_id": 999},
+    ])
+    assert r.status_code == 400
+    assert r.json()["detail"] == [
+        {"index": 0, "detail": "Overlaps row 2 of this batch"},
+        {"index": 1, "detail": f"Overlaps existing match {existing['match_id']}"},
+        {"index": 2, "detail": "Overlaps row 0 of this batch"},
+        {"index": 3, "detail": "Team not found"},
+    ]
+    assert db_session.query(models.Match).count() == 1
+
+    r = client.post("/matches/batch", json=[_at(base, 15), _at(base, 13)])
+    assert r.status_code == 201
+    assert [m["date_time"] for m in r.json()] == ["2024-10-01T15:00:00", "2024-10-01T13:00:00"]
+
+def test_conflicts_report(client, db_session, team_and_opponent):
+    team, opponent = team_and_opponent
+    # double bookings that predate the check, written straight to the table
+    def match(start, end):
+        row = models.Match(team_id=team.team_id, opponent_id=opponent.opponent_id,
+                           game_id=team.game_id, date_time=datetime(2024, 10, 1, *start),
+                           end_time=datetime(2024, 10, 1, *end))
+        db_session.add(row)
+        return row
+    long = match((12, 0), (14, 0))
+    inside = match((12, 30), (13, 0))
+    later = match((13, 0), (14, 0))         # touches inside, overlaps long
+    match((14, 30), (15, 30))
+    db_session.commit()
+
+    pairs = {(c["match_id"], c["conflicting_match_id"]) for c in client.get("/matches/conflicts").json()}
+    assert pairs == {(long.match_id, inside.match_id), (long.match_id, later.match_id)}
+
+    r = client.get("/matches/conflicts", params={"start": "2024-10-01T14:00:00"})
+    assert r.json() == []
+    assert client.get("/matches/conflicts", params={"team_id": 999}).status_code == 404
+
+def test_overlapping_pairs_sweep():
+    d = lambda h: datetime(2024, 1, 1, h)
+    periods = [(d(1), d(5), "a"), (d(2), d(3), "b"), (d(3), d(4), "c"), (d(5), d(6), "d")]
+    assert overlap.overlapping_pairs(periods) == [("a", "b"), ("a", "c")]
@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from app import models
+
+
+def test_head_to_head(client, db_session, team_and_opponent, match_payload):
+    team, opponent = team_and_opponent
+    db_session.add(models.AcademicTerm(semester="Fall 2024", start_date=datetime(2024, 8, 1),
+                                       end_date=datetime(2024, 12, 15)))
+    db_session.commit()
+    for day, result in [(1, "loss"), (2, "win"), (3, None), (4, "2-0"), (5, "win")]:
+        client.post("/matches/", json=match_payload(team, opponent, day, result))
+    # a fixture still to come stays out of the record and the streak
+    fixture = {**match_payload(team, opponent, 1), "date_time": datetime(2099, 1, 1).isoformat()}
+    client.post("/matches/", json=fixture)
+
+    r = client.get(f"/opponents/{opponent.opponent_id}/head-to-head")
+    assert r.status_code == 200
+    data = r.json()
+    assert (data["matches"], data["wins"], data["losses"], data["undecided"]) == (5, 3, 1, 1)
+    assert data["streak"] == 3
+    assert data["last_meeting"]["date_time"].startswith("2024-10-05")
+    assert data["scheduled"] == 1
+    assert data["next_meeting"]["date_time"].startswith("2099-01-01")
+    [term] = data["terms"]
+    assert (term["semester"], term["wins"]) == ("Fall 2024", 3)
+
+def test_head_to_head_unknown_opponent(client):
+    assert client.get("/opponents/999/head-to-head").status_code == 404
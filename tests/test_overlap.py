@@ -0,0 +1,106 @@
+from datetime import datetime
+
+from app import models, overlap
+
+
+def _term(client, start, end):
+    return client.post("/academic-terms/", json={
+        "semester": f"{start}", "start_date": start, "end_date": end})
+
+def test_terms_touching_is_not_overlap(client):
+    assert _term(client, "2024-08-01T00:00:00", "2024-12-15T00:00:00").status_code == 201
+    assert _term(client, "2024-12-15T00:00:00", "2025-05-10T00:00:00").status_code == 201
+    r = _term(client, "2024-12-01T00:00:00", "2024-12-20T00:00:00")
+    assert r.status_code == 400
+
+def test_open_ended_periods(client, db_session, officer):
+    body = {"user_id": officer.user_id, "role_id": officer.role_id}
+    # the fixture officer started 2024-01-01 and never ended
+    r = client.post("/officers/", json={**body, "start_date": "2030-01-01T00:00:00"})
+    assert r.status_code == 400
+    r = client.put(f"/officers/{officer.officer_id}", json={
+        **body, "start_date": "2024-01-01T00:00:00", "end_date": "2024-06-01T00:00:00"})
+    assert r.status_code == 200
+    r = client.post("/officers/", json={**body, "start_date": "2024-06-01T00:00:00"})
+    assert r.status_code == 201
+
+def test_find_overlap_open_ended_existing(db_session, team_and_opponent):
+    team, _ = team_and_opponent
+    user = db_session.query(models.User).first()
+    membership = models.Membership(user_id=user.user_id, start_date=datetime(2024, 1, 1),
+                                   end_date=datetime(2025, 1, 1))
+    db_session.add(membership)
+    db_session.flush()
+    db_session.add(models.TeamMembership(team_id=team.team_id, membership_id=membership.membership_id,
+                                         start_date=datetime(2024, 2, 1)))
+    db_session.flush()
+
+    scope = {"team_id": team.team_id, "membership_id": membership.membership_id}
+    assert overlap.find_overlap(db_session, models.TeamMembership,
+                                datetime(2024, 9, 1), datetime(2024, 10, 1), **scope)
+    assert not overlap.find_overlap(db_session, models.TeamMembership,
+                                    datetime(2023, 9, 1), datetime(2024, 2, 1), **scope)
+    assert not overlap.find_overlap(db_session, models.TeamMembership,
+                                    datetime(2024, 9, 1), None, exclude=scope, **scope)
+
+def test_batch_conflicts_sweep(db_session, officer):
+    Row = models.Membership
+    db_session.add(Row(user_id=officer.user_id, start_date=datetime(2024, 1, 1),
+                       end_date=datetime(2024, 6, 1)))
+    db_session.flush()
+    batch = [
+        Row(user_id=officer.user_id, start_date=datetime(2024, 6, 1), end_date=datetime(2024, 9, 1)),
+        Row(user_id=officer.user_id, start_date=datetime(2024, 8, 1), end_date=datetime(2024, 12, 1)),
+        Row(user_id=officer.user_id, start_date=datetime(2023, 12, 1), end_date=datetime(2024, 1, 2)),
+        Row(user_id=officer.user_id + 1, start_date=datetime(2024, 1, 1), end_date=datetime(2025, 1, 1)),
+    ]
+    errors = overlap.batch_conflicts(db_session, Row, batch, "membership")
+    assert sorted(errors) == [0, 1, 2]
+    assert errors[2].startswith("Overlaps existing membership")
+    assert errors[1] == "Overlaps row 0 of this batch"
+
+def test_batch_create_officers(client, officer):
+    row = {"user_id": officer.user_id, "role_id": officer.role_id}
+    r = client.post("/officers/batch", json=[
+        {**row, "start_date": "2030-01-01T00:00:00"},
+        {**row, "user_id": 999, "start_date": "2020-01-01T00:00:00", "end_date": "2021-01-01T00:00:00"},
+    ])
+    assert r.status_code == 400
+    assert [e["index"] for e in r.json()["detail"]] == [0, 1]
+
+    r = client.post("/officers/batch", json=[
+        {**row, "start_date": "2020-01-01T00:00:00", "end_date": "2021-01-01T00:00:00"},
+        {**row, "start_date": "2021-01-01T00:00:00", "end_date": "2022-01-01T00:00:00"},
+    ])
+    assert r.status_code == 201 and len(r.json()) == 2
+
+def test_as_of(client, db_session, officer):
+    body = {"user_id": officer.user_id, "role_id": officer.role_id}
+    client.put(f"/officers/{officer.officer_id}", json={
+        **body, "start_date": "2024-01-01T00:00:00", "end_date": "2024-06-01T00:00:00"})
+    client.post("/officers/", json={**body, "start_date": "2024-06-01T00:00:00"})
+
+    march = client.get("/officers/", params={"as_of": "2024-03-01T00:00:00"}).json()
+    assert [o["officer_id"] for o in march] == [officer.officer_id]
+    current = client.get(f"/officers/role/{officer.role_id}", params={"current": True}).json()
+    assert [o["end_date"] for o in current] == [None]
+    assert client.get("/officers/", params={"as_of": "2023-01-01T00:00:00"}).json() == []
+    r = client.get("/officers/", params={"as_of": "2024-03-01T00:00:00", "current": True})
+    assert r.status_code == 400
+
+def test_memberships_start_now_by_default(client, db_session, officer):
+    row = {"user_id": officer.user_id, "end_date": "2099-01-01T00:00:00"}
+    r = client.post("/memberships/", json=row)
+    assert r.status_code == 201
+    assert datetime.fromisoformat(r.json()["start_date"]) <= datetime.utcnow()
+
+    r = client.post("/memberships/batch", json=[row])
+    assert r.json()["detail"][0]["detail"].startswith("Overlaps existing membership")
+
+    other = models.User(email="new@uh.edu", password_hash="x", first_name="N", last_name="U",
+                        signup_date=datetime(2024, 1, 1))
+    db_session.add(other)
+    db_session.commit()
+    r = client.post("/memberships/batch", json=[{**row, "user_id": other.user_id}])
+    assert r.status_code == 201
+    assert datetime.fromisoformat(r.json()[0]["start_date"]) <= datetime.utcnow()
@@ -0,0 +1,236 @@
+"""
+Query-plan regression tests.
+
+Each case calls a list or lookup route, records every SELECT it issues and
+runs it through ``EXPLAIN QUERY PLAN`` on the SQLite test engine. A case
+fails if a plan reads a large table (see ``TABLE_ROWS``) with a full scan,
+or sorts one in a temporary b-tree, unless the case allows it.
+
+Set ``EXPLAIN_MYSQL_URL`` (e.g. ``mysql+pymysql://user:pw@localhost/boochi``,
+a database with the current schema) to also run every recorded statement
+through MySQL ``EXPLAIN``.
+"""
+
+import os
+import re
+from typing import List, NamedTuple, Tuple
+
+import pytest
+from datetime import datetime
+from sqlalchemy import create_engine, event
+
+from app import models
+from .conftest import engine
+
+# rough production sizes after a few years; the other tables hold tens
+# of rows, where a scan is as cheap as an index
+TABLE_ROWS = {
+    "users": 20_000,
+    "memberships": 40_000,
+    "events": 5_000,
+    "event_attendees": 200_000,
+    "user_engagement": 100_000,
+    "matches": 5_000,
+    "media": 10_000,
+    "team_memberships": 5_000,
+    "team_standings": 2_000,
+}
+SCAN_THRESHOLD = 1_000
+
+LARGE = {table for table, rows in TABLE_ROWS.items() if rows > SCAN_THRESHOLD}
+
+
+class Case(NamedTuple):
+    path: str
+    # large tables this route may read end to end (paged listings, reports)
+    scans: Tuple[str, ...] = ()
+    # large tables it may scan and then sort in a temporary b-tree
+    sorts: Tuple[str, ...] = ()
+
+
+CASES = [
+    # paged listings walk the table in primary key order, LIMIT rows at most
+    Case("/users/", scans=("users",)),
+    Case("/users/{user_id}"),
+    Case("/users/email/coach@uh.edu"),
+    Case("/users/leaderboard"),
+    Case("/users/leaderboard?term_id={term_id}"),
+    Case("/users/{user_id}/profile"),
+    Case("/events/", scans=("events",)),
+    Case("/events/{event_id}"),
+    Case("/events/upcoming"),
+    # most events are past: newest first walks the date index and stops at LIMIT
+    Case("/events/past", scans=("events",)),
+    Case("/events/?term_id={term_id}"),
+    Case("/events/officer/{officer_id}"),
+    Case("/events/free-slots?location=student%20center&from=2024-09-01T08:00:00&to=2024-09-02T00:00:00"),
+    Case("/events/{event_id}/occurrences?from=2024-09-01T00:00:00&to=2024-12-01T00:00:00"),
+    Case("/event-attendees/", scans=("event_attendees",)),
+    Case("/event-attendees/event/{event_id}"),
+    Case("/event-attendees/user/{user_id}"),
+    Case("/matches/", scans=("matches",)),
+    Case("/matches/{match_id}"),
+    Case("/matches/upcoming"),
+    Case("/matches/past"),
+    Case("/matches/?term_id={term_id}"),
+    Case("/matches/team/{team_id}"),
+    Case("/matches/opponent/{opponent_id}"),
+    Case("/matches/game/{game_id}"),
+    # sweeps every team's schedule in (team_id, date_time) order
+    Case("/matches/conflicts", scans=("matches",)),
+    Case("/matches/conflicts?team_id={team_id}"),
+    Case("/opponents/{opponent_id}/head-to-head"),
+    Case("/memberships/", scans=("memberships",)),
+    Case("/memberships/{membership_id}"),
+    Case("/memberships/user/{user_id}"),
+    Case("/memberships/?term_id={term_id}"),
+    Case("/memberships/?current=true"),
+    Case("/team-memberships/team/{team_id}"),
+    Case("/team-memberships/membership/{membership_id}"),
+    Case("/teams/{team_id}/roster"),
+    Case("/teams/standings"),
+    Case("/games/{game_id}/standings"),
+    Case("/games/{game_id}/dashboard"),
+    Case("/academic-terms/{term_id}/summary"),
+    Case("/shirt-sizes/report?term_id={term_id}"),
+    Case("/calendar/teams/{team_id}.ics"),
+    Case("/calendar/games/{game_id}.ics"),
+]
+
+
+@pytest.fixture
+def ids(db_session, team_and_opponent, officer, make_event):
+    team, opponent = team_and_opponent
+    term = models.AcademicTerm(semester="Fall 2024", start_date=datetime(2024, 8, 1),
+                               end_date=datetime(2024, 12, 15))
+    size = models.ShirtSize(size_name="M")
+    db_session.add_all([term, size])
+    db_session.flush()
+    membership = models.Membership(user_id=officer.user_id, shirt_size_id=size.size_id,
+                                   start_date=datetime(2024, 8, 1), end_date=datetime(2025, 5, 1))
+    match = models.Match(team_id=team.team_id, opponent_id=opponent.opponent_id,
+                         game_id=team.game_id, date_time=datetime(2024, 10, 1),
+                         end_time=datetime(2024, 10, 1, 1), result="win")
+    db_session.add_all([membership, match])
+    db_session.flush()
+    db_session.add(models.TeamMembership(team_id=team.team_id, membership_id=membership.membership_id,
+                                         start_date=datetime(2024, 8, 1)))
+    db_session.commit()
+
+    event = make_event("Kickoff", datetime(2024, 9, 1, 17))
+    db_session.add(models.EventAttendee(event_id=event.event_id, user_id=officer.user_id))
+    db_session.commit()
+    return {
+        "user_id": officer.user_id, "officer_id": officer.officer_id, "term_id": term.term_id,
+        "event_id": event.event_id, "match_id": match.match_id, "team_id": team.team_id,
+        "opponent_id": opponent.opponent_id, "game_id": team.game_id,
+        "membership_id": membership.membership_id,
+    }
+
+
+def record(client, path: str) -> List[tuple]:
+    """
+    Call ``path``; return every SELECT it issued as ``(statement, params,
+    clause, clause_params)``, keeping the clause to recompile for MySQL.
+    """
+    statements, current = [], [None, None]
+
+    def before_execute(conn, clause, multiparams, params, execution_options):
+        current[:] = [clause, multiparams[0] if multiparams else params]
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters, *current))
+
+    event.listen(engine, "before_execute", before_execute)
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        response = client.get(path)
+    finally:
+        event.remove(engine, "before_execute", before_execute)
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    assert response.status_code == 200, (path, response.text)
+    return statements
+
+
+# --------------------------------------------------------------------------
+# Plan checks
+# --------------------------------------------------------------------------
+# SCAN reads every row, in table or index order; SEARCH probes an index
+SQLITE_ACCESS = re.compile(r"^(SCAN|SEARCH) (\w+)")
+# "RIGHT PART OF ORDER BY" reads rows in index order and only sorts ties
+SQLITE_SORT = re.compile(r"USE TEMP B-TREE FOR (?:ORDER BY|GROUP BY|DISTINCT)")
+
+
+def sqlite_problems(conn, statement: str, params, case: Case) -> List[str]:
+    plan = [row[3] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, params)]
+    scanned, problems = set(), []
+    for detail in plan:
+        access = SQLITE_ACCESS.match(detail)
+        if not access:
+            continue
+        verb, table = access.groups()
+        if verb == "SCAN" and table in LARGE:
+            scanned.add(table)
+            if table not in case.scans:
+                problems.append(f"full scan of {table}: {detail}")
+    # sorting the rows an index search found is bounded; sorting a whole
+    # large table is not. The plan doesn't say which table a temp b-tree
+    # sorts, so blame every large table the statement scans.
+    unsorted = scanned - set(case.sorts)
+    if unsorted:
+        problems += [
+            f"temporary sort over {', '.join(sorted(unsorted))}: {detail}"
+            for detail in plan if SQLITE_SORT.search(detail)
+        ]
+    return problems
+
+
+def mysql_problems(conn, clause, params, case: Case) -> List[str]:
+    if params:
+        clause = clause.params(params)
+    compiled = clause.compile(dialect=conn.dialect, compile_kwargs={"render_postcompile": True})
+    problems = []
+    values = compiled.construct_params()
+    if compiled.positional:
+        values = tuple(values[name] for name in compiled.positiontup)
+    explain = conn.exec_driver_sql("EXPLAIN " + str(compiled), values)
+    for row in explain.mappings():
+        table, extra = row["table"], row["Extra"] or ""
+        if table not in LARGE:
+            continue
+        # ALL is a full table scan, index a full index scan
+        if row["type"] in ("ALL", "index") and table not in case.scans:
+            problems.append(f"full scan of {table}")
+        if row["type"] in ("ALL", "index") and table not in case.sorts and (
+            "Using filesort" in extra or "Using temporary" in extra
+        ):
+            problems.append(f"temporary sort over {table}: {extra}")
+    return problems
+
+
+@pytest.fixture(scope="module")
+def mysql_engine():
+    url = os.getenv("EXPLAIN_MYSQL_URL")
+    if not url:
+        yield None
+        return
+    mysql = create_engine(url)
+    yield mysql
+    mysql.dispose()
+
+
+@pytest.mark.parametrize("case", CASES, ids=[case.path for case in CASES])
+def test_route_uses_indexes(client, db_session, ids, mysql_engine, case):
+    statements = record(client, case.path.format(**ids))
+    assert statements, "route issued no queries"
+
+    conn = db_session.connection()
+    problems = []
+    for statement, params, _, _ in statements:
+        problems += [f"{p}\n    {statement}" for p in sqlite_problems(conn, statement, params, case)]
+    if mysql_engine is not None:
+        with mysql_engine.connect() as mysql:
+            for statement, _, clause, params in statements:
+                problems += [f"[mysql] {p}\n    {statement}" for p in mysql_problems(mysql, clause, params, case)]
+    assert not problems, "\n".join(problems)
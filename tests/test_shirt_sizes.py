@@ -0,0 +1,61 @@
+from datetime import datetime
+
+from app import cache, models
+
+
+def test_size_report(client, db_session):
+    term = models.AcademicTerm(semester="Fall 2024", start_date=datetime(2024, 8, 1),
+                               end_date=datetime(2024, 12, 15))
+    sizes = {s: models.ShirtSize(size_name=s) for s in models.ShirtSizeEnum}
+    users = [models.User(email=f"u{i}@uh.edu", password_hash="x", first_name="U", last_name=str(i),
+                         signup_date=datetime(2024, 1, 1)) for i in range(4)]
+    db_session.add_all([term, *sizes.values(), *users])
+    db_session.flush()
+    spans = [(models.ShirtSizeEnum.M, 2024), (models.ShirtSizeEnum.M, 2024),
+             (models.ShirtSizeEnum.XL, 2024), (models.ShirtSizeEnum.S, 2023)]
+    db_session.add_all([
+        models.Membership(user_id=u.user_id, shirt_size_id=sizes[size].size_id,
+                          start_date=datetime(year, 1, 1), end_date=datetime(year, 12, 31))
+        for u, (size, year) in zip(users, spans)
+    ])
+    db_session.commit()
+
+    report = client.get("/shirt-sizes/report", params={"term_id": term.term_id}).json()
+    counts = {s["size_name"]: s["count"] for s in report["sizes"]}
+    assert (report["total"], counts["M"], counts["XL"], counts["S"]) == (3, 2, 1, 0)
+    assert cache.get_cache("shirt_sizes.report").entry_count() == 1     # term is closed
+
+    r = client.get("/shirt-sizes/report.csv", params={"term_id": term.term_id})
+    assert r.headers["content-type"].startswith("text/csv")
+    assert "M,2" in r.text.splitlines() and r.text.splitlines()[-1] == "total,3"
+
+    # a back-dated membership reaches the cached report of the closed term
+    db_session.add(models.Membership(user_id=users[3].user_id, shirt_size_id=sizes[models.ShirtSizeEnum.S].size_id,
+                                     start_date=datetime(2024, 9, 1), end_date=datetime(2025, 5, 1)))
+    db_session.commit()
+    report = client.get("/shirt-sizes/report", params={"term_id": term.term_id}).json()
+    assert report["total"] == 4
+
+    assert client.get("/shirt-sizes/report", params={"term_id": 999}).status_code == 404
+
+def test_term_membership_counts_agree(client, db_session):
+    term = models.AcademicTerm(semester="Fall 2024", start_date=datetime(2024, 8, 1),
+                               end_date=datetime(2024, 12, 15))
+    size = models.ShirtSize(size_name=models.ShirtSizeEnum.M)
+    users = [models.User(email=f"u{i}@uh.edu", password_hash="x", first_name="U", last_name=str(i),
+                         signup_date=datetime(2024, 1, 1)) for i in range(3)]
+    db_session.add_all([term, size, *users])
+    db_session.flush()
+    # ends as the term starts; starts as it ends; inside it
+    spans = [(datetime(2024, 1, 1), datetime(2024, 8, 1)), (datetime(2024, 12, 15), datetime(2025, 5, 1)),
+             (datetime(2024, 9, 1), datetime(2025, 5, 1))]
+    db_session.add_all([
+        models.Membership(user_id=u.user_id, shirt_size_id=size.size_id, start_date=start, end_date=end)
+        for u, (start, end) in zip(users, spans)
+    ])
+    db_session.commit()
+
+    listed = client.get("/memberships/", params={"term_id": term.term_id}).json()
+    report = client.get("/shirt-sizes/report", params={"term_id": term.term_id}).json()
+    summary = client.get(f"/academic-terms/{term.term_id}/summary").json()
+    assert len(listed) == report["total"] == summary["active_memberships"] == 1
@@ -0,0 +1,68 @@
+from datetime import datetime
+
+from app import models, standings
+
+
+def test_outcome_parsing():
+    assert standings.outcome("Win") == "W"
+    assert standings.outcome("lose") == "L"
+    assert standings.outcome("13 - 11") == "W"
+    assert standings.outcome("tbd") is None
+
+def test_standings_follow_match_writes(client, db_session, team_and_opponent, match_payload):
+    team, opponent = team_and_opponent
+    db_session.add(models.AcademicTerm(semester="Fall 2024", start_date=datetime(2024, 8, 1),
+                                       end_date=datetime(2024, 12, 15)))
+    db_session.commit()
+
+    client.post("/matches/", json=match_payload(team, opponent, 1, "win"))
+    client.post("/matches/", json=match_payload(team, opponent, 3, "win"))
+    loss = client.post("/matches/", json=match_payload(team, opponent, 5, "loss")).json()
+
+    [row] = client.get("/teams/standings").json()
+    assert (row["wins"], row["losses"], row["streak"], row["last_results"]) == (2, 1, -1, "WWL")
+
+    # back-dated edit: the loss becomes a win
+    client.put(f"/matches/{loss['match_id']}", json=match_payload(team, opponent, 5, "win"))
+    [row] = client.get(f"/games/{team.game_id}/standings").json()
+    assert (row["wins"], row["losses"], row["streak"]) == (3, 0, 3)
+
+    client.delete(f"/matches/{loss['match_id']}")
+    term_id = db_session.query(models.AcademicTerm.term_id).scalar()
+    [row] = client.get("/teams/standings", params={"term_id": term_id}).json()
+    assert (row["wins"], row["losses"], row["last_results"]) == (2, 0, "WW")
+
+def test_rebuild_matches_incremental(client, team_and_opponent, match_payload):
+    team, opponent = team_and_opponent
+    for day, result in [(1, "win"), (2, "loss"), (3, "loss")]:
+        client.post("/matches/", json=match_payload(team, opponent, day, result))
+    before = client.get("/teams/standings").json()
+    assert client.post("/_internal/standings/rebuild").json() == {"rows": 1}
+    assert client.get("/teams/standings").json() == before
+
+def test_boundary_match_counts_in_one_term(client, db_session, team_and_opponent, match_payload):
+    team, opponent = team_and_opponent
+    first = models.AcademicTerm(semester="Fall A", start_date=datetime(2024, 8, 1),
+                                end_date=datetime(2024, 10, 1))
+    second = models.AcademicTerm(semester="Fall B", start_date=datetime(2024, 10, 1),
+                                 end_date=datetime(2024, 12, 15))
+    db_session.add_all([first, second])
+    db_session.commit()
+    client.post("/matches/", json={**match_payload(team, opponent, 1, "win"),
+                                   "date_time": datetime(2024, 10, 1).isoformat()})
+
+    def rows():
+        return sorted((s.term_id, s.wins) for s in db_session.query(models.TeamStanding))
+    live = rows()
+    assert live == [(0, 1), (second.term_id, 1)]
+    client.post("/_internal/standings/rebuild")
+    assert rows() == live
+
+    # a term that's gone takes its standing with it instead of getting all-time totals
+    standings.recompute(db_session, team.team_id, 999)
+    db_session.add(models.TeamStanding(team_id=team.team_id, term_id=first.term_id, game_id=team.game_id,
+                                       wins=5, losses=0))
+    db_session.delete(first)
+    db_session.flush()
+    standings.recompute(db_session, team.team_id, first.term_id)
+    assert rows() == live
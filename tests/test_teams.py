@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta
+
+from app import models
+
+
+def test_roster(client, db_session, team_and_opponent):
+    team, _ = team_and_opponent
+    now = datetime.utcnow()
+    size = models.ShirtSize(size_name=models.ShirtSizeEnum.M)
+    players = [models.User(email=f"p{i}@uh.edu", password_hash="x", first_name=f"P{i}",
+                           last_name=name, signup_date=now) for i, name in enumerate(["Ng", "Ali"])]
+    db_session.add_all([size, *players])
+    db_session.flush()
+    memberships = [models.Membership(user_id=p.user_id, start_date=now - timedelta(days=30),
+                                     end_date=now + timedelta(days=90), shirt_size_id=size.size_id)
+                   for p in players]
+    db_session.add_all(memberships)
+    db_session.flush()
+    db_session.add_all([
+        models.TeamMembership(team_id=team.team_id, membership_id=memberships[0].membership_id,
+                              start_date=now - timedelta(days=7), player_image=b"\x89PNG\r\n\x1a\nxx"),
+        models.TeamMembership(team_id=team.team_id, membership_id=memberships[1].membership_id,
+                              start_date=now - timedelta(days=20), end_date=now - timedelta(days=1)),
+    ])
+    db_session.commit()
+
+    [player] = client.get(f"/teams/{team.team_id}/roster").json()
+    assert (player["last_name"], player["shirt_size"]) == ("Ng", "M")
+    image = client.get(player["image_url"])
+    assert image.headers["content-type"] == "image/png"
+
+    roster = client.get(f"/teams/{team.team_id}/roster", params={"active_only": False}).json()
+    assert [(p["last_name"], p["image_url"]) for p in roster][0] == ("Ali", None)
+
+    # on the team already, but their club membership hasn't started
+    signed = models.User(email="p2@uh.edu", password_hash="x", first_name="P2", last_name="Kim",
+                         signup_date=now)
+    db_session.add(signed)
+    db_session.flush()
+    future = models.Membership(user_id=signed.user_id, start_date=now + timedelta(days=10),
+                               end_date=now + timedelta(days=100), shirt_size_id=size.size_id)
+    db_session.add(future)
+    db_session.flush()
+    db_session.add(models.TeamMembership(team_id=team.team_id, membership_id=future.membership_id,
+                                         start_date=now - timedelta(days=1)))
+    db_session.commit()
+    roster = client.get(f"/teams/{team.team_id}/roster").json()
+    assert [p["last_name"] for p in roster] == ["Ng"]
+
+def test_roster_unknown_team(client):
+    assert client.get("/teams/999/roster").status_code == 404
@@ -0,0 +1,64 @@
+from datetime import datetime
+
+from app import cache, models, terms
+
+
+def _terms(db_session):
+    spring = models.AcademicTerm(semester="Spring 2024", start_date=datetime(2024, 1, 10),
+                                 end_date=datetime(2024, 5, 10))
+    fall = models.AcademicTerm(semester="Fall 2024", start_date=datetime(2024, 8, 1),
+                               end_date=datetime(2024, 12, 15))
+    db_session.add_all([spring, fall])
+    db_session.commit()
+    return spring, fall
+
+def test_resolver(client, db_session):
+    spring, fall = _terms(db_session)
+    resolve = lambda at: getattr(terms.resolver.term_for(db_session, at), "semester", None)
+    assert resolve(datetime(2024, 3, 1)) == "Spring 2024"
+    assert resolve(datetime(2024, 12, 14, 23)) == "Fall 2024"
+    # terms are half-open: the end instant is past the term
+    assert resolve(datetime(2024, 12, 15)) is None
+    assert resolve(datetime(2024, 6, 1)) is None
+    assert resolve(datetime(2023, 1, 1)) is None
+
+    # a committed term write reloads the ranges
+    stats = cache.get_cache("academic_terms.resolver").stats
+    misses = stats.misses
+    client.post("/academic-terms/", json={"semester": "Summer 2024", "start_date": "2024-05-20T00:00:00",
+                                          "end_date": "2024-07-31T00:00:00"})
+    assert resolve(datetime(2024, 6, 1)) == "Summer 2024"
+    assert resolve(datetime(2024, 6, 2)) == "Summer 2024"
+    assert stats.misses == misses + 1
+
+def test_term_id_filters(client, db_session, team_and_opponent, match_payload, make_event):
+    team, opponent = team_and_opponent
+    spring, fall = _terms(db_session)
+    client.post("/matches/", json=match_payload(team, opponent, 1))
+    make_event("Spring social", datetime(2024, 3, 1, 17))
+    make_event("Fall social", datetime(2024, 9, 1, 17))
+
+    assert len(client.get("/matches/", params={"term_id": fall.term_id}).json()) == 1
+    assert client.get("/matches/", params={"term_id": spring.term_id}).json() == []
+    events = client.get("/events/", params={"term_id": spring.term_id}).json()
+    assert [e["title"] for e in events] == ["Spring social"]
+    assert client.get("/memberships/", params={"term_id": 999}).status_code == 404
+
+def test_boundary_belongs_to_later_term(client, db_session, team_and_opponent, match_payload):
+    team, opponent = team_and_opponent
+    first = models.AcademicTerm(semester="Fall A", start_date=datetime(2024, 8, 1),
+                                end_date=datetime(2024, 10, 1))
+    second = models.AcademicTerm(semester="Fall B", start_date=datetime(2024, 10, 1),
+                                 end_date=datetime(2024, 12, 15))
+    db_session.add_all([first, second])
+    db_session.commit()
+    # October 1st, midnight: the instant the terms share
+    client.post("/matches/", json={**match_payload(team, opponent, 1, "win"),
+                                   "date_time": datetime(2024, 10, 1).isoformat()})
+
+    assert terms.resolver.term_for(db_session, datetime(2024, 10, 1)).semester == "Fall B"
+    played = {s["semester"]: s["matches_played"] for s in client.get("/academic-terms/summary").json()}
+    assert played == {"Fall A": 0, "Fall B": 1}
+    assert client.get("/matches/", params={"term_id": first.term_id}).json() == []
+    h2h = client.get(f"/opponents/{opponent.opponent_id}/head-to-head").json()
+    assert [t["semester"] for t in h2h["terms"]] == ["Fall B"]
@@ -1,4 +1,6 @@
-from app import schemas
+from datetime import datetime
+
+from app import models, schemas
 
 def test_create_user(client):
     payload = {"email": "ana@uh.edu", "first_name": "Ana", "last_name": "Ng"}
@@ -20,3 +22,60 @@ def test_list_users(client):
     r = client.get("/users/")
     assert r.status_code == 200
     assert len(r.json()) >= 2
+
+def test_leaderboard(client, db_session, officer, make_event):
+    fall = models.AcademicTerm(semester="Fall 2024", start_date=datetime(2024, 8, 1),
+                               end_date=datetime(2024, 12, 15))
+    members = [models.User(email=f"m{i}@uh.edu", password_hash="x", first_name=f"M{i}",
+                           last_name="Ember", signup_date=datetime(2024, 1, 1)) for i in range(3)]
+    db_session.add_all([fall, *members])
+    db_session.commit()
+    spring_event = make_event("Social", datetime(2024, 3, 1, 17))
+    fall_events = [make_event(f"Night {d}", datetime(2024, 9, d, 17)) for d in (1, 2)]
+    for event, attendees in [(spring_event, members[:1]), (fall_events[0], members),
+                             (fall_events[1], members[1:2])]:
+        for m in attendees:
+            client.post("/event-attendees/", json={"event_id": event.event_id, "user_id": m.user_id})
+
+    board = client.get("/users/leaderboard").json()
+    assert [(e["rank"], e["first_name"], e["events_attended"]) for e in board] == [
+        (1, "M0", 2), (1, "M1", 2), (3, "M2", 1)]
+
+    board = client.get("/users/leaderboard", params={"term_id": fall.term_id, "k": 1}).json()
+    assert [(e["first_name"], e["events_attended"]) for e in board] == [("M1", 2)]
+
+    # moving an event into the fall term recounts its attendees
+    client.put(f"/events/{spring_event.event_id}", json={
+        "title": "Social", "description": "", "location": "Student Center",
+        "date_time": "2024-10-01T17:00:00", "end_time": "2024-10-01T19:00:00",
+        "created_by_officer_id": officer.officer_id})
+    board = client.get("/users/leaderboard", params={"term_id": fall.term_id}).json()
+    assert [(e["first_name"], e["events_attended"]) for e in board][:2] == [("M0", 2), ("M1", 2)]
+
+    window = {"start": "2024-09-02T00:00:00", "end": "2024-09-03T00:00:00"}
+    board = client.get("/users/leaderboard", params=window).json()
+    assert [e["first_name"] for e in board] == ["M1"]
+
+def test_profile(client, db_session, officer, make_event):
+    event = make_event("Kickoff", datetime(2024, 9, 1, 17))
+    db_session.add_all([
+        models.Membership(user_id=officer.user_id, start_date=datetime(2024, 8, 1),
+                          end_date=datetime(2025, 5, 1)),
+        models.EventAttendee(event_id=event.event_id, user_id=officer.user_id),
+    ])
+    db_session.commit()
+
+    profile = client.get(f"/users/{officer.user_id}/profile").json()
+    assert "password_hash" not in profile
+    assert len(profile["memberships"]) == 1
+    assert [o["officer_id"] for o in profile["officer_terms"]] == [officer.officer_id]
+    assert [e["title"] for e in profile["events_attended"]] == ["Kickoff"]
+    assert profile["team_memberships"] == [] and profile["coordinator_assignments"] == []
+
+    trimmed = client.get(f"/users/{officer.user_id}/profile",
+                         params={"include": "events_attended"}).json()
+    assert trimmed["memberships"] is None and len(trimmed["events_attended"]) == 1
+
+    r = client.get(f"/users/{officer.user_id}/profile", params={"include": "passwords"})
+    assert r.status_code == 400
+    assert client.get("/users/999/profile").status_code == 404